@@ -481,7 +481,14 @@ function restoreAllPulseCards() {
     var pills = document.querySelectorAll(".pcm-pill");
     pills.forEach(function(p) { p.classList.remove("active"); });
     if (pills.length > 0) pills[0].classList.add("active");
-    document.getElementById("pcm-overlay").classList.add("active");
+    var pcmOv = document.getElementById("pcm-overlay");
+    pcmOv.classList.add("active", "opening");
+    if (!pcmOv._willChangeHooked) {
+      pcmOv._willChangeHooked = true;
+      pcmOv.addEventListener("animationend", function(e) {
+        if (e.animationName === "pcmSlideUp") pcmOv.classList.remove("opening");
+      });
+    }
     document.body.style.overflow = "hidden";
     loadPulseChart();
     startPcmPoll();
@@ -489,7 +496,7 @@ function restoreAllPulseCards() {
   window.openPulseChart = openPulseChart;
 
   function closePulseChart() {
-    document.getElementById("pcm-overlay").classList.remove("active");
+    document.getElementById("pcm-overlay").classList.remove("active", "opening");
     document.body.style.overflow = "";
     stopPcmPoll();
     if (pcmChart) { pcmChart.destroy(); pcmChart = null; }
@@ -4,36 +4,95 @@ Updates config.json with positions/values from exported CSVs.
 """
 
 import csv
+import itertools
 import json
+import os
 import re
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from statistics import median_high
+from typing import Iterable, Iterator, List, Optional
 
 
+# Prefer orjson's C serializer for config load/save (2-5x faster on large
+# holdings/transactions arrays); fall back to stdlib json.
+try:
+    import orjson
+
+    def _loads_config(data: bytes) -> dict:
+        return orjson.loads(data)
+
+    def _dumps_config(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads_config(data: bytes) -> dict:
+        return json.loads(data)
+
+    def _dumps_config(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _write_config(config_path: Path, config: dict) -> None:
+    """Serialize to bytes and swap into place with os.replace — one write
+    syscall, and a crash mid-write can't leave a torn config.json."""
+    config_path = Path(config_path)
+    tmp = config_path.with_suffix(".json.tmp")
+    tmp.write_bytes(_dumps_config(config))
+    os.replace(tmp, config_path)
+
+
+@lru_cache(maxsize=1024)
 def _normalize_header(s: str) -> str:
     return s.strip().lower().replace(" ", "_").replace("-", "_")
 
 
-def _find_column(row: list, *candidates: str) -> Optional[int]:
-    """Return index of first column whose normalized name matches any candidate (exact preferred)."""
-    exact_matches = []
-    for i, cell in enumerate(row):
-        n = _normalize_header(str(cell))
+def _build_header_index(header: list) -> tuple:
+    """Normalize the header once; returns ({name: index}, normalized list).
+
+    First occurrence wins for duplicate column names.
+    """
+    norm = [_normalize_header(str(c)) for c in header]
+    idx = {}
+    for i, n in enumerate(norm):
+        idx.setdefault(n, i)
+    return idx, norm
+
+
+def _find_column(idx: dict, norm: list, *candidates: str) -> Optional[int]:
+    """Return index of the column matching any candidate (exact match preferred).
+
+    Exact matches are O(1) dict lookups; falls back to a substring scan.
+    """
+    for c in candidates:
+        j = idx.get(c)
+        if j is not None:
+            return j
+    # Substring fallback only runs when no candidate matched exactly; blank
+    # header cells are skipped ("" is a substring of every candidate).
+    for i, n in enumerate(norm):
+        if not n:
+            continue
         for c in candidates:
-            if n == c:
-                return i  # exact match wins
             if c in n or n in c:
-                exact_matches.append(i)
-                break
-    return exact_matches[0] if exact_matches else None
+                return i
+    return None
+
+
+# Strips thousands separators and currency symbols, maps accounting-style
+# parens to a leading minus — one translate pass instead of four .replace calls
+_SAFE_FLOAT_TABLE = str.maketrans({",": None, "$": None, "(": "-", ")": None})
 
 
 def _safe_float(s: str) -> float:
-    if s is None or (isinstance(s, str) and not s.strip()):
+    if s is None:
+        return 0.0
+    s = str(s).strip()
+    if not s:
         return 0.0
-    s = str(s).strip().replace(",", "").replace("$", "").replace("(", "-").replace(")", "")
     try:
-        return float(s)
+        return float(s.translate(_SAFE_FLOAT_TABLE))
     except ValueError:
         return 0.0
 
@@ -44,6 +103,7 @@ def _normalize_symbol(s: str) -> str:
     return s.upper() if s else ""
 
 
+@lru_cache(maxsize=256)
 def _asset_class_for_ticker(ticker: str) -> str:
     """Map ticker to asset class (Cash, Gold, Silver, Equities)."""
     t = (ticker or "").upper().rstrip("*")
@@ -56,45 +116,63 @@ def _asset_class_for_ticker(ticker: str) -> str:
     return "Equities"
 
 
-def parse_fidelity_csv(path: Path, account_name_filter: Optional[str] = "Individual") -> List[dict]:
+# Non-position rows Fidelity includes in exports — frozensets for O(1) skips
+_FIDELITY_SKIP_UPPER = frozenset({"CASH", "MARGIN", "TOTAL", "ACCOUNT"})
+_FIDELITY_SKIP_LOWER = frozenset({"pending activity", "pending", "total", "account total"})
+
+# Sources whose blended-account total is a managed blend (vs. real estate)
+_MANAGED_BLEND_SOURCES = frozenset({"stash", "acorns", "acorns_invest", "acorns_later"})
+
+# Every importable source, in the order shown to CLI users
+_VALID_SOURCES = ("fidelity", "stash", "acorns", "acorns_invest", "acorns_later", "fundrise")
+_VALID_SOURCE_SET = frozenset(_VALID_SOURCES)
+
+
+def parse_fidelity_csv(path: Path, account_name_filter: Optional[str] = "Individual") -> Iterator[dict]:
     """
     Parse Fidelity Positions CSV.
-    Returns one row per position/lot (no aggregation). Preserves Margin vs Cash lots as separate rows.
+    Yields one row per position/lot (no aggregation), so the import pipeline
+    never holds the full position list twice. Preserves Margin vs Cash lots as separate rows.
     If account_name_filter is set (default "Individual"), only includes rows where Account Name matches.
     Use account_name_filter=None to import all accounts.
     """
-    rows = []
     with open(path, newline="", encoding="utf-8", errors="replace") as f:
         reader = csv.reader(f)
         header = next(reader, None)
         if not header:
-            return []
-        idx_symbol = _find_column(header, "symbol", "ticker")
-        idx_qty = _find_column(header, "quantity", "qty", "shares")
-        idx_price = _find_column(header, "last_price", "price", "close")
-        idx_value = _find_column(header, "current_value", "value", "market_value")
-        idx_desc = _find_column(header, "description", "security")
-        idx_type = _find_column(header, "type")  # Fidelity: Cash, Margin
-        idx_account_name = _find_column(header, "account_name", "account")
+            return
+        hidx, hnorm = _build_header_index(header)
+        idx_symbol = _find_column(hidx, hnorm, "symbol", "ticker")
+        idx_qty = _find_column(hidx, hnorm, "quantity", "qty", "shares")
+        idx_price = _find_column(hidx, hnorm, "last_price", "price", "close")
+        idx_value = _find_column(hidx, hnorm, "current_value", "value", "market_value")
+        idx_desc = _find_column(hidx, hnorm, "description", "security")
+        idx_type = _find_column(hidx, hnorm, "type")  # Fidelity: Cash, Margin
+        idx_account_name = _find_column(hidx, hnorm, "account_name", "account")
         if idx_symbol is None and idx_value is None:
-            return []
+            return
+        # Hoist loop invariants: the normalized filter key and the max index
+        # of the columns we read never change per row
+        filter_key = _normalize_header(account_name_filter) if account_name_filter else None
+        do_filter = filter_key is not None and idx_account_name is not None
+        indices = [i for i in [idx_symbol, idx_qty, idx_price, idx_value, idx_desc] if i is not None]
+        max_index = max(indices) if indices else None
         for row in reader:
-            indices = [i for i in [idx_symbol, idx_qty, idx_price, idx_value, idx_desc] if i is not None]
-            if not indices or len(row) <= max(indices):
+            if max_index is None or len(row) <= max_index:
                 continue
             # Filter by Account Name (e.g. only "Individual" - skip Stash/Portfolio linked accounts)
-            if account_name_filter and idx_account_name is not None and idx_account_name < len(row):
+            if do_filter and idx_account_name < len(row):
                 acct = (row[idx_account_name] or "").strip()
-                if _normalize_header(acct) != _normalize_header(account_name_filter):
+                if _normalize_header(acct) != filter_key:
                     continue
             symbol = (row[idx_symbol].strip() if idx_symbol is not None and idx_symbol < len(row) else "") or None
-            if not symbol or symbol.upper() in ("CASH", "MARGIN", "TOTAL", "ACCOUNT"):
+            if not symbol or symbol.upper() in _FIDELITY_SKIP_UPPER:
                 continue
             if _normalize_symbol(symbol) == "" or symbol == "**":
                 continue
             # Skip non-ticker rows (Fidelity includes these in exports)
             sym_lower = symbol.lower().strip()
-            if sym_lower in ("pending activity", "pending", "total", "account total"):
+            if sym_lower in _FIDELITY_SKIP_LOWER:
                 continue
             qty = _safe_float(row[idx_qty]) if idx_qty is not None else None
             price = _safe_float(row[idx_price]) if idx_price is not None else None
@@ -104,14 +182,13 @@ def parse_fidelity_csv(path: Path, account_name_filter: Optional[str] = "Individ
             if lot_type:
                 desc = f"{desc} | {lot_type}" if desc else lot_type
             base_sym = symbol.strip().rstrip("*") or symbol
-            rows.append({
+            yield {
                 "symbol": base_sym,
                 "qty": qty if qty else None,
                 "price": price,
                 "value": value,
                 "description": desc,
-            })
-    return rows
+            }
 
 
 def parse_blended_csv(path: Path, source: str) -> List[dict]:
@@ -126,9 +203,10 @@ def parse_blended_csv(path: Path, source: str) -> List[dict]:
         header = next(reader, None)
         if not header:
             return rows
-        idx_symbol = _find_column(header, "symbol", "ticker", "security", "name")
-        idx_qty = _find_column(header, "quantity", "qty", "shares")
-        idx_value = _find_column(header, "value", "balance", "current_value", "market_value", "amount")
+        hidx, hnorm = _build_header_index(header)
+        idx_symbol = _find_column(hidx, hnorm, "symbol", "ticker", "security", "name")
+        idx_qty = _find_column(hidx, hnorm, "quantity", "qty", "shares")
+        idx_value = _find_column(hidx, hnorm, "value", "balance", "current_value", "market_value", "amount")
         for row in reader:
             if not row:
                 continue
@@ -141,7 +219,7 @@ def parse_blended_csv(path: Path, source: str) -> List[dict]:
     return rows
 
 
-def apply_fidelity_import(config: dict, rows: list[dict]) -> int:
+def apply_fidelity_import(config: dict, rows: Iterable[dict]) -> int:
     """
     Replace Fidelity holdings with CSV rows. Each lot (Margin/Cash) stays a separate row.
     Keeps non-Fidelity holdings (if any) unchanged.
@@ -149,15 +227,18 @@ def apply_fidelity_import(config: dict, rows: list[dict]) -> int:
     existing = config.get("holdings", [])
     non_fidelity = [h for h in existing if (h.get("account") or "").strip() != "Fidelity"]
     new_holdings = []
+    append = new_holdings.append  # local bind avoids attribute lookup per row
     for r in rows:
-        if not r.get("symbol") and not r.get("value"):
+        symbol = r.get("symbol")
+        value = r.get("value")
+        if not symbol and not value:
             continue
-        new_holdings.append({
+        append({
             "account": "Fidelity",
-            "ticker": r["symbol"],
-            "asset_class": _asset_class_for_ticker(r["symbol"]),
+            "ticker": symbol,
+            "asset_class": _asset_class_for_ticker(symbol),
             "qty": r.get("qty"),
-            "value_override": round(r["value"], 2) if r.get("value") else None,
+            "value_override": round(value, 2) if value else None,
             "notes": r.get("description", ""),
         })
     config["holdings"] = non_fidelity + new_holdings
@@ -192,7 +273,7 @@ def apply_blended_import(config: dict, rows: list[dict], source: str) -> int:
         config.setdefault("blended_accounts", []).append({
             "name": names[0],
             "value": round(total, 2),
-            "asset_class": "ManagedBlend" if source in ("stash", "acorns", "acorns_invest", "acorns_later") else "RealEstate",
+            "asset_class": "ManagedBlend" if source in _MANAGED_BLEND_SOURCES else "RealEstate",
         })
         updated = 1
     return updated
@@ -205,20 +286,22 @@ def import_csv(config_path: Path, csv_path: Path, source: str) -> tuple[int, str
     Returns (rows_updated, message).
     """
     source = source.lower().strip()
-    if source not in ("fidelity", "stash", "acorns", "acorns_invest", "acorns_later", "fundrise"):
+    if source not in _VALID_SOURCE_SET:
         return 0, f"Unknown source: {source}. Use fidelity, stash, acorns, acorns_invest, acorns_later, or fundrise."
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        config = json.load(f)
+    config = _loads_config(Path(config_path).read_bytes())
 
     # Preserve crypto_holdings — CSV import only updates holdings/blended_accounts
     crypto_holdings = config.get("crypto_holdings", [])
 
     if source == "fidelity":
         rows = parse_fidelity_csv(csv_path)
-        if not rows:
+        # Generator: peek the first row to report an empty parse without
+        # materializing the rest
+        first = next(rows, None)
+        if first is None:
             return 0, "No Fidelity positions found in CSV. Check column headers (Symbol, Quantity, Current Value)."
-        updated = apply_fidelity_import(config, rows)
+        updated = apply_fidelity_import(config, itertools.chain([first], rows))
     else:
         rows = parse_blended_csv(csv_path, source)
         if not rows:
@@ -226,14 +309,135 @@ def import_csv(config_path: Path, csv_path: Path, source: str) -> tuple[int, str
         updated = apply_blended_import(config, rows, source)
 
     config["crypto_holdings"] = crypto_holdings
-    with open(config_path, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2)
+    _write_config(config_path, config)
 
     return updated, f"Updated {updated} position(s) from {source} CSV. Run the dashboard update to refresh."
 
 
 # ── Bank/Credit Card Statement Import ──
 
+# Compiled once at import — these run per line/cell in the statement parsers.
+_DATE_ISO_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_DATE_MDY4_RE = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})$")
+_DATE_MDY2_RE = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{2})$")
+_DATE_MDY4_DASH_RE = re.compile(r"^(\d{1,2})-(\d{1,2})-(\d{4})$")
+_DATE_MONTH_NAME_RE = re.compile(r"^([A-Za-z]+)\s+(\d{1,2}),?\s*(\d{4})?$")
+
+# Apple Card transaction line: date, description, daily cash %, daily cash $, amount $
+# e.g. "01/01/2026 OPENAI *CHATGPT SUBSCR1455 3rd Street SAN FRANCISCO94158 CA USA 1% $0.20 $20.00"
+_APPLE_TXN_RE = re.compile(r"^(\d{2}/\d{2}/\d{4})\s+(.+?)\s+\d+%\s+\$[\d,.]+\s+\$([\d,.]+)$")
+# Address/location cruft after the merchant name: either a "ZIP ST USA" tail,
+# or (only when the description is already past 60 chars — fixed-width
+# lookbehind) a street-address tail. One pass replaces the old two-sub chain.
+_APPLE_DESC_CLEAN_RE = re.compile(r"\s+\d{4,5}\s+[A-Z]{2}\s+USA\s*$|(?<=.{60})\s+\d+\s+\w+.*$")
+
+# Coinbase One Card: "Dec 22, 2025  DESCRIPTION  $XX.XX" (amount may be absent)
+_COINBASE_TXN_RE = re.compile(
+    r"^((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},?\s*\d{4})\s+(.+?)\s+(-?\$[\d,]+\.\d{2})$"
+)
+_COINBASE_DATE_ONLY_RE = re.compile(
+    r"^((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},?\s*\d{4})\s+(.+)$"
+)
+_COINBASE_REF_TAIL_RE = re.compile(r"\s+\d{5}\s+\d{3}\s+\d{3}$")
+
+_GOLDEN1_DATE_RE = re.compile(r"^(\d{2}/\d{2}/\d{4})")
+_GOLDEN1_DATE2_RE = re.compile(r"^(\d{2}/\d{2}/\d{4})\s*")
+_GENERIC_DATE_RE = re.compile(r"^(\d{1,2}[/\-]\d{1,2}(?:[/\-]\d{2,4})?)")
+
+def _keyword_re(keywords) -> "re.Pattern":
+    """Compile a keyword list into one alternation — a single C-level scan
+    replaces N Python-level `kw in desc` checks per row."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Non-transaction entries (card payments, rewards) skipped on CSV/generic import
+_STATEMENT_SKIP_RE = _keyword_re([
+    "payment thank you", "autopay", "online payment",
+    "cashback", "rewards redemption", "balance transfer",
+])
+# Incoming money markers shared by the CSV and generic-PDF paths
+_STATEMENT_INCOME_RE = _keyword_re([
+    "direct deposit", "payroll", "salary", "wages",
+    "deposit", "refund", "credit adjustment", "merchant credit",
+    "interest earned", "dividend", "tax refund", "reimbursement",
+])
+_APPLE_SKIP_RE = _keyword_re([
+    "ach deposit", "payment", "autopay", "refund", "credit adjustment",
+])
+_COINBASE_SKIP_RE = _keyword_re([
+    "ach payment", "autopay", "refund", "credit adjustment",
+])
+# Coinbase statement chrome: headers/footers around the transaction table,
+# and lines that interrupt a description continuation
+_COINBASE_CHROME_RE = _keyword_re([
+    "page ", "coinbase one card", "curtis", "crb1898", "date description",
+])
+_COINBASE_CONT_SKIP_RE = _keyword_re([
+    "page ", "coinbase", "curtis", "crb1898", "total",
+])
+# Golden 1: skip balances/summaries and credit card payments (spending is on
+# the CC statement); income keywords flag deposits for negative amounts
+_GOLDEN1_SKIP_RE = _keyword_re([
+    "beginning balance", "ending balance", "account summary",
+    "applecard", "apple card", "gsbank", "coinbase card",
+    "crcardpmt", "credit card",
+])
+_GOLDEN1_INCOME_RE = _keyword_re([
+    "direct deposit", "payroll", "salary", "wages",
+    "checking deposit", "mobile deposit", "atm deposit", "cash deposit",
+    "ach deposit", "ach credit", "ach p2p credit",
+    "zelle dep", "zelle credit", "zelle from", "zelle money received",
+    "venmo cashout", "venmo credit",
+    "interest earned", "interest paid", "dividend",
+    "refund", "credit adjustment", "merchant credit",
+    "from ach", "nowrtp", "moneyline", "ach p2p",
+    "tax refund", "reimbursement",
+])
+# Section headers inside a transaction's continuation lines all start with
+# one of these; startswith(tuple) is a single C-level pass with early exit.
+_GOLDEN1_HEADER_PREFIXES = ("account activity", "account number", "account summary", "page ")
+
+_AMOUNT_RE = re.compile(r"-?([\d,]+\.\d{2})")
+_DOLLAR_AMOUNT_RE = re.compile(r"-?\$?[\d,]+\.\d{2}")
+_PAREN_TAIL_RE = re.compile(r"\s*\([^)]*\)\s*$")
+_MULTISPACE_RE = re.compile(r"\s{2,}")
+
+# Merchant-description normalization (recurring-transaction detection):
+# strip a trailing reference number or a trailing date (plus anything after
+# it) in one anchored pass
+_NORMALIZE_TRAIL_RE = re.compile(r"(?:\s*#?\d{4,}|\s*\d{1,2}/\d{1,2}.*)$")
+_WS_RE = re.compile(r"\s+")
+
+
+def _split_amounts(s: str) -> tuple:
+    """Pull amount tokens out of a statement line in a single regex pass.
+
+    Returns (amounts, residue): the _AMOUNT_RE captures in order, and the
+    line text with those tokens removed. Replaces a findall + sub pair that
+    scanned the same string twice per continuation line.
+    """
+    amounts = []
+    parts = []
+    last = 0
+    for m in _AMOUNT_RE.finditer(s):
+        amounts.append(m.group(1))
+        parts.append(s[last:m.start()])
+        last = m.end()
+    if not amounts:
+        return amounts, s
+    parts.append(s[last:])
+    return amounts, "".join(parts)
+
+
+def _month_lookup() -> dict:
+    import calendar
+    names = {name.lower(): i for i, name in enumerate(calendar.month_name) if name}
+    abbrs = {name.lower(): i for i, name in enumerate(calendar.month_abbr) if name}
+    return {**names, **abbrs}
+
+
+_MONTH_LOOKUP = _month_lookup()
+
 # Default keyword-to-category mapping for auto-categorization.
 # IMPORTANT: Categories here should match the user's budget categories.
 # The function also supports a fallback mapping for categories that
@@ -318,136 +522,194 @@ DEFAULT_CATEGORY_RULES = {
 }
 
 
+def _compile_category_rules(rules: dict):
+    """Compile keyword rules into one alternation regex + group→category map.
+
+    One C-level scan of the description replaces hundreds of Python-level
+    `kw in desc` checks. At a given position, earlier categories win (regex
+    alternation order follows dict order).
+    """
+    group_to_category = {}
+    parts = []
+    for i, (category, keywords) in enumerate(rules.items()):
+        name = f"g{i}"
+        group_to_category[name] = category
+        parts.append("(?P<%s>%s)" % (name, "|".join(map(re.escape, keywords))))
+    return re.compile("|".join(parts)), group_to_category
+
+
+_CATEGORY_RE, _CATEGORY_GROUPS = _compile_category_rules(DEFAULT_CATEGORY_RULES)
+
+
+def _flatten_rules(rules: dict) -> tuple:
+    """Invert {category: [keywords]} into a flat (keyword, category) tuple,
+    longest keyword first so more specific matches win."""
+    return tuple(sorted(
+        ((kw, cat) for cat, kws in rules.items() for kw in kws),
+        key=lambda x: -len(x[0]),
+    ))
+
+
+# Memo of the last custom_rules dict seen, so a statement import passing the
+# same dict for every row only pays the flattening cost once
+_custom_rules_memo = (None, ())
+
+
 def categorize_transaction(description: str, custom_rules: dict = None, budget_categories: list = None) -> str:
     """Auto-categorize a transaction description into a budget category.
-    
+
     If budget_categories is provided, ensures the returned category exists
     in the user's budget. Unknown categories are mapped to 'Other'.
     """
-    rules = custom_rules or DEFAULT_CATEGORY_RULES
     desc_lower = (description or "").lower()
-    for category, keywords in rules.items():
-        for kw in keywords:
-            if kw in desc_lower:
-                # If we have budget categories, verify this category exists
-                if budget_categories and category not in budget_categories:
-                    # Try to find closest match
-                    return "Other"
-                return category
+    if custom_rules is None:
+        m = _CATEGORY_RE.search(desc_lower)
+        if not m:
+            return "Other"
+        category = _CATEGORY_GROUPS[m.lastgroup]
+        # If we have budget categories, verify this category exists
+        if budget_categories and category not in budget_categories:
+            return "Other"
+        return category
+    global _custom_rules_memo
+    memo_rules, flat = _custom_rules_memo
+    if memo_rules is not custom_rules:
+        flat = _flatten_rules(custom_rules)
+        _custom_rules_memo = (custom_rules, flat)
+    for kw, category in flat:
+        if kw in desc_lower:
+            if budget_categories and category not in budget_categories:
+                # Try to find closest match
+                return "Other"
+            return category
     return "Other"
 
 
-def parse_statement_csv(path: Path) -> List[dict]:
-    """
-    Parse a bank or credit card statement CSV. Auto-detects column layout.
-    Supports common formats from Chase, Bank of America, Wells Fargo, Capital One,
-    Citi, Discover, USAA, and generic bank exports.
+def _batch_categorize(descriptions: Iterable[str]) -> dict:
+    """Categorize each distinct description once; returns {desc: category}.
 
-    Returns list of {"date": str, "description": str, "amount": float, "category": str}
-    Positive amounts = expenses (debits). Negative amounts are ignored (credits/payments).
+    Statements repeat merchants heavily, so this runs one _CATEGORY_RE
+    search per unique string instead of one per row.
     """
-    transactions = []
-    with open(path, newline="", encoding="utf-8", errors="replace") as f:
-        # Skip BOM and blank lines at top
-        content = f.read().lstrip("\ufeff").strip()
-        if not content:
-            return []
+    return {d: categorize_transaction(d) for d in set(descriptions)}
+
 
-    # Try to find header row (some banks put metadata lines before the header)
-    lines = content.split("\n")
-    header_idx = 0
-    for i, line in enumerate(lines[:10]):
+def _detect_header_row(head: List[str]) -> int:
+    """Find the header row among the first few lines (some banks put metadata
+    lines before it). Falls back to the first non-blank line."""
+    first_nonblank = 0
+    for i, line in enumerate(head):
         lower = line.lower()
         if "date" in lower and ("description" in lower or "memo" in lower or "payee" in lower or "merchant" in lower or "amount" in lower):
-            header_idx = i
-            break
+            return i
+        if not line.strip() and first_nonblank == i:
+            first_nonblank = i + 1
+    return first_nonblank if first_nonblank < len(head) else 0
+
+
+def _parse_statement_csv_pandas(path: Path, header_idx: int) -> Optional[List[dict]]:
+    """Vectorized statement parse via pandas' C tokenizer.
 
-    csv_text = "\n".join(lines[header_idx:])
-    reader = csv.reader(csv_text.strip().split("\n"))
-    header = next(reader, None)
-    if not header:
+    Loads the whole CSV as string columns, then does amount cleanup, lowercasing,
+    and skip/income keyword screening as Series ops instead of per-row Python.
+    Returns None if pandas is unavailable or the layout can't be handled, so the
+    caller can fall back to the csv.reader path.
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        return None
+
+    try:
+        df = pd.read_csv(path, skiprows=header_idx, dtype=str, keep_default_na=False,
+                         engine="c", on_bad_lines="skip",
+                         encoding="utf-8-sig", encoding_errors="replace")
+    except Exception:
+        return None
+    if df.empty:
         return []
 
-    # Detect columns
-    idx_date = _find_column(header, "date", "transaction_date", "posting_date", "trans_date")
-    idx_desc = _find_column(header, "description", "memo", "payee", "merchant", "name", "merchant_name", "original_description")
-    idx_amount = _find_column(header, "amount", "transaction_amount")
-    idx_debit = _find_column(header, "debit", "withdrawals", "charges")
-    idx_credit = _find_column(header, "credit", "deposits", "payments")
-    idx_category = _find_column(header, "category", "type")
+    header = list(df.columns)
+    hidx, hnorm = _build_header_index(header)
+    idx_date = _find_column(hidx, hnorm, "date", "transaction_date", "posting_date", "trans_date")
+    idx_desc = _find_column(hidx, hnorm, "description", "memo", "payee", "merchant", "name", "merchant_name", "original_description")
+    idx_amount = _find_column(hidx, hnorm, "amount", "transaction_amount")
+    idx_debit = _find_column(hidx, hnorm, "debit", "withdrawals", "charges")
+    idx_credit = _find_column(hidx, hnorm, "credit", "deposits", "payments")
+    idx_category = _find_column(hidx, hnorm, "category", "type")
 
     if idx_date is None:
         return []
     if idx_desc is None:
-        # Try using the column next to date
         idx_desc = min(idx_date + 1, len(header) - 1)
 
-    for row in reader:
-        if not row or len(row) <= idx_date:
-            continue
-
-        date_str = (row[idx_date] or "").strip()
-        if not date_str or not any(c.isdigit() for c in date_str):
-            continue
+    def _num(col_idx):
+        s = df.iloc[:, col_idx].str.replace(r"[,$]", "", regex=True)
+        s = s.str.replace("(", "-", regex=False).str.replace(")", "", regex=False)
+        return pd.to_numeric(s, errors="coerce").fillna(0.0)
+
+    dates = df.iloc[:, idx_date].str.strip()
+    descs = df.iloc[:, idx_desc].str.strip()
+
+    # Amount resolution mirrors the row-by-row path: a signed Amount column wins,
+    # then a Debit column, then a positive Credit column (marked as income).
+    if idx_amount is not None:
+        signed = _num(idx_amount)
+        amounts = signed.abs()
+        is_credit = signed < 0
+    elif idx_debit is not None:
+        amounts = _num(idx_debit)
+        is_credit = pd.Series(False, index=df.index)
+    else:
+        amounts = pd.Series(0.0, index=df.index)
+        is_credit = pd.Series(False, index=df.index)
+    if idx_credit is not None:
+        credits = _num(idx_credit)
+        use_credit = (amounts == 0) & (credits > 0)
+        amounts = amounts.mask(use_credit, credits)
+        is_credit = is_credit | use_credit
+
+    desc_lower = descs.str.lower()
+    keep = (
+        dates.str.contains(r"\d", regex=True)
+        & (descs != "")
+        & (amounts != 0)
+        & ~desc_lower.str.contains(_STATEMENT_SKIP_RE.pattern, regex=True)
+    )
+    is_income = is_credit | desc_lower.str.contains(_STATEMENT_INCOME_RE.pattern, regex=True)
+
+    bank_cats = df.iloc[:, idx_category].str.strip() if idx_category is not None else None
+
+    # Materialize the surviving rows as plain lists and zip through them —
+    # scalar Series indexing per row costs more than the loop body itself.
+    # Dates repeat heavily on statements, so normalize each unique value once.
+    kept = keep[keep].index
+    dates_kept = dates[kept]
+    date_map = {u: _normalize_date(u) for u in dates_kept.unique()}
+    bank_cats_kept = bank_cats[kept].tolist() if bank_cats is not None else itertools.repeat("")
+
+    descs_kept = descs[kept].tolist()
+    income_kept = is_income[kept].tolist()
+    # One categorization per unique expense merchant, not per row
+    cat_map = _batch_categorize(
+        d for d, income in zip(descs_kept, income_kept) if not income
+    )
 
-        # Normalize date format
-        date_str = _normalize_date(date_str)
+    transactions = []
+    append = transactions.append
+    for date_raw, desc, amount, income, bank_cat in zip(
+        dates_kept.tolist(), descs_kept, amounts[kept].tolist(),
+        income_kept, bank_cats_kept,
+    ):
+        date_str = date_map[date_raw]
         if not date_str:
             continue
-
-        desc = (row[idx_desc] if idx_desc is not None and idx_desc < len(row) else "").strip()
-        if not desc:
-            continue
-
-        # Determine amount and whether it's a debit or credit
-        amount = 0.0
-        is_credit = False
-        if idx_amount is not None and idx_amount < len(row):
-            amount = _safe_float(row[idx_amount])
-            if amount < 0:
-                is_credit = True
-                amount = abs(amount)
-        elif idx_debit is not None and idx_debit < len(row):
-            amount = _safe_float(row[idx_debit])
-
-        # Check credit column for deposits/income
-        if amount == 0 and idx_credit is not None and idx_credit < len(row):
-            credit = _safe_float(row[idx_credit])
-            if credit > 0:
-                amount = credit
-                is_credit = True
-
-        if amount == 0:
-            continue
-
-        # Skip non-transaction entries
-        desc_lower = desc.lower()
-        skip_keywords = ["payment thank you", "autopay", "online payment",
-                         "cashback", "rewards redemption", "balance transfer"]
-        if any(kw in desc_lower for kw in skip_keywords):
-            continue
-
-        # Determine transaction type
-        income_keywords = [
-            "direct deposit", "payroll", "salary", "wages",
-            "deposit", "refund", "credit adjustment", "merchant credit",
-            "interest earned", "dividend", "tax refund", "reimbursement",
-        ]
-        if is_credit or any(kw in desc_lower for kw in income_keywords):
-            txn_type = "income"
-            txn_amount = -round(amount, 2)
-            category = "Income"
+        amount = round(amount, 2)
+        if income:
+            txn_type, txn_amount, category = "income", -amount, "Income"
         else:
-            txn_type = "expense"
-            txn_amount = round(amount, 2)
-            category = categorize_transaction(desc)
-
-        # Use bank-provided category if available (for expenses only)
-        bank_cat = ""
-        if idx_category is not None and idx_category < len(row):
-            bank_cat = (row[idx_category] or "").strip()
-
-        transactions.append({
+            txn_type, txn_amount, category = "expense", amount, cat_map[desc]
+        append({
             "date": date_str,
             "description": desc,
             "amount": txn_amount,
@@ -455,44 +717,176 @@ def parse_statement_csv(path: Path) -> List[dict]:
             "type": txn_type,
             "bank_category": bank_cat,
         })
+    return transactions
+
+
+def parse_statement_csv(path: Path) -> List[dict]:
+    """
+    Parse a bank or credit card statement CSV. Auto-detects column layout.
+    Supports common formats from Chase, Bank of America, Wells Fargo, Capital One,
+    Citi, Discover, USAA, and generic bank exports.
+
+    Returns list of {"date": str, "description": str, "amount": float, "category": str}
+    Positive amounts = expenses (debits). Negative amounts are ignored (credits/payments).
+    """
+    transactions = []
+
+    # Stream-scan the first few lines to locate the header row instead of
+    # loading/splitting/rejoining the whole file in memory.
+    with open(path, newline="", encoding="utf-8-sig", errors="replace") as f:
+        head = list(itertools.islice(f, 10))
+    if not head:
+        return []
+    header_idx = _detect_header_row(head)
+
+    # Fast path: pandas loads columns via its C tokenizer and we screen rows
+    # with vectorized ops; fall back to row-by-row csv.reader if unavailable.
+    parsed = _parse_statement_csv_pandas(path, header_idx)
+    if parsed is not None:
+        return parsed
+
+    with open(path, newline="", encoding="utf-8-sig", errors="replace") as f:
+        for _ in range(header_idx):
+            next(f)
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return []
+
+        # Detect columns
+        hidx, hnorm = _build_header_index(header)
+        idx_date = _find_column(hidx, hnorm, "date", "transaction_date", "posting_date", "trans_date")
+        idx_desc = _find_column(hidx, hnorm, "description", "memo", "payee", "merchant", "name", "merchant_name", "original_description")
+        idx_amount = _find_column(hidx, hnorm, "amount", "transaction_amount")
+        idx_debit = _find_column(hidx, hnorm, "debit", "withdrawals", "charges")
+        idx_credit = _find_column(hidx, hnorm, "credit", "deposits", "payments")
+        idx_category = _find_column(hidx, hnorm, "category", "type")
+
+        if idx_date is None:
+            return []
+        if idx_desc is None:
+            # Try using the column next to date
+            idx_desc = min(idx_date + 1, len(header) - 1)
+
+        for row in reader:
+            if not row or len(row) <= idx_date:
+                continue
+
+            date_str = (row[idx_date] or "").strip()
+            if not date_str or not any(c.isdigit() for c in date_str):
+                continue
+
+            # Normalize date format
+            date_str = _normalize_date(date_str)
+            if not date_str:
+                continue
+
+            desc = (row[idx_desc] if idx_desc is not None and idx_desc < len(row) else "").strip()
+            if not desc:
+                continue
+
+            # Determine amount and whether it's a debit or credit
+            amount = 0.0
+            is_credit = False
+            if idx_amount is not None and idx_amount < len(row):
+                amount = _safe_float(row[idx_amount])
+                if amount < 0:
+                    is_credit = True
+                    amount = abs(amount)
+            elif idx_debit is not None and idx_debit < len(row):
+                amount = _safe_float(row[idx_debit])
+
+            # Check credit column for deposits/income
+            if amount == 0 and idx_credit is not None and idx_credit < len(row):
+                credit = _safe_float(row[idx_credit])
+                if credit > 0:
+                    amount = credit
+                    is_credit = True
+
+            if amount == 0:
+                continue
+
+            # Skip non-transaction entries
+            desc_lower = desc.lower()
+            if _STATEMENT_SKIP_RE.search(desc_lower):
+                continue
+
+            # Determine transaction type
+            if is_credit or _STATEMENT_INCOME_RE.search(desc_lower):
+                txn_type = "income"
+                txn_amount = -round(amount, 2)
+                category = "Income"
+            else:
+                txn_type = "expense"
+                txn_amount = round(amount, 2)
+                category = categorize_transaction(desc)
+
+            # Use bank-provided category if available (for expenses only)
+            bank_cat = ""
+            if idx_category is not None and idx_category < len(row):
+                bank_cat = (row[idx_category] or "").strip()
+
+            transactions.append({
+                "date": date_str,
+                "description": desc,
+                "amount": txn_amount,
+                "category": category,
+                "type": txn_type,
+                "bank_category": bank_cat,
+            })
 
     return transactions
 
 
-def _extract_pdf_text(path: Path) -> str:
-    """Extract text from PDF. Tries pdfplumber first, falls back to PyPDF2/pypdf."""
-    # Try pdfplumber
+@lru_cache(maxsize=1)
+def _pdf_extractors() -> tuple:
+    """Resolve available PDF text extractors once (pdfplumber preferred,
+    pypdf fallback) instead of retrying the imports on every call."""
+    extractors = []
+
     try:
         import pdfplumber
-        text_parts = []
-        with pdfplumber.open(str(path)) as pdf:
-            for page in pdf.pages:
-                t = page.extract_text()
-                if t:
-                    text_parts.append(t)
-        if text_parts:
+
+        def _plumber(path: Path) -> str:
+            text_parts = []
+            with pdfplumber.open(str(path)) as pdf:
+                for page in pdf.pages:
+                    t = page.extract_text()
+                    if t:
+                        text_parts.append(t)
             return "\n".join(text_parts)
+
+        extractors.append(_plumber)
     except ImportError:
         pass
-    except Exception:
-        pass
 
-    # Try pypdf / PyPDF2
     try:
         from pypdf import PdfReader
-        reader = PdfReader(str(path))
-        text_parts = []
-        for page in reader.pages:
-            t = page.extract_text()
-            if t:
-                text_parts.append(t)
-        if text_parts:
+
+        def _pypdf(path: Path) -> str:
+            text_parts = []
+            for page in PdfReader(str(path)).pages:
+                t = page.extract_text()
+                if t:
+                    text_parts.append(t)
             return "\n".join(text_parts)
+
+        extractors.append(_pypdf)
     except ImportError:
         pass
-    except Exception:
-        pass
 
+    return tuple(extractors)
+
+
+def _extract_pdf_text(path: Path) -> str:
+    """Extract text from PDF. Tries pdfplumber first, falls back to pypdf."""
+    for extract in _pdf_extractors():
+        try:
+            text = extract(path)
+            if text:
+                return text
+        except Exception:
+            continue
     return ""
 
 
@@ -502,35 +896,44 @@ def _normalize_date_text(date_str: str, default_year: int = None) -> str:
     - Jan 15, 2026 / Jan 15 2026
     - 01/15/2026
     """
-    import calendar
     s = date_str.strip().rstrip(",")
 
+    # Cheap shape dispatch for the two overwhelmingly common formats — one
+    # C-level strptime instead of walking the regex chain. Anything odd
+    # (out-of-range fields, 2-digit years, month names) falls through.
+    if len(s) == 10:
+        try:
+            if s[4] == "-":
+                datetime.strptime(s, "%Y-%m-%d")
+                return s
+            if s[2] == "/":
+                return datetime.strptime(s, "%m/%d/%Y").strftime("%Y-%m-%d")
+        except ValueError:
+            pass
+
     # Already normalized
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", s):
+    if _DATE_ISO_RE.match(s):
         return s
 
     # MM/DD/YYYY
-    m = re.match(r"^(\d{1,2})/(\d{1,2})/(\d{4})$", s)
+    m = _DATE_MDY4_RE.match(s)
     if m:
         return f"{m.group(3)}-{int(m.group(1)):02d}-{int(m.group(2)):02d}"
 
     # MM/DD/YY
-    m = re.match(r"^(\d{1,2})/(\d{1,2})/(\d{2})$", s)
+    m = _DATE_MDY2_RE.match(s)
     if m:
         year = int(m.group(3))
         year = year + 2000 if year < 50 else year + 1900
         return f"{year}-{int(m.group(1)):02d}-{int(m.group(2)):02d}"
 
     # "Jan 15, 2026" or "Jan 15 2026" or "January 15, 2026"
-    month_names = {name.lower(): i for i, name in enumerate(calendar.month_name) if name}
-    month_abbrs = {name.lower(): i for i, name in enumerate(calendar.month_abbr) if name}
-    all_months = {**month_names, **month_abbrs}
-    m = re.match(r"^([A-Za-z]+)\s+(\d{1,2}),?\s*(\d{4})?$", s)
+    m = _DATE_MONTH_NAME_RE.match(s)
     if m:
         month_str = m.group(1).lower()
         day = int(m.group(2))
         year = int(m.group(3)) if m.group(3) else default_year or 2026
-        month_num = all_months.get(month_str)
+        month_num = _MONTH_LOOKUP.get(month_str)
         if month_num:
             return f"{year}-{month_num:02d}-{day:02d}"
 
@@ -547,33 +950,31 @@ def parse_statement_pdf(path: Path) -> List[dict]:
     if not text:
         return []
 
-    # Detect statement type and delegate
+    # Detect statement type and delegate. Parsers consume a lazy line iterator
+    # (io.StringIO) rather than a second full list from text.split("\n").
+    import io
     text_lower = text.lower()
+    lines = io.StringIO(text)
     if "apple card" in text_lower or "daily cash" in text_lower:
-        return _parse_apple_card_pdf(text)
+        return _parse_apple_card_pdf(lines)
     elif "coinbase" in text_lower and ("coinbase one card" in text_lower or "cardless" in text_lower):
-        return _parse_coinbase_card_pdf(text)
+        return _parse_coinbase_card_pdf(lines)
     elif "golden 1" in text_lower or "golden1" in text_lower:
-        return _parse_golden1_pdf(text)
+        return _parse_golden1_pdf(lines)
     else:
-        return _parse_generic_pdf(text)
+        return _parse_generic_pdf(lines)
 
 
-def _parse_apple_card_pdf(text: str) -> List[dict]:
-    """Parse Apple Card statement PDF text.
+def _parse_apple_card_pdf(lines) -> List[dict]:
+    """Parse Apple Card statement PDF text (iterable of lines).
     Format: MM/DD/YYYY DESCRIPTION LOCATION 1% $X.XX $XX.XX
     The last dollar amount on the line is the transaction amount.
     """
     transactions = []
-    skip_keywords = ["ach deposit", "payment", "autopay", "refund", "credit adjustment"]
-
-    # Apple Card transaction pattern: date, description, daily cash %, daily cash $, amount $
-    # e.g. "01/01/2026 OPENAI *CHATGPT SUBSCR1455 3rd Street SAN FRANCISCO94158 CA USA 1% $0.20 $20.00"
-    pattern = re.compile(r"^(\d{2}/\d{2}/\d{4})\s+(.+?)\s+\d+%\s+\$[\d,.]+\s+\$([\d,.]+)$")
 
-    for line in text.split("\n"):
+    for line in lines:
         line = line.strip()
-        m = pattern.match(line)
+        m = _APPLE_TXN_RE.match(line)
         if not m:
             continue
 
@@ -586,16 +987,12 @@ def _parse_apple_card_pdf(text: str) -> List[dict]:
         if amount <= 0:
             continue
 
-        # Clean up description: remove address/location cruft
-        # Truncate at common location patterns
-        desc_clean = re.sub(r'\s+\d{4,5}\s+[A-Z]{2}\s+USA$', '', desc)
-        desc_clean = re.sub(r'\s+\d+\s+\w+.*$', '', desc_clean) if len(desc_clean) > 60 else desc_clean
-        # Keep first ~60 chars for readability
-        if len(desc_clean) > 60:
-            desc_clean = desc_clean[:60].strip()
+        # Clean up description: remove address/location cruft, then keep
+        # first ~60 chars for readability
+        desc_clean = _APPLE_DESC_CLEAN_RE.sub('', desc)[:60].strip()
 
         desc_lower = desc.lower()
-        if any(kw in desc_lower for kw in skip_keywords):
+        if _APPLE_SKIP_RE.search(desc_lower):
             continue
 
         transactions.append({
@@ -609,87 +1006,80 @@ def _parse_apple_card_pdf(text: str) -> List[dict]:
     return transactions
 
 
-def _parse_coinbase_card_pdf(text: str) -> List[dict]:
-    """Parse Coinbase One Card statement PDF text.
+def _parse_coinbase_card_pdf(lines) -> List[dict]:
+    """Parse Coinbase One Card statement PDF text (iterable of lines).
     pdfplumber format: "Dec 22, 2025 MERCHANT NAME $XX.XX" on one line,
     with possible description continuation on next line.
     """
     transactions = []
-    skip_keywords = ["ach payment", "autopay", "refund", "credit adjustment"]
 
-    lines = text.split("\n")
+    # Single pass: consume the line iterator once, pushing back at most one
+    # line when the continuation scan runs into the next transaction.
+    it = iter(lines)
+    pushback = None
     # Find the "Transactions" section
     in_transactions = False
 
-    # Pattern: "Dec 22, 2025  DESCRIPTION  $XX.XX" or "-$XX.XX"
-    date_pattern = re.compile(
-        r"^((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},?\s*\d{4})\s+(.+?)\s+(-?\$[\d,]+\.\d{2})$"
-    )
-    # Also try: date + description (no amount — amount may be on prev desc or next line)
-    date_only_pattern = re.compile(
-        r"^((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},?\s*\d{4})\s+(.+)$"
-    )
-
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
+    while True:
+        raw = pushback if pushback is not None else next(it, None)
+        pushback = None
+        if raw is None:
+            break
+        line = raw.strip()
 
         # Detect section boundaries
         if "Transactions" in line and "Date" not in line:
             in_transactions = True
-            i += 1
             continue
         if line.startswith("Total") and ("period" in line.lower() or "charges" in line.lower()):
             in_transactions = False
-            i += 1
             continue
         if "Payments and credits" in line:
             in_transactions = False
-            i += 1
             continue
         if line.startswith("Fees") or line.startswith("Interest"):
             in_transactions = False
-            i += 1
             continue
 
         if not in_transactions:
-            i += 1
             continue
 
         # Skip headers and footers
-        if any(s in line.lower() for s in ["page ", "coinbase one card", "curtis", "crb1898", "date description"]):
-            i += 1
+        if _COINBASE_CHROME_RE.search(line.lower()):
             continue
 
         # Try full pattern: date + description + amount on one line
-        m = date_pattern.match(line)
+        m = _COINBASE_TXN_RE.match(line)
         if m:
             date_str = _normalize_date_text(m.group(1))
             desc = m.group(2).strip()
             amount_str = m.group(3).replace("$", "").replace(",", "")
             amount = abs(float(amount_str))
 
-            # Check for description continuation on next line
-            j = i + 1
-            while j < len(lines) and j < i + 3:
-                next_line = lines[j].strip()
-                if not next_line or date_only_pattern.match(next_line) or date_pattern.match(next_line):
+            # Check for description continuation on the next couple of lines
+            peeked = 0
+            while peeked < 2:
+                nxt = next(it, None)
+                if nxt is None:
+                    break
+                next_line = nxt.strip()
+                if not next_line or _COINBASE_DATE_ONLY_RE.match(next_line) or _COINBASE_TXN_RE.match(next_line):
+                    pushback = nxt
                     break
-                if any(s in next_line.lower() for s in ["page ", "coinbase", "curtis", "crb1898", "total"]):
-                    j += 1
+                peeked += 1
+                if _COINBASE_CONT_SKIP_RE.search(next_line.lower()):
                     continue
                 # It's continuation text
                 desc += " " + next_line
-                j += 1
 
             if date_str and amount > 0:
-                desc_clean = re.sub(r'\s+\d{5}\s+\d{3}\s+\d{3}$', '', desc)
-                desc_clean = re.sub(r'\s{2,}', ' ', desc_clean).strip()
+                desc_clean = _COINBASE_REF_TAIL_RE.sub('', desc)
+                desc_clean = _MULTISPACE_RE.sub(' ', desc_clean).strip()
                 if len(desc_clean) > 60:
                     desc_clean = desc_clean[:60].strip()
 
                 desc_lower = desc.lower()
-                if not any(kw in desc_lower for kw in skip_keywords):
+                if not _COINBASE_SKIP_RE.search(desc_lower):
                     transactions.append({
                         "date": date_str,
                         "description": desc_clean,
@@ -697,16 +1087,12 @@ def _parse_coinbase_card_pdf(text: str) -> List[dict]:
                         "category": categorize_transaction(desc),
                         "bank_category": "",
                     })
-            i = j
-            continue
-
-        i += 1
 
     return transactions
 
 
-def _parse_golden1_pdf(text: str) -> List[dict]:
-    """Parse Golden 1 Credit Union bank statement PDF text.
+def _parse_golden1_pdf(lines) -> List[dict]:
+    """Parse Golden 1 Credit Union bank statement PDF text (iterable of lines).
     Format: tab-separated lines with Post Date, Description, Withdrawals ($), Deposits ($), Balance ($)
     Multi-line descriptions: date on first line, continuation on next lines, amount on a line.
     
@@ -714,108 +1100,100 @@ def _parse_golden1_pdf(text: str) -> List[dict]:
     Deposits are returned with negative amounts so the budget can show net cash flow.
     """
     transactions = []
-    # Skip non-transaction lines and credit card payments (those appear on the CC statement).
-    skip_keywords = [
-        # Not actual transactions
-        "beginning balance", "ending balance", "account summary",
-        # Credit card payments — actual spending is on the CC statement
-        "applecard", "apple card", "gsbank", "coinbase card",
-        "crcardpmt", "credit card",
-    ]
-    # Keywords that indicate incoming money (deposits) — these get negative amounts
-    income_keywords = [
-        "direct deposit", "payroll", "salary", "wages",
-        "checking deposit", "mobile deposit", "atm deposit", "cash deposit",
-        "ach deposit", "ach credit", "ach p2p credit",
-        "zelle dep", "zelle credit", "zelle from", "zelle money received",
-        "venmo cashout", "venmo credit",
-        "interest earned", "interest paid", "dividend",
-        "refund", "credit adjustment", "merchant credit",
-        "from ach", "nowrtp", "moneyline", "ach p2p",
-        "tax refund", "reimbursement",
-    ]
-
-    lines = text.split("\n")
-    date_pattern = re.compile(r"^(\d{2}/\d{2}/\d{4})")
-
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        dm = date_pattern.match(line)
+
+    # Single pass: consume the line iterator once, pushing back at most one
+    # line when the continuation scan runs into the next transaction.
+    it = iter(lines)
+    pushback = None
+
+    while True:
+        raw = pushback if pushback is not None else next(it, None)
+        pushback = None
+        if raw is None:
+            break
+        line = raw.strip()
+        dm = _GOLDEN1_DATE_RE.match(line)
         if not dm:
-            i += 1
             continue
 
         date_str = _normalize_date_text(dm.group(1))
         if not date_str:
-            i += 1
             continue
 
         # Rest of line after date(s)
         rest = line[dm.end():].strip()
         # Sometimes there's a second date (effective date)
-        dm2 = re.match(r"^(\d{2}/\d{2}/\d{4})\s*", rest)
+        dm2 = _GOLDEN1_DATE2_RE.match(rest)
         if dm2:
             rest = rest[dm2.end():].strip()
 
         # Collect description parts and find the withdrawal amount
         desc_parts = [rest] if rest else []
         amount = 0.0
-        j = i + 1
-
-        # Look for amount pattern: -X,XXX.XX (withdrawal) or just the amount on continuation lines
-        # Check current line for amounts first
-        amounts_on_line = re.findall(r"-?([\d,]+\.\d{2})", rest)
-        
-        # Scan continuation lines
-        while j < len(lines):
-            next_line = lines[j].strip()
+
+        # Look for amount pattern: -X,XXX.XX (withdrawal) or just the amount on
+        # continuation lines. Only the first amount found is used, so track it
+        # directly instead of accumulating every match in a list.
+        m = _AMOUNT_RE.search(rest)
+        first_amount = m.group(1) if m else None
+
+        # Scan continuation lines (capped at 6 per transaction)
+        scanned = 0
+        while True:
+            nxt = next(it, None)
+            if nxt is None:
+                break
+            next_line = nxt.strip()
             # New date = new transaction
-            if date_pattern.match(next_line):
+            if _GOLDEN1_DATE_RE.match(next_line):
+                pushback = nxt
+                break
+            lc = next_line.lower()
+            # Summary rows close the section; stop before their totals get
+            # mistaken for transaction amounts
+            if lc.startswith(("total", "subtotal", "balance")):
                 break
             # Skip section headers
-            if any(skip in next_line.lower() for skip in ["account activity", "account number", "account summary", "page "]):
-                j += 1
+            if lc.startswith(_GOLDEN1_HEADER_PREFIXES):
                 continue
             # Check for amount
-            amt_matches = re.findall(r"-?([\d,]+\.\d{2})", next_line)
+            amt_matches, text_part = _split_amounts(next_line)
             if amt_matches:
-                amounts_on_line.extend(amt_matches)
+                if first_amount is None:
+                    first_amount = amt_matches[0]
                 # Don't add pure-number lines to description
-                text_part = re.sub(r'-?[\d,]+\.\d{2}', '', next_line).strip()
+                text_part = text_part.strip()
                 if text_part and len(text_part) > 3:
                     desc_parts.append(text_part)
-            elif next_line and not next_line.startswith("Total"):
+            elif next_line:
                 desc_parts.append(next_line)
-            j += 1
-            if j - i > 6:
+            scanned += 1
+            if scanned > 6:
                 break
 
         desc = " ".join(desc_parts).strip()
-        desc = re.sub(r'\s{2,}', ' ', desc)
+        desc = _MULTISPACE_RE.sub(' ', desc)
 
         # The withdrawal amount is typically the first negative-looking amount
         # or the first amount in the withdrawals column
-        if amounts_on_line:
+        if first_amount is not None:
             # For bank statements, take the first amount as the transaction amount
-            amount = _safe_float(amounts_on_line[0])
+            amount = _safe_float(first_amount)
 
         if not desc or amount == 0:
-            i = j
             continue
 
         # Clean up description
-        desc_clean = re.sub(r'\s*\([^)]*\)\s*$', '', desc)  # Remove trailing (codes)
+        desc_clean = _PAREN_TAIL_RE.sub('', desc)  # Remove trailing (codes)
         if len(desc_clean) > 60:
             desc_clean = desc_clean[:60].strip()
 
         desc_lower = desc.lower()
-        if any(kw in desc_lower for kw in skip_keywords):
-            i = j
+        if _GOLDEN1_SKIP_RE.search(desc_lower):
             continue
 
         # Detect if this is income/deposit based on keywords
-        is_income = any(kw in desc_lower for kw in income_keywords)
+        is_income = bool(_GOLDEN1_INCOME_RE.search(desc_lower))
         txn_type = "income" if is_income else "expense"
         txn_amount = -round(amount, 2) if is_income else round(amount, 2)
         txn_category = "Income" if is_income else categorize_transaction(desc)
@@ -828,29 +1206,24 @@ def _parse_golden1_pdf(text: str) -> List[dict]:
             "type": txn_type,
             "bank_category": "",
         })
-        i = j
 
     return transactions
 
 
-def _parse_generic_pdf(text: str) -> List[dict]:
+def _parse_generic_pdf(lines) -> List[dict]:
     """Fallback generic PDF statement parser. Line-by-line extraction."""
     transactions = []
-    date_pattern = re.compile(r"^(\d{1,2}[/\-]\d{1,2}(?:[/\-]\d{2,4})?)")
-
-    skip_keywords = ["payment thank you", "autopay", "online payment",
-                     "cashback", "rewards redemption", "balance transfer"]
-    income_keywords = [
-        "direct deposit", "payroll", "salary", "wages",
-        "deposit", "refund", "credit adjustment", "merchant credit",
-        "interest earned", "dividend", "tax refund", "reimbursement",
-    ]
 
-    for line in text.split("\n"):
-        line = line.strip()
-        if not line:
+    for raw in lines:
+        # A transaction line must start with a digit (MM/DD...) — screen on
+        # the raw first char so most lines skip the strip() allocation too
+        first = raw[:1]
+        if not first.isdigit() and not first.isspace():
+            continue
+        line = raw.strip()
+        if not line or not line[0].isdigit():
             continue
-        m = date_pattern.match(line)
+        m = _GENERIC_DATE_RE.match(line)
         if not m:
             continue
 
@@ -859,26 +1232,28 @@ def _parse_generic_pdf(text: str) -> List[dict]:
             continue
 
         rest = line[m.end():].strip()
-        amounts = re.findall(r"-?\$?[\d,]+\.\d{2}", rest)
-        if not amounts:
+        # Keep the last amount's match object; its span gives the split point
+        # directly instead of re-scanning with rfind
+        last_match = None
+        for last_match in _DOLLAR_AMOUNT_RE.finditer(rest):
+            pass
+        if last_match is None:
             continue
 
-        amount_str = amounts[-1].replace(",", "").replace("$", "")
-        amount = float(amount_str)
+        amount = float(last_match.group(0).replace(",", "").replace("$", ""))
         if amount == 0:
             continue
 
-        last_amt_idx = rest.rfind(amounts[-1])
-        desc = rest[:last_amt_idx].strip().rstrip("-").strip()
+        desc = rest[:last_match.start()].strip().rstrip("-").strip()
         if not desc:
             continue
 
         desc_lower = desc.lower()
-        if any(kw in desc_lower for kw in skip_keywords):
+        if _STATEMENT_SKIP_RE.search(desc_lower):
             continue
 
         raw_amount = abs(amount)
-        is_income = amount < 0 or any(kw in desc_lower for kw in income_keywords)
+        is_income = amount < 0 or bool(_STATEMENT_INCOME_RE.search(desc_lower))
         txn_type = "income" if is_income else "expense"
         txn_amount = -round(raw_amount, 2) if is_income else round(raw_amount, 2)
         txn_category = "Income" if is_income else categorize_transaction(desc)
@@ -909,33 +1284,61 @@ def parse_statement(path: Path) -> List[dict]:
 
 def _normalize_date(date_str: str) -> str:
     """Try to normalize date string to YYYY-MM-DD format."""
-    import re
     s = date_str.strip()
 
+    # Shape dispatch: fixed-width formats go straight to one strptime call
+    # (position checks are O(1) str ops); odd values fall through to regex
+    if len(s) == 10:
+        try:
+            if s[4] == "-":
+                datetime.strptime(s, "%Y-%m-%d")
+                return s
+            if s[2] == "/":
+                return datetime.strptime(s, "%m/%d/%Y").strftime("%Y-%m-%d")
+            if s[2] == "-":
+                return datetime.strptime(s, "%m-%d-%Y").strftime("%Y-%m-%d")
+        except ValueError:
+            pass
+
     # Already YYYY-MM-DD
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", s):
+    if _DATE_ISO_RE.match(s):
         return s
 
     # MM/DD/YYYY or M/D/YYYY
-    m = re.match(r"^(\d{1,2})/(\d{1,2})/(\d{4})$", s)
+    m = _DATE_MDY4_RE.match(s)
     if m:
         return f"{m.group(3)}-{int(m.group(1)):02d}-{int(m.group(2)):02d}"
 
     # MM/DD/YY
-    m = re.match(r"^(\d{1,2})/(\d{1,2})/(\d{2})$", s)
+    m = _DATE_MDY2_RE.match(s)
     if m:
         year = int(m.group(3))
         year = year + 2000 if year < 50 else year + 1900
         return f"{year}-{int(m.group(1)):02d}-{int(m.group(2)):02d}"
 
     # MM-DD-YYYY
-    m = re.match(r"^(\d{1,2})-(\d{1,2})-(\d{4})$", s)
+    m = _DATE_MDY4_DASH_RE.match(s)
     if m:
         return f"{m.group(3)}-{int(m.group(1)):02d}-{int(m.group(2)):02d}"
 
     return ""
 
 
+def parse_statements_parallel(paths: list, workers: int = None) -> List[List[dict]]:
+    """Parse several statement files concurrently, one process per file.
+
+    Parsing is CPU-bound regex/text work with no shared state, so files
+    scale across cores. Results come back in input order. A single file is
+    parsed in-process, where pool startup would cost more than it saves.
+    """
+    paths = list(paths)
+    if len(paths) < 2:
+        return [parse_statement(p) for p in paths]
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(parse_statement, paths))
+
+
 def import_statement(config_path: Path, csv_path: Path, category_overrides: dict = None) -> tuple:
     """
     Parse a bank/CC statement (CSV or PDF) and add transactions to config.
@@ -945,7 +1348,22 @@ def import_statement(config_path: Path, csv_path: Path, category_overrides: dict
     transactions = parse_statement(csv_path)
     if not transactions:
         return 0, [], "No transactions found. Check that the CSV has Date and Description columns."
+    return _merge_parsed_transactions(config_path, transactions, category_overrides)
+
+
+def import_statements(config_path: Path, csv_paths: list, category_overrides: dict = None) -> tuple:
+    """Batch variant of import_statement: parse every file (in parallel for
+    2+ files), then merge with a single config read, dedup pass, and write.
+    Returns (count, transactions, message).
+    """
+    transactions = [t for parsed in parse_statements_parallel(csv_paths) for t in parsed]
+    if not transactions:
+        return 0, [], "No transactions found. Check that the files have Date and Description columns."
+    return _merge_parsed_transactions(config_path, transactions, category_overrides)
 
+
+def _merge_parsed_transactions(config_path: Path, transactions: List[dict], category_overrides: dict = None) -> tuple:
+    """Add parsed statement transactions to the config (dedup + history)."""
     # Apply any manual category overrides
     if category_overrides:
         for txn in transactions:
@@ -954,49 +1372,109 @@ def import_statement(config_path: Path, csv_path: Path, category_overrides: dict
                 txn["category"] = category_overrides[key]
 
     # Load config and add transactions
-    with open(config_path, "r", encoding="utf-8") as f:
-        config = json.load(f)
+    config = _loads_config(Path(config_path).read_bytes())
 
     existing_txns = config.get("transactions", [])
-    spending_history = config.get("spending_history", {})
+    # Nested defaultdict turns the per-txn history update into a single +=
+    # instead of a membership check plus .get per row. Totals accumulate as
+    # integer cents so repeated float adds can't build up representation
+    # noise (15.99 + 15.99 -> 31.980000000000004); converted back on write.
+    spending_cents = defaultdict(lambda: defaultdict(int))
+    for month_key, cats in config.get("spending_history", {}).items():
+        for cat, amt in cats.items():
+            spending_cents[month_key][cat] = round(amt * 100)
+
+    # Dedup on (date, note, integer cents) — one O(N) set build instead of
+    # rescanning existing_txns for every incoming row. Amounts are already
+    # rounded to 2 decimals, so cents keys are exact and hashable.
+    existing_keys = {
+        (t.get("date"), (t.get("note") or "").lower(), round(t.get("amount", 0) * 100))
+        for t in existing_txns
+    }
 
-    added = 0
+    # Three tight passes - dedup, extend, history - so each loop body touches
+    # one data structure instead of interleaving all of them per txn.
+    new_entries = []
     for txn in transactions:
         # Dedup: skip if same date+description+amount already exists
-        is_dup = any(
-            t.get("date") == txn["date"] and
-            t.get("note", "").lower() == txn["description"].lower() and
-            abs(t.get("amount", 0) - txn["amount"]) < 0.01
-            for t in existing_txns
-        )
-        if is_dup:
+        key = (txn["date"], txn["description"].lower(), round(txn["amount"] * 100))
+        if key in existing_keys:
             continue
-
-        entry = {
+        existing_keys.add(key)  # also dedups repeats within this batch
+        new_entries.append({
             "date": txn["date"],
             "category": txn["category"],
             "amount": txn["amount"],
             "note": txn["description"]
-        }
-        existing_txns.append(entry)
-        added += 1
+        })
+
+    existing_txns.extend(new_entries)
+    added = len(new_entries)
 
-        # Update spending history
-        month_key = txn["date"][:7]
-        if month_key not in spending_history:
-            spending_history[month_key] = {}
-        cat = txn["category"]
-        spending_history[month_key][cat] = spending_history[month_key].get(cat, 0) + txn["amount"]
+    for entry in new_entries:
+        spending_cents[entry["date"][:7]][entry["category"]] += round(entry["amount"] * 100)
 
     config["transactions"] = existing_txns
-    config["spending_history"] = spending_history
+    config["spending_history"] = {
+        month: {cat: cents / 100.0 for cat, cents in cats.items()}
+        for month, cats in spending_cents.items()
+    }
 
-    with open(config_path, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2)
+    _write_config(Path(config_path), config)
 
     return added, transactions, f"Imported {added} new transactions ({len(transactions)} total parsed, {len(transactions) - added} duplicates skipped)."
 
 
+@lru_cache(maxsize=4096)
+def _normalize_merchant_desc(desc: str) -> str:
+    """Collapse a merchant description into a canonical grouping key.
+
+    Pure string -> string, so results are memoized: real statements repeat
+    the same merchant strings constantly, and a cache hit skips the regex
+    strip and whitespace collapse entirely.
+    """
+    d = (desc or "").strip()
+    # Remove trailing reference numbers, dates, transaction IDs
+    d = _NORMALIZE_TRAIL_RE.sub('', d)  # trailing ref numbers / dates
+    d = ' '.join(d.split())  # C-level whitespace collapse
+    # Take first ~40 chars for grouping (avoids minor suffix variations)
+    return d[:40].strip().lower() if d else ""
+
+
+def _group_by_merchant_pandas(transactions: list) -> Optional[dict]:
+    """Group transactions by normalized merchant key using vectorized pandas
+    string ops. Mirrors _normalize_merchant_desc:
+    strip trailing reference numbers and dates, collapse whitespace, then
+    truncate to 40 lowercased chars. Returns {key: [txn, ...]} in first-seen
+    order, or None if pandas is unavailable or the data doesn't cooperate.
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        return None
+    try:
+        src = pd.Series(
+            [(t.get("note") or t.get("description", "") or "") for t in transactions],
+            dtype=object,
+        )
+        keys = (
+            src.str.strip()
+            .str.replace(_NORMALIZE_TRAIL_RE, "", regex=True)
+            .str.replace(_WS_RE, " ", regex=True)
+            .str.strip()
+            .str.slice(0, 40)
+            .str.strip()
+            .str.lower()
+        )
+        sub = keys[keys.str.len() >= 3]
+        return {
+            key: [transactions[i] for i in idx]
+            for key, idx in sub.groupby(sub, sort=False).groups.items()
+        }
+    except Exception:
+        return None
+
+
 def detect_recurring_transactions(transactions: list, existing_recurring: list = None) -> list:
     """
     Scan transaction history for recurring patterns.
@@ -1006,29 +1484,27 @@ def detect_recurring_transactions(transactions: list, existing_recurring: list =
     Returns list of suggested recurring items:
     [{"name": str, "amount": float, "category": str, "frequency": str, "occurrences": int, "months": list}]
     """
-    from collections import defaultdict
-
     existing_recurring = existing_recurring or []
     existing_names = {r.get("name", "").lower().strip() for r in existing_recurring}
 
     # Normalize descriptions: strip digits/dates, collapse whitespace
-    def normalize_desc(desc):
-        """Collapse a merchant description into a canonical key."""
-        d = (desc or "").strip()
-        # Remove trailing reference numbers, dates, transaction IDs
-        d = re.sub(r'\s*#?\d{4,}$', '', d)  # trailing long numbers
-        d = re.sub(r'\s*\d{1,2}/\d{1,2}.*$', '', d)  # trailing dates
-        d = re.sub(r'\s+', ' ', d).strip()
-        # Take first ~40 chars for grouping (avoids minor suffix variations)
-        return d[:40].strip().lower() if d else ""
-
-    # Group transactions by normalized merchant name
-    merchant_txns = defaultdict(list)
-    for txn in transactions:
-        key = normalize_desc(txn.get("note") or txn.get("description", ""))
-        if not key or len(key) < 3:
-            continue
-        merchant_txns[key].append(txn)
+    normalize_desc = _normalize_merchant_desc
+
+    # Group transactions by normalized merchant name. Prefer the vectorized
+    # pandas path (one C-level regex pass over all descriptions instead of
+    # four Python regex calls per transaction); fall back to the plain loop.
+    merchant_txns = _group_by_merchant_pandas(transactions)
+    if merchant_txns is None:
+        merchant_txns = defaultdict(list)
+        for txn in transactions:
+            key = normalize_desc(txn.get("note") or txn.get("description", ""))
+            if not key or len(key) < 3:
+                continue
+            merchant_txns[key].append(txn)
+
+    # Normalize the existing recurring names once; the old per-group
+    # any(normalize_desc(n) == key ...) scan was O(groups x existing).
+    existing_norm_keys = {normalize_desc(n) for n in existing_names}
 
     suggestions = []
     for key, txns in merchant_txns.items():
@@ -1056,9 +1532,9 @@ def detect_recurring_transactions(transactions: list, existing_recurring: list =
             continue
 
         # Check amount consistency (within 20% of median)
-        amounts.sort()
-        median_amt = amounts[len(amounts) // 2]
-        consistent = sum(1 for a in amounts if abs(a - median_amt) / max(median_amt, 0.01) < 0.20)
+        median_amt = median_high(amounts)
+        tolerance = 0.20 * max(median_amt, 0.01)
+        consistent = sum(1 for a in amounts if abs(a - median_amt) < tolerance)
         if consistent < len(amounts) * 0.6:
             continue  # Amounts too variable
 
@@ -1083,20 +1559,20 @@ def detect_recurring_transactions(transactions: list, existing_recurring: list =
         else:
             frequency = "monthly"
 
-        # Pick the best name (most common original description)
-        from collections import Counter
-        name_counts = Counter(n.strip() for n in original_names if n.strip())
-        best_name = name_counts.most_common(1)[0][0] if name_counts else key.title()
+        # Pick the best name (most common original description). Groups are
+        # tiny, so max over list.count beats building a Counter per group;
+        # ties go to the first occurrence either way.
+        names = [n.strip() for n in original_names if n.strip()]
+        best_name = max(names, key=names.count) if names else key.title()
 
         # Pick most common category
-        cat_counts = Counter(categories)
-        best_cat = cat_counts.most_common(1)[0][0]
+        best_cat = max(categories, key=categories.count)
 
         # Skip if already in recurring list
         if best_name.lower().strip() in existing_names:
             continue
         # Also skip if the normalized key matches any existing name
-        if any(normalize_desc(n) == key for n in existing_names):
+        if key in existing_norm_keys:
             continue
 
         suggestions.append({
@@ -1118,7 +1594,7 @@ def main():
     p = argparse.ArgumentParser(description="Import Fidelity / Stash / Acorns / Fundrise CSV into config")
     p.add_argument("csv_path", type=Path, help="Path to the CSV file")
     p.add_argument("--source", "-s", required=True,
-                    choices=["fidelity", "stash", "acorns", "acorns_invest", "acorns_later", "fundrise"],
+                    choices=list(_VALID_SOURCES),
                     help="Source of the CSV")
     p.add_argument("--config", "-c", type=Path, default=None, help="Path to config.json (default: same dir)")
     args = p.parse_args()
@@ -1,810 +1,343 @@
 """Dashboard rendering: data preparation + full HTML template for Nickel&Dime."""
 
+import gzip
+import hashlib
 import json
-from datetime import datetime
+import re
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from functools import lru_cache
+from html import escape as _html_escape
+from itertools import islice
 from urllib.parse import quote
 
+import numpy as np
+
 
 def append_history_log(base, action: str, details: str = "") -> None:
     from finance_manager import append_history_log as _log
     _log(base, action, details)
 
 
-def render_economics_fragment_html() -> str:
-    """Return the inner HTML for the Economics tab (lazily loaded on first visit)."""
-    return """  <div class="card">
-    <div class="card-title">US Economics &amp; Fiscal Data</div>
-    <div id="fred-load-status" class="hint" style="margin-bottom:12px;"></div>
-
-    <!-- Economic Calendar -->
-    <div id="fred-section-econcal" class="card" style="margin-top:16px;padding:16px;">
-      <div style="display:flex;flex-wrap:wrap;align-items:center;gap:8px 12px;margin-bottom:10px;">
-        <div class="card-title" style="margin:0;">Economic Calendar</div>
-        <span id="econcal-week" style="font-size:0.85rem;color:#94a3b8;"></span>
-        <div style="margin-left:auto;display:flex;gap:6px;">
-          <button type="button" id="econcal-prev" style="padding:5px 10px;font-size:0.82rem;border:1px solid rgba(255,255,255,0.2);border-radius:6px;background:rgba(255,255,255,0.06);color:#e2e8f0;cursor:pointer;">&laquo; Prev</button>
-          <button type="button" id="econcal-this" style="padding:5px 10px;font-size:0.82rem;border:1px solid rgba(99,102,241,0.5);border-radius:6px;background:rgba(99,102,241,0.15);color:#a5b4fc;cursor:pointer;font-weight:600;">This week</button>
-          <button type="button" id="econcal-next" style="padding:5px 10px;font-size:0.82rem;border:1px solid rgba(255,255,255,0.2);border-radius:6px;background:rgba(255,255,255,0.06);color:#e2e8f0;cursor:pointer;">Next &raquo;</button>
-        </div>
-      </div>
-      <div id="econcal-body" style="max-height:440px;overflow-y:auto;">
-        <p class="hint">Loading economic events&hellip;</p>
-      </div>
-      <p class="hint" style="margin-top:8px;">US economic data releases. Actuals update as numbers are reported. <span style="display:inline-block;width:8px;height:8px;background:#ef4444;border-radius:50%;"></span> High &nbsp;<span style="display:inline-block;width:8px;height:8px;background:#f59e0b;border-radius:50%;"></span> Medium &nbsp;<span style="display:inline-block;width:8px;height:8px;background:#64748b;border-radius:50%;"></span> Low impact.</p>
-    </div>
-
-    <!-- FRED Charts Controls -->
-    <div style="display:flex;flex-wrap:wrap;align-items:center;gap:12px;margin-top:20px;margin-bottom:4px;">
-      <button type="button" class="secondary" id="fred-refresh-btn">Refresh FRED Data</button>
-      <span class="label" style="margin:0;">Range:</span>
-      <select id="fred-horizon" style="padding:6px 10px;font-size:0.85rem;">
-        <option value="1y">1 year (fast)</option>
-        <option value="5y">5 years</option>
-        <option value="max">Max (~50y)</option>
-      </select>
-    </div>
-
-    <!-- National Debt & Fiscal Policy -->
-    <div id="fred-section-debt" class="card" style="margin-top:16px;padding:16px;">
-      <div class="card-title" style="margin-bottom:12px;">National Debt &amp; Fiscal Policy</div>
-      <div id="fred-debt-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
-      <div style="display:grid;grid-template-columns:repeat(auto-fit, minmax(320px, 1fr));gap:16px;">
-        <div><div class="card-title" style="font-size:0.9rem;">Federal Debt (Total Public)</div><div style="position:relative;height:200px;"><canvas id="fred-chart-debt"></canvas></div></div>
-        <div><div class="card-title" style="font-size:0.9rem;">Debt to GDP Ratio</div><div style="position:relative;height:200px;"><canvas id="fred-chart-debt-gdp"></canvas></div></div>
-        <div><div class="card-title" style="font-size:0.9rem;">Federal Surplus or Deficit (Annual)</div><div style="position:relative;height:200px;"><canvas id="fred-chart-deficit"></canvas></div></div>
-        <div><div class="card-title" style="font-size:0.9rem;">Interest Payments</div><div style="position:relative;height:200px;"><canvas id="fred-chart-interest"></canvas></div></div>
-        <div><div class="card-title" style="font-size:0.9rem;">Revenue vs Expenditures</div><div style="position:relative;height:200px;"><canvas id="fred-chart-revenue-spending"></canvas></div></div>
-      </div>
-      <div class="card-title" style="font-size:0.9rem;margin-top:20px;margin-bottom:8px;">Fiscal Ratios (% of GDP)</div>
-      <div style="display:grid;grid-template-columns:repeat(auto-fit, minmax(300px, 1fr));gap:16px;">
-        <div><div class="card-title" style="font-size:0.85rem;">Deficit as % of GDP</div><div style="position:relative;height:200px;"><canvas id="fred-chart-deficit-pct"></canvas></div></div>
-        <div><div class="card-title" style="font-size:0.85rem;">Government Spending as % of GDP</div><div style="position:relative;height:200px;"><canvas id="fred-chart-spending-pct"></canvas></div></div>
-        <div><div class="card-title" style="font-size:0.85rem;">Interest Expense as % of GDP</div><div style="position:relative;height:200px;"><canvas id="fred-chart-interest-pct"></canvas></div></div>
-      </div>
-      <p class="hint" style="margin-top:12px;">Debt and deficit ratios show fiscal sustainability. Interest % of GDP reflects debt-service burden; rising fast means concern.</p>
-    </div>
-
-    <!-- Inflation -->
-    <div id="fred-section-inflation" class="card" style="margin-top:16px;padding:16px;">
-      <div class="card-title" style="margin-bottom:12px;">Inflation (CPI, Core CPI, PCE)</div>
-      <div id="fred-inflation-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
-      <div style="position:relative;height:220px;"><canvas id="fred-chart-inflation"></canvas></div>
-      <p class="hint" style="margin-top:8px;">CPI-U = headline inflation. Core CPI excludes food &amp; energy (less volatile). PCE is the Fed&#39;s preferred measure.</p>
-    </div>
-
-    <!-- Monetary Policy -->
-    <div id="fred-section-monetary" class="card" style="margin-top:16px;padding:16px;">
-      <div class="card-title" style="margin-bottom:12px;">Monetary Policy (Fed Funds Rate, M2, Yield Curve)</div>
-      <div id="fred-monetary-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
-      <div style="display:grid;grid-template-columns:repeat(auto-fit, minmax(300px, 1fr));gap:16px;">
-        <div><div style="position:relative;height:200px;"><canvas id="fred-chart-fedfunds"></canvas></div></div>
-        <div><div style="position:relative;height:200px;"><canvas id="fred-chart-m2"></canvas></div></div>
-      </div>
-      <div class="card-title" style="font-size:0.9rem;margin-top:16px;">Treasury Yield Curve (current vs 1Y ago)</div>
-      <div style="position:relative;height:220px;margin-top:8px;"><canvas id="fred-chart-yield-curve"></canvas></div>
-      <p class="hint" style="margin-top:8px;">Inverted curve (short rates &gt; long) often precedes recessions. Fed Funds drives short-term rates; M2 shows liquidity.</p>
-    </div>
-
-    <!-- FedWatch Rate Expectations -->
-    <div id="fred-section-fedwatch" class="card" style="margin-top:16px;padding:16px;">
-      <div class="card-title" style="margin-bottom:4px;">Fed Rate Expectations (FedWatch)</div>
-      <p class="hint" style="margin-bottom:12px;">Market-implied probabilities derived from 30-Day Fed Funds Futures.</p>
-      <div id="fw-tabs" style="display:flex;gap:2px;flex-wrap:wrap;margin-bottom:16px;"></div>
-      <div id="fw-info" style="margin-bottom:12px;"></div>
-      <div id="fw-title" style="font-size:0.85rem;font-weight:600;color:var(--text-primary);margin-bottom:4px;"></div>
-      <div id="fw-subtitle" style="font-size:0.78rem;color:var(--accent-primary);margin-bottom:12px;text-align:center;"></div>
-      <div style="position:relative;height:260px;"><canvas id="fw-bar-chart"></canvas></div>
-    </div>
-
-    <!-- Credit Stress -->
-    <div id="fred-section-credit" class="card" style="margin-top:16px;padding:16px;">
-      <div style="display:flex;flex-wrap:wrap;align-items:center;justify-content:space-between;gap:8px;margin-bottom:12px;">
-        <div class="card-title" style="margin:0;">Credit Stress (High Yield Spreads)</div>
-        <select class="fred-period-select" data-section="credit" style="padding:4px 8px;font-size:0.8rem;">
-          <option value="1y">1 year</option>
-          <option value="5y">5 years</option>
-          <option value="max">Max (~15y)</option>
-        </select>
-      </div>
-      <div id="fred-credit-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
-      <div style="position:relative;height:220px;"><canvas id="fred-chart-hy-spread"></canvas></div>
-      <p class="hint" style="margin-top:8px;">Spread between high-yield corporate bonds and Treasuries. Widening = financial stress. Above 5% = recession risk.</p>
-    </div>
-
-    <!-- Real Yields & Inflation Expectations -->
-    <div id="fred-section-realyields" class="card" style="margin-top:16px;padding:16px;">
-      <div style="display:flex;flex-wrap:wrap;align-items:center;justify-content:space-between;gap:8px;margin-bottom:12px;">
-        <div class="card-title" style="margin:0;">Real Yields &amp; Inflation Expectations</div>
-        <select class="fred-period-select" data-section="realyields" style="padding:4px 8px;font-size:0.8rem;">
-          <option value="1y">1 year</option>
-          <option value="5y">5 years</option>
-          <option value="max">Max (~15y)</option>
-        </select>
-      </div>
-      <div id="fred-realyield-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
-      <div style="display:grid;grid-template-columns:repeat(auto-fit, minmax(300px, 1fr));gap:16px;">
-        <div><div class="card-title" style="font-size:0.9rem;">10Y Real Yield (TIPS)</div><div style="position:relative;height:200px;"><canvas id="fred-chart-real-yield"></canvas></div></div>
-        <div><div class="card-title" style="font-size:0.9rem;">Breakeven Inflation (5Y &amp; 10Y)</div><div style="position:relative;height:200px;"><canvas id="fred-chart-breakeven"></canvas></div></div>
-      </div>
-      <p class="hint" style="margin-top:8px;">Negative real yields are bullish for gold/crypto. Breakevens show what the bond market expects for inflation.</p>
-    </div>
-
-    <!-- Fed Balance Sheet & Liquidity -->
-    <div id="fred-section-fedbs" class="card" style="margin-top:16px;padding:16px;">
-      <div style="display:flex;flex-wrap:wrap;align-items:center;justify-content:space-between;gap:8px;margin-bottom:12px;">
-        <div class="card-title" style="margin:0;">Fed Balance Sheet</div>
-        <select class="fred-period-select" data-section="fedbs" style="padding:4px 8px;font-size:0.8rem;">
-          <option value="1y">1 year</option>
-          <option value="5y">5 years</option>
-          <option value="max">Max (~15y)</option>
-        </select>
-      </div>
-      <div id="fred-fedbs-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
-      <div style="position:relative;height:220px;"><canvas id="fred-chart-fedbs"></canvas></div>
-      <p class="hint" style="margin-top:8px;">Total Fed assets. Expanding = QE (liquidity injection, bullish). Contracting = QT (liquidity drain, headwind).</p>
-    </div>
-
-    <!-- Sahm Rule Recession Indicator -->
-    <div id="fred-section-sahm" class="card" style="margin-top:16px;padding:16px;">
-      <div class="card-title" style="margin-bottom:12px;">Sahm Rule Recession Indicator</div>
-      <div id="fred-sahm-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
-      <div style="position:relative;height:220px;"><canvas id="fred-chart-sahm"></canvas></div>
-      <p class="hint" style="margin-top:8px;">Crosses 0.50 = recession signal. Based on 3-month moving average of unemployment rate vs 12-month low.</p>
-    </div>
-
-    <!-- Labor Market -->
-    <div id="fred-section-labor" class="card" style="margin-top:16px;padding:16px;">
-      <div class="card-title" style="margin-bottom:12px;">Labor Market (Unemployment, Jobless Claims)</div>
-      <div id="fred-labor-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
-      <div style="display:grid;grid-template-columns:repeat(auto-fit, minmax(300px, 1fr));gap:16px;">
-        <div><div style="position:relative;height:200px;"><canvas id="fred-chart-unemployment"></canvas></div></div>
-        <div><div style="position:relative;height:200px;"><canvas id="fred-chart-claims"></canvas></div></div>
-      </div>
-      <p class="hint" style="margin-top:8px;">Unemployment rate (U-3) and weekly jobless claims. Rising claims can lead unemployment by weeks, an early warning of slowdown.</p>
-    </div>
-
-    <!-- Growth & Sentiment -->
-    <div id="fred-section-growth" class="card" style="margin-top:16px;padding:16px;">
-      <div style="display:flex;align-items:center;gap:12px;margin-bottom:12px;">
-        <div class="card-title" style="margin:0;">Growth &amp; Sentiment (Real GDP Growth, Consumer Sentiment)</div>
-        <select class="fred-period-select" data-section="growth" style="padding:4px 8px;font-size:0.8rem;">
-          <option value="1y">1 year</option>
-          <option value="5y">5 years</option>
-          <option value="max">Max</option>
-        </select>
-      </div>
-      <div id="fred-growth-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
-      <div style="display:grid;grid-template-columns:repeat(auto-fit, minmax(300px, 1fr));gap:16px;">
-        <div><div style="position:relative;height:200px;"><canvas id="fred-chart-gdp-growth"></canvas></div></div>
-        <div><div style="position:relative;height:200px;"><canvas id="fred-chart-sentiment"></canvas></div></div>
-      </div>
-      <p class="hint" style="margin-top:8px;">Quarterly GDP growth (real, annualized) and U. of Michigan consumer sentiment. Sentiment can lead or confirm economic turns.</p>
-    </div>
-
-    <!-- Market Valuation (CAPE) -->
-    <div id="fred-section-cape" class="card" style="margin-top:16px;padding:16px;">
-      <div class="card-title" style="margin-bottom:12px;">Market Valuation (Shiller CAPE Ratio)</div>
-      <div id="cape-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
-      <div style="position:relative;height:240px;"><canvas id="cape-chart"></canvas></div>
-      <p class="hint" style="margin-top:8px;">Cyclically-adjusted P/E (CAPE) smooths earnings over 10 years. Long-term median ~16.8. Above 25 = historically expensive. Below 15 = historically cheap.</p>
-    </div>
-
-    <!-- Buffett Indicator -->
-    <div id="fred-section-buffett" class="card" style="margin-top:16px;padding:16px;">
-      <div class="card-title" style="margin-bottom:12px;">Buffett Indicator (Total Market Cap / GDP)</div>
-      <div id="buffett-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
-      <div style="position:relative;height:240px;"><canvas id="buffett-chart"></canvas></div>
-      <p class="hint" style="margin-top:8px;">Warren Buffett&#39;s &ldquo;best single measure of valuations.&rdquo; Compares total US market cap to GDP. Long-term average ~120%. Above 140% = overvalued territory.</p>
-    </div>
-
-    <!-- World Uncertainty Index -->
-    <div id="fred-section-wui" class="card" style="margin-top:16px;padding:16px;">
-      <div class="card-title" style="margin-bottom:12px;">World Uncertainty Index (GDP-Weighted)</div>
-      <div id="fred-wui-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
-      <div style="position:relative;height:220px;"><canvas id="fred-chart-wui"></canvas></div>
-      <p class="hint" style="margin-top:8px;">Measures global uncertainty by counting &ldquo;uncertainty&rdquo; mentions in Economist Intelligence Unit country reports, GDP-weighted across 143 countries. Higher = more uncertainty. Spikes around major geopolitical and economic events.</p>
-    </div>
-
-    <!-- Housing -->
-    <div id="fred-section-housing" class="card" style="margin-top:16px;padding:16px;">
-      <div class="card-title" style="margin-bottom:12px;">Housing (Case-Shiller Home Price Index, 30Y Mortgage Rate)</div>
-      <div id="fred-housing-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
-      <div style="display:grid;grid-template-columns:repeat(auto-fit, minmax(300px, 1fr));gap:16px;">
-        <div><div style="position:relative;height:200px;"><canvas id="fred-chart-housing"></canvas></div></div>
-        <div><div style="position:relative;height:200px;"><canvas id="fred-chart-mortgage"></canvas></div></div>
-      </div>
-      <p class="hint" style="margin-top:8px;">Case-Shiller tracks home prices nationally. Mortgage rates drive affordability; spiking rates often cool housing and the broader economy.</p>
-    </div>
-  </div>"""
-
+# Serialize script payloads with orjson when available (C serializer, several
+# times faster on the list-of-dicts chart data); fall back to stdlib json.
+# orjson emits compact separators and leaves non-ASCII raw, so the two paths
+# differ in their item separator and in who escapes U+2028/U+2029.
+try:
+    import orjson
+
+    _JSON_SEP = ","
+
+    def _safe_json(obj) -> str:
+        """orjson.dumps for <script> embedding: escape '</' on the raw bytes
+        so a string value can't close the tag, then U+2028/U+2029, which
+        orjson leaves raw and legacy JS parsers treat as line terminators.
+        The page is UTF-8, so other non-ASCII passes through unescaped."""
+        s = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).replace(b"</", b"<\\/").decode("utf-8")
+        return s.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029")
+except ImportError:
+    _JSON_SEP = ", "
+
+    def _safe_json(obj) -> str:
+        """json.dumps for <script> embedding: escape '</' so a string value
+        can't close the tag. dumps escapes non-ASCII (so U+2028/U+2029 are
+        already \\uXXXX), leaving '</' as the only hazard; a single str.replace
+        is one C pass and returns the original string untouched on no match."""
+        return json.dumps(obj).replace("</", "<\\/")
+
+
+@lru_cache(maxsize=1024)
+def _esc(s) -> str:
+    """html.escape for config-sourced strings dropped into markup. The same
+    account/ticker/note strings recur every render, so memoize the escape."""
+    return _html_escape(str(s), quote=True)
+
+
+# Memo for payloads that rarely change between renders: JSON for script tags
+# (price history, allocation buckets/targets, slow-moving config sections)
+# and rendered HTML fragments that are pure functions of config. Keyed by
+# cheap fingerprints of the source data; bounded FIFO so stale configs can't
+# grow the caches.
+_CACHE_MAX = 4
+_history_dates_cache = {}
+_buckets_json_cache = {}
+_targets_json_cache = {}
+_dividends_json_cache = {}
+_alerts_json_cache = {}
+_goals_json_cache = {}
+_recurring_rows_cache = {}
+_div_rows_cache = {}
+_goal_cards_cache = {}
+_cat_options_cache = {}
+
+
+def _cached(cache: dict, key, build):
+    """Return cache[key], computing it via build() and FIFO-evicting at cap."""
+    val = cache.get(key)
+    if val is None:
+        val = build()
+        if len(cache) >= _CACHE_MAX:
+            cache.pop(next(iter(cache)))
+        cache[key] = val
+    return val
+
+
+# Chart JSON for the price history, rebuilt incrementally: snapshots only
+# ever append (or update the newest entry in place), so splice new entries
+# into the last serialized form instead of re-dumping the whole series.
+_history_json_state = {}
+
+
+def _history_chart_json(price_history: list) -> str:
+    """Serialize price_history for the chart script tag, amortizing the
+    json.dumps across renders. Falls back to a full rebuild whenever the
+    cached prefix no longer matches."""
+    state = _history_json_state
+    n = len(price_history)
+    if n == 0:
+        return "[]"
+    last_fp = tuple(sorted(price_history[-1].items()))
+    if state.get("len") == n and state.get("last") == last_fp:
+        return state["json"]
+    cached_n = state.get("len", 0)
+    if 0 < cached_n < n and tuple(sorted(price_history[cached_n - 1].items())) == state["last"]:
+        tail = _safe_json(price_history[cached_n:])
+        built = state["json"][:-1] + _JSON_SEP + tail[1:-1] + "]"
+    else:
+        built = _safe_json(list(price_history))
+    state["len"] = n
+    state["last"] = last_fp
+    state["json"] = built
+    return built
+
+
+# Pre-parsed row templates for the hottest table loops. A module-level
+# template is parsed by str.format_map once per call with no per-row
+# f-string assembly in the loop body; rows pass a small dict of values.
+_HOLDING_ROW_TMPL = (
+    '<tr><td><input type="text" name="h_account" value="{account}"></td>'
+    '<td><input type="text" name="h_ticker" value="{ticker}"></td>'
+    '<td><input type="text" name="h_asset_class" value="{asset_class}"></td>'
+    '<td><input type="text" name="h_qty" value="{qty_s}" class="num"></td>'
+    '<td style="text-align:right;color:#8b949e">{price_s}</td>'
+    '<td style="text-align:right;color:#e6edf3">{val_s}</td>'
+    '<td><input type="text" name="h_value_override" value="{vo_s}" class="num"></td>'
+    '<td><input type="text" name="h_notes" value="{notes}"></td></tr>'
+)
+_DEBT_ROW_TMPL = (
+    '<tr>'
+    '<td><input type="text" name="debt_name_{di}" value="{name}" style="width:100%;border:none;background:transparent;color:var(--text-primary);font-size:0.85rem;"></td>'
+    '<td><input type="text" name="debt_bal_{di}" value="{balance:,.2f}" class="num"></td>'
+    '<td><input type="text" name="debt_pmt_{di}" value="{payment:,.2f}" class="num"></td>'
+    '<td class="mono hint" style="text-align:center;">{months_label}</td>'
+    '<td><button type="button" class="secondary" style="padding:2px 8px;font-size:0.7rem;color:var(--danger);" onclick="removeDebt({di})">x</button></td>'
+    '</tr>'
+)
+_DEBT_OVERVIEW_ROW_TMPL = (
+    '<tr><td>{name}</td>'
+    '<td style="text-align:right" class="mono">${balance:,.0f}</td>'
+    '<td style="text-align:right" class="mono">${payment:,.0f}</td>'
+    '<td style="text-align:center" class="mono hint">{months} mo</td></tr>'
+)
+_METAL_ROW_TMPL = (
+    '<tr>'
+    '<td>{metal}</td>'
+    '<td>{form}</td>'
+    '<td class="mono" style="text-align:right">{qty:.4g}</td>'
+    '{cost_td}'
+    '<td class="mono metal-spot-cell" style="text-align:right" data-metal-spot="{metal_lc}" data-metal-qty="{qty}" data-metal-cost="{cost}">${spot:,.2f}</td>'
+    '<td class="mono" style="text-align:right">${cur_val:,.2f}</td>'
+    '<td class="mono" style="text-align:right;{gl_cls}">{gl_s}</td>'
+    '<td class="hint">{date}</td>'
+    '<td><button type="button" class="secondary" style="padding:2px 8px;font-size:0.7rem;color:var(--danger);" onclick="deleteMetalRow({mi})">x</button></td>'
+    '</tr>'
+)
+_HISTORY_ROW_TMPL = (
+    '<tr><td>{d}</td><td>{t_s}</td><td>{g_s}</td><td>{s_s}</td>'
+    '<td>{r_s}</td><td>{y10_s}</td><td>{y2_s}</td></tr>'
+)
+
+_RECUR_ROW_TMPL = (
+    '<tr><td>{name}</td><td class="mono">${amount:,.2f}</td><td>{category}</td>'
+    '<td>{frequency}</td><td><button type="button" class="secondary" '
+    'style="padding:2px 8px;font-size:0.7rem;" onclick="deleteRecurring({i})">x</button></td></tr>'
+)
+
+_DIV_ROW_TMPL = (
+    '<tr><td class="mono">{date}</td><td>{ticker}</td>'
+    '<td style="color:{color}" class="mono">{sign}${amount:,.2f}</td>'
+    '<td>{dtype}</td><td class="hint">{note}</td></tr>'
+)
+
+_TLH_ROW_TMPL = (
+    '<tr><td>{ticker}</td><td class="mono">{qty:.3f}</td>'
+    '<td class="mono">${cost_basis:,.2f}</td><td class="mono">${live:,.2f}</td>'
+    '<td class="mono danger">${unrealized:,.0f}</td></tr>'
+)
+
+_GOAL_CARD_TMPL = '''<div class="goal-card">
+          <div style="display:flex;justify-content:space-between;align-items:center;margin-bottom:6px;">
+            <strong>{name}</strong>
+            <button type="button" class="secondary" style="padding:2px 8px;font-size:0.65rem;" onclick="deleteGoal({gi})">x</button>
+          </div>
+          <div style="display:flex;justify-content:space-between;font-size:0.82rem;margin-bottom:4px;">
+            <span class="mono">${current:,.0f}</span>
+            <span class="hint">of ${target:,.0f}</span>
+          </div>
+          <div class="mini-progress"><div class="mini-fill {color}" style="width:{fill}%"></div></div>
+          <div style="display:flex;justify-content:space-between;margin-top:4px;font-size:0.75rem;">
+            <span class="hint">{pct}%</span>
+            <span class="hint">${remaining:,.0f} to go</span>
+          </div>
+        </div>'''
 
-def render_dashboard(data: dict, saved: str = "", active_tab: str = "summary", demo_mode: bool = False) -> str:
-    """Build single-page dashboard with Summary, Balances, Budget, Holdings."""
-    holdings = data.get("holdings", [])
-    buckets = data.get("buckets", {})
-    total = data.get("total", 0)
-    metals_prices = data.get("metals_prices", {})
-    config = data.get("config", {})
-    targets = config.get("targets", {}).get("tactical", {})
-    gold_price = metals_prices.get("GOLD") or 0
-    silver_price = metals_prices.get("SILVER") or 0
-    treasury_yields = data.get("treasury_yields", {})
-    gold_silver_ratio = data.get("gold_silver_ratio")
-    price_history = data.get("price_history", [])
-    tnx_10y = treasury_yields.get("tnx_10y")
-    tnx_2y = treasury_yields.get("tnx_2y")
-    tnx_10y_s = f"{tnx_10y:.2f}%" if tnx_10y is not None else "N/A"
-    tnx_2y_s = f"{tnx_2y:.2f}%" if tnx_2y is not None else "N/A"
-    gs_ratio_s = f"{gold_silver_ratio:.2f}" if gold_silver_ratio is not None else "N/A"
+# Fragment builders for sections that are pure functions of their config
+# lists; render_dashboard_iter memoizes their output across requests so an
+# auto-refresh with unchanged config reuses the rendered rows.
+# strftime re-parses its format string and consults the locale on every
+# call; the month/day strings only change at local midnight, so cache them.
+_day_strings_cache = [None, "", ""]
+
+
+def _day_strings(now: datetime) -> tuple:
+    """Return ("%Y-%m", "%Y-%m-%d") for now, recomputed once per local day."""
+    key = (now.year, now.month, now.day)
+    if _day_strings_cache[0] != key:
+        _day_strings_cache[:] = [key, now.strftime("%Y-%m"), now.strftime("%Y-%m-%d")]
+    return _day_strings_cache[1], _day_strings_cache[2]
+
+
+def _debt_overview_rows(debts: list) -> str:
+    parts = []
+    for d in debts:
+        # One conversion per field; the inline version re-ran float()/.get()
+        # for every interpolation.
+        balance = float(d.get("balance", 0) or 0)
+        payment = float(d.get("monthly_payment", 0) or 0)
+        parts.append(_DEBT_OVERVIEW_ROW_TMPL.format_map({
+            "name": _esc(d.get("name", "")), "balance": balance, "payment": payment,
+            "months": int(balance / payment) if payment > 0 else 0,
+        }))
+    return "".join(parts)
+
+
+def _recurring_rows(recurring: list) -> str:
+    parts = []
+    for i, rt in enumerate(recurring):
+        parts.append(_RECUR_ROW_TMPL.format_map({
+            "name": _esc(rt.get("name", "")), "amount": rt.get("amount", 0),
+            "category": _esc(rt.get("category", "Other")),
+            "frequency": _esc(rt.get("frequency", "monthly")), "i": i,
+        }))
+    return "".join(parts)
+
+
+def _dividend_rows(dividends: list) -> str:
+    parts = []
+    # Newest 30, iterated in reverse off the full list — no slice copy.
+    for d in islice(reversed(dividends), 30):
+        dtype = d.get("type", "dividend")
+        color = "var(--success)" if dtype == "dividend" else "var(--danger)"
+        sign = "+" if dtype == "dividend" else "-"
+        parts.append(_DIV_ROW_TMPL.format_map({
+            "date": _esc(d.get("date", "")), "ticker": _esc(d.get("ticker", "")),
+            "color": color, "sign": sign, "amount": d.get("amount", 0),
+            "dtype": _esc(dtype.title()), "note": _esc(d.get("note", "")),
+        }))
+    return "".join(parts)
 
-    from finance_manager import get_next_buys
-    next_buys = get_next_buys(config, 0)
 
-    alloc_rows = ""
-    for bucket, value in buckets.items():
-        pct = 100 * value / total if total > 0 else 0
-        tgt = targets.get(bucket, {}).get("target", 0)
-        drift = pct - tgt
-        dc = "over" if drift > 5 else ("under" if drift < -5 else "ok")
-        alloc_rows += f'<tr><td>{bucket}</td><td>${value:,.0f}</td><td>{pct:.1f}%</td><td>{tgt}%</td><td class="{dc}">{drift:+.1f}%</td></tr>'
+def _goal_cards(goals: list) -> str:
+    parts = []
+    for gi, g in enumerate(goals):
+        g_target = g.get("target", 0)
+        g_current = g.get("current", 0)
+        g_pct = int(g_current / g_target * 100) if g_target > 0 else 0
+        g_color = "done" if g_pct >= 100 else ("mid" if g_pct >= 40 else "low")
+        parts.append(_GOAL_CARD_TMPL.format_map({
+            "name": _esc(g.get("name", "Goal")), "gi": gi, "current": g_current,
+            "target": g_target, "color": g_color, "fill": min(g_pct, 100),
+            "pct": g_pct, "remaining": max(g_target - g_current, 0),
+        }))
+    return "".join(parts)
+
+
+# Bound-method dispatch for pulse value formats: one dict lookup per card
+# instead of walking an elif ladder of string comparisons.
+_PULSE_FMTS = {
+    "dollar0": "${:,.0f}".format,
+    "dollar1": "${:,.1f}".format,
+    "dollar2": "${:,.2f}".format,
+    "dollar2_nodollar": "{:,.2f}".format,
+}
+
+_PULSE_ITEM_TMPL = '''<div class="pulse-item" draggable="true" data-pulse-id="{pid}"{data_type}>
+      {remove_btn}
+      <span class="pulse-label">{label}</span>
+      <span class="pulse-price{color_class}" data-pulse-price="{pid}">{val_s}</span>
+      {spark_canvas}
+    </div>'''
 
-    # Balances section (blended_accounts)
-    blended = config.get("blended_accounts", [])
-    balance_rows = "".join(
-        f'<tr><td>{b.get("name", "")}</td><td style="text-align:right"><input type="text" name="bal_{b.get("name", "").replace(" ", "_")}" value="{b.get("value", 0):,.2f}" class="num"></td></tr>'
-        for b in blended
-    )
 
-    # Budget section
-    budget = config.get("budget", {})
-    monthly_income = budget.get("monthly_income", 0)
-    categories = budget.get("categories", [])
-    total_expenses = sum(float(c.get("limit", 0) or 0) for c in categories)
-    remaining = float(monthly_income or 0) - total_expenses
-    budget_rows = "".join(
-        f'<tr><td>{c.get("name", "")}</td><td><input type="text" name="cat_{i}" value="{c.get("limit", 0)}" class="num"></td></tr>'
-        for i, c in enumerate(categories)
-    )
-    budget_totals_row = (
-        '<tr style="font-weight:600;border-top:1px solid #30363d">'
-        f'<td>Total expenses</td><td style="text-align:right">${total_expenses:,.2f}</td></tr>'
-        f'<tr style="font-weight:700;border-top:2px solid #30363d">'
-        f'<td>Remaining (income − expenses)</td><td style="text-align:right;color:{"#3fb950" if remaining >= 0 else "#f85149"}">${remaining:,.2f}</td></tr>'
-    )
-
-    # Debt section
-    debts = config.get("debts", [])
-    total_debt = sum(float(d.get("balance", 0) or 0) for d in debts)
-    total_debt_payments = sum(float(d.get("monthly_payment", 0) or 0) for d in debts)
-    net_worth = total - total_debt
-
-    debt_rows_html = ""
-    for di, d in enumerate(debts):
-        d_name = d.get("name", "")
-        d_balance = float(d.get("balance", 0) or 0)
-        d_payment = float(d.get("monthly_payment", 0) or 0)
-        d_months = int(d_balance / d_payment) if d_payment > 0 else 0
-        d_months_label = f"{d_months} mo" if d_months > 0 else "N/A"
-        debt_rows_html += (
-            f'<tr>'
-            f'<td><input type="text" name="debt_name_{di}" value="{d_name}" style="width:100%;border:none;background:transparent;color:var(--text-primary);font-size:0.85rem;"></td>'
-            f'<td><input type="text" name="debt_bal_{di}" value="{d_balance:,.2f}" class="num"></td>'
-            f'<td><input type="text" name="debt_pmt_{di}" value="{d_payment:,.2f}" class="num"></td>'
-            f'<td class="mono hint" style="text-align:center;">{d_months_label}</td>'
-            f'<td><button type="button" class="secondary" style="padding:2px 8px;font-size:0.7rem;color:var(--danger);" onclick="removeDebt({di})">x</button></td>'
-            f'</tr>'
-        )
-
-    # Holdings section: config holdings with live Price and Total from computed data
-    cfg_holdings = config.get("holdings", [])
-    stock_prices = data.get("stock_prices", {}) or {}
-    crypto_prices = data.get("crypto_prices", {}) or {}
-    # Computed holdings match config order (first len(cfg_holdings) entries)
-    holding_rows = ""
-    holdings_total = 0.0
-    for i, h in enumerate(cfg_holdings):
-        ticker = h.get("ticker", "")
-        qty = h.get("qty")
-        vo = h.get("value_override")
-        qty_s = f'{qty}' if qty is not None else ''
-        vo_s = f'{vo}' if vo is not None else ''
-        val = holdings[i]["value"] if i < len(holdings) else 0
-        holdings_total += val
-        price = stock_prices.get(ticker) or crypto_prices.get(ticker)
-        if price is None and qty and val:
-            price = val / float(qty)
-        price_s = f"${price:,.2f}" if price is not None else "N/A"
-        val_s = f"${val:,.2f}" if val else "N/A"
-        holding_rows += f'<tr><td><input type="text" name="h_account" value="{h.get("account", "")}"></td><td><input type="text" name="h_ticker" value="{ticker}"></td><td><input type="text" name="h_asset_class" value="{h.get("asset_class", "")}"></td><td><input type="text" name="h_qty" value="{qty_s}" class="num"></td><td style="text-align:right;color:#8b949e">{price_s}</td><td style="text-align:right;color:#e6edf3">{val_s}</td><td><input type="text" name="h_value_override" value="{vo_s}" class="num"></td><td><input type="text" name="h_notes" value="{h.get("notes", "")}"></td></tr>'
-    # One blank row for add
-    holding_rows += '<tr><td><input type="text" name="h_account" placeholder="Account"></td><td><input type="text" name="h_ticker" placeholder="Ticker"></td><td><input type="text" name="h_asset_class" placeholder="Asset class"></td><td><input type="text" name="h_qty" class="num" placeholder="Qty"></td><td></td><td></td><td><input type="text" name="h_value_override" class="num" placeholder="Value override"></td><td><input type="text" name="h_notes" placeholder="Notes"></td></tr>'
-    totals_row = f'<tr style="font-weight:600;border-top:2px solid #30363d"><td colspan="4">Holdings total (should match CSV)</td><td></td><td style="text-align:right;color:#58a6ff">${holdings_total:,.2f}</td><td colspan="2"></td></tr>'
-
-    # Crypto holdings (Coinbase) table rows
-    crypto_holdings_list = config.get("crypto_holdings", [])
-    crypto_rows_html = ""
-    crypto_total_value = 0.0
-    crypto_entries = []
-    for ch in crypto_holdings_list:
-        sym = ch.get("symbol", "")
-        qty = float(ch.get("qty", 0))
-        price = crypto_prices.get(sym, 0)
-        val = qty * price
-        if val < 0.01 and qty < 0.001:
-            continue
-        crypto_entries.append((sym, qty, price, val))
-        crypto_total_value += val
-    crypto_entries.sort(key=lambda x: -x[3])
-    for sym, qty, price, val in crypto_entries:
-        qty_fmt = f"{qty:.6f}" if qty < 1 else (f"{qty:.4f}" if qty < 100 else f"{qty:,.2f}")
-        price_s = f"${price:,.2f}" if price else "N/A"
-        val_s = f"${val:,.2f}" if val >= 0.01 else "<$0.01"
-        pct = (val / crypto_total_value * 100) if crypto_total_value > 0 else 0
-        bar_w = min(100, pct)
-        crypto_rows_html += (
-            f'<tr class="crypto-row" data-crypto-sym="{sym}" data-crypto-qty="{qty}">'
-            f'<td style="font-weight:600">{sym}</td>'
-            f'<td class="mono" style="text-align:right">{qty_fmt}</td>'
-            f'<td class="mono crypto-price-cell" style="text-align:right;color:#8b949e">{price_s}</td>'
-            f'<td class="mono crypto-val-cell" style="text-align:right;color:#e6edf3">{val_s}</td>'
-            f'<td class="crypto-pct-cell" style="text-align:right;color:#8b949e;font-size:0.8rem">{pct:.1f}%</td>'
-            f'<td style="width:80px"><div style="background:rgba(88,166,255,0.15);border-radius:3px;height:6px;width:100%"><div class="crypto-bar-fill" style="background:#58a6ff;border-radius:3px;height:6px;width:{bar_w:.1f}%"></div></div></td>'
-            f'</tr>'
-        )
-    crypto_totals_row = f'<tr style="font-weight:600;border-top:2px solid #30363d"><td>Total</td><td colspan="2"></td><td id="crypto-total-val" class="mono" style="text-align:right;color:#58a6ff">${crypto_total_value:,.2f}</td><td colspan="2"></td></tr>'
-
-    # Physical metals table rows
-    phys_metals = config.get("physical_metals", [])
-    metals_rows_html = ""
-    metals_gold_oz = 0.0
-    metals_silver_oz = 0.0
-    metals_total_cost = 0.0
-    metals_total_value = 0.0
-    for mi, m in enumerate(phys_metals):
-        m_metal = m.get("metal", "Gold")
-        m_form = m.get("form", "")
-        m_qty = float(m.get("qty_oz", 0))
-        m_cost = float(m.get("cost_per_oz", 0))
-        m_date = m.get("date", "")
-        m_note = m.get("note", "")
-        m_spot = gold_price if m_metal.lower() == "gold" else silver_price
-        m_cur_val = m_qty * m_spot
-        m_cost_basis = m_qty * m_cost if m_cost > 0 else 0
-        m_gl = m_cur_val - m_cost_basis if m_cost > 0 else 0
-        m_gl_cls = "color:var(--success)" if m_gl >= 0 else "color:var(--danger)"
-        m_gl_s = f"${m_gl:+,.2f}" if m_cost > 0 else "N/A"
-        if m_metal.lower() == "gold":
-            metals_gold_oz += m_qty
-        else:
-            metals_silver_oz += m_qty
-        metals_total_cost += m_cost_basis
-        metals_total_value += m_cur_val
-        cost_td = f'<td class="mono" style="text-align:right">${m_cost:,.2f}</td>' if m_cost > 0 else '<td class="hint" style="text-align:right">N/A</td>'
-        metals_rows_html += (
-            f'<tr>'
-            f'<td>{m_metal}</td>'
-            f'<td>{m_form}</td>'
-            f'<td class="mono" style="text-align:right">{m_qty:.4g}</td>'
-            f'{cost_td}'
-            f'<td class="mono metal-spot-cell" style="text-align:right" data-metal-spot="{m_metal.lower()}" data-metal-qty="{m_qty}" data-metal-cost="{m_cost}">${m_spot:,.2f}</td>'
-            f'<td class="mono" style="text-align:right">${m_cur_val:,.2f}</td>'
-            f'<td class="mono" style="text-align:right;{m_gl_cls}">{m_gl_s}</td>'
-            f'<td class="hint">{m_date}</td>'
-            f'<td><button type="button" class="secondary" style="padding:2px 8px;font-size:0.7rem;color:var(--danger);" onclick="deleteMetalRow({mi})">x</button></td>'
-            f'</tr>'
-        )
-    metals_total_gl = metals_total_value - metals_total_cost
-    metals_gl_cls = "color:var(--success)" if metals_total_gl >= 0 else "color:var(--danger)"
-    metals_totals_row = (
-        f'<tr style="font-weight:600;border-top:2px solid #30363d">'
-        f'<td colspan="2">Totals</td>'
-        f'<td class="mono" style="text-align:right">Au {metals_gold_oz:.4g} / Ag {metals_silver_oz:.4g}</td>'
-        f'<td class="mono" style="text-align:right">${metals_total_cost:,.2f}</td>'
-        f'<td></td>'
-        f'<td class="mono" style="text-align:right;color:#58a6ff">${metals_total_value:,.2f}</td>'
-        f'<td class="mono" style="text-align:right;{metals_gl_cls}">${metals_total_gl:+,.2f}</td>'
-        f'<td colspan="2"></td>'
-        f'</tr>'
-    )
-
-    # Price history rows (newest first)
-    history_rows = ""
-    for e in reversed(price_history[-100:]):  # show last 100
-        d = e.get("date", "")
-        t = e.get("total")
-        g = e.get("gold")
-        s = e.get("silver")
-        r = e.get("gold_silver_ratio")
-        y10 = e.get("tnx_10y")
-        y2 = e.get("tnx_2y")
-        t_s = f"${t:,.0f}" if t is not None else "N/A"
-        g_s = f"${g:,.0f}" if g is not None else "N/A"
-        s_s = f"${s:,.1f}" if s is not None else "N/A"
-        r_s = f"{r:.2f}" if r is not None else "N/A"
-        y10_s = f"{y10:.2f}%" if y10 is not None else "N/A"
-        y2_s = f"{y2:.2f}%" if y2 is not None else "N/A"
-        history_rows += f'<tr><td>{d}</td><td>{t_s}</td><td>{g_s}</td><td>{s_s}</td><td>{r_s}</td><td>{y10_s}</td><td>{y2_s}</td></tr>'
-    if not history_rows:
-        history_rows = '<tr><td colspan="7" style="color:#8b949e">No history yet. Click Refresh prices to log a snapshot.</td></tr>'
-
-    # JSON for chart (escape for script tag)
-    history_for_chart = list(price_history)  # all daily OHLC entries for chart
-    history_json = json.dumps(history_for_chart).replace("</", "<\\/")
-
-    # Monthly investment tracker - calculate targets from percentages
-    monthly_inv = config.get("monthly_investments", {})
-    current_month = monthly_inv.get("month", datetime.now().strftime("%Y-%m"))
-    budget_month = budget.get("month", datetime.now().strftime("%Y-%m"))
-    allocation_pcts = monthly_inv.get("allocation_percentages", {})
-    contributions = monthly_inv.get("contributions", {})
-    
-    # Get savings budget to calculate investment targets
-    savings_budget = next((c.get("limit", 0) for c in budget.get("categories", []) 
-                          if "Savings" in c.get("name", "") or "Investment" in c.get("name", "")), 0)
-    
-    # Investment categories with display names
-    inv_categories = [
-        ("gold_etf", "Gold ETF"),
-        ("gold_phys_save", "Gold Savings"),
-        ("silver_etf", "Silver ETF"),
-        ("silver_phys_save", "Silver Savings"),
-        ("crypto", "Crypto"),
-        ("equities", "Equities"),
-        ("real_assets", "Real Assets"),
-        ("cash", "Cash Reserve"),
-    ]
-    
-    # Calculate monthly investment targets from percentages
-    inv_targets = {k: int(savings_budget * allocation_pcts.get(k, 0) / 100) for k, _ in inv_categories}
-    
-    total_target = sum(inv_targets.get(k, 0) for k, _ in inv_categories)
-    total_contributed = sum(contributions.get(k, 0) for k, _ in inv_categories)
-    total_remaining = total_target - total_contributed
-    progress_pct = int(total_contributed / total_target * 100) if total_target > 0 else 0
-    
-    # Build investment rows HTML
-    investment_rows_html = ""
-    for key, name in inv_categories:
-        alloc_pct = allocation_pcts.get(key, 0)
-        target = inv_targets.get(key, 0)
-        contributed = contributions.get(key, 0)
-        remaining = target - contributed
-        fill_pct = int(contributed / target * 100) if target > 0 else 0
-        
-        if remaining > 0:
-            status_class = "shortage"
-            status_text = f"-${remaining:,}"
-        elif remaining < 0:
-            status_class = "surplus"
-            status_text = f"+${abs(remaining):,}"
-        else:
-            status_class = "complete"
-            status_text = "Complete"
-        
-        investment_rows_html += f'''<tr>
-          <td><strong>{name}</strong> <span style="color:var(--text-muted);font-size:0.8rem;">({alloc_pct}%)</span></td>
-          <td style="text-align:right">${target:,}</td>
-          <td style="text-align:right"><input type="number" class="contrib-input" data-key="{key}" data-target="{target}" value="{contributed}" min="0" step="1"></td>
-          <td style="text-align:right" class="{status_class}" id="status-{key}">{status_text}</td>
-          <td style="width:140px"><div class="mini-progress"><div class="mini-fill {'low' if fill_pct < 40 else 'mid' if fill_pct < 90 else 'done'}" id="progress-{key}" style="width:{min(fill_pct, 100)}%"></div></div></td>
+@lru_cache(maxsize=8)
+def _pulse_item_shape(has_spark: bool, has_custom: bool) -> str:
+    """Specialize _PULSE_ITEM_TMPL for a card shape. The conditional
+    fragments only depend on whether the card has a sparkline and whether
+    it is custom, so each of the four shapes is resolved once and the loop
+    fills a ready template."""
+    tmpl = _PULSE_ITEM_TMPL.replace(
+        "{data_type}", ' data-pulse-type="{ptype}"' if has_custom else "")
+    tmpl = tmpl.replace(
+        "{remove_btn}",
+        '<button type="button" class="pulse-remove" onclick="removePulseCard(\'{pid}\')" title="Remove">&times;</button>')
+    return tmpl.replace(
+        "{spark_canvas}",
+        '<canvas class="pulse-spark" id="spark-{spark_id}"></canvas>' if has_spark else "")
+
+# Monthly investment tracker categories are fixed, so each row's shell —
+# key and display name included — is rendered once at import; the loop only
+# fills the per-month values.
+_INV_CATEGORIES = (
+    ("gold_etf", "Gold ETF"),
+    ("gold_phys_save", "Gold Savings"),
+    ("silver_etf", "Silver ETF"),
+    ("silver_phys_save", "Silver Savings"),
+    ("crypto", "Crypto"),
+    ("equities", "Equities"),
+    ("real_assets", "Real Assets"),
+    ("cash", "Cash Reserve"),
+)
+_INV_ROW_SHELL = '''<tr>
+          <td><strong>{name}</strong> <span style="color:var(--text-muted);font-size:0.8rem;">({{alloc_pct}}%)</span></td>
+          <td style="text-align:right">${{target:,}}</td>
+          <td style="text-align:right"><input type="number" class="contrib-input" data-key="{key}" data-target="{{target}}" value="{{contributed}}" min="0" step="1"></td>
+          <td style="text-align:right" class="{{status_class}}" id="status-{key}">{{status_text}}</td>
+          <td style="width:140px"><div class="mini-progress"><div class="mini-fill {{fill_cls}}" id="progress-{key}" style="width:{{fill_pct}}%"></div></div></td>
         </tr>'''
-
-    # Data for donut chart (allocation)
-    buckets_json = json.dumps(buckets).replace("</", "<\\/")
-    targets_json = json.dumps({b: targets.get(b, {}).get("target", 0) for b in buckets}).replace("</", "<\\/")
-
-    # Daily change calculation - compare to 24 hours ago (yesterday's date), not last entry
-    yesterday_str = (datetime.now() - __import__('datetime').timedelta(days=1)).strftime("%Y-%m-%d")
-    prev_total = None
-    # Find the most recent snapshot from yesterday (or earlier if none from yesterday)
-    for entry in reversed(price_history):
-        entry_date = entry.get("date", "")[:10]
-        if entry_date <= yesterday_str:
-            prev_total = entry.get("total")
-            break
-    if prev_total is None and len(price_history) >= 2:
-        prev_total = price_history[0]["total"]  # fallback to oldest entry
-    if prev_total is None:
-        prev_total = total
-    daily_change = total - prev_total if prev_total else 0
-    daily_change_pct = (daily_change / prev_total * 100) if prev_total else 0
-
-    # Crypto prices for market pulse
-    btc_price = crypto_prices.get("BTC", 0)
-    eth_price = crypto_prices.get("ETH", 0)
-    spy_price = stock_prices.get("SPY", 0)
-    dxy_price = stock_prices.get("DX=F", 0)
-    vix_price = stock_prices.get("^VIX", 0)
-    oil_price = stock_prices.get("CL=F", 0)
-    copper_price = stock_prices.get("HG=F", 0)
-    gold_oil_ratio = gold_price / oil_price if gold_price and oil_price else None
-    gold_oil_s = f"{gold_oil_ratio:.1f}" if gold_oil_ratio is not None else "N/A"
-
-    # ── Market Pulse Cards (built-in + custom) ──
-    default_pulse_cards = [
-        {"id": "gold", "label": "Gold", "value": gold_price, "fmt": "dollar0", "color": "gold", "spark": "GC=F"},
-        {"id": "silver", "label": "Silver", "value": silver_price, "fmt": "dollar2", "color": "silver", "spark": "SI=F"},
-        {"id": "au_ag", "label": "Au/Ag Ratio", "value": gs_ratio_s, "fmt": "raw"},
-        {"id": "dxy", "label": "DXY", "value": dxy_price, "fmt": "dollar2_nodollar", "spark": "DX=F"},
-        {"id": "vix", "label": "VIX", "value": vix_price, "fmt": "dollar2_nodollar", "spark": "^VIX"},
-        {"id": "oil", "label": "Oil", "value": oil_price, "fmt": "dollar2", "spark": "CL=F"},
-        {"id": "gold_oil", "label": "Gold/Oil", "value": round(gold_oil_ratio, 2) if gold_oil_ratio else 0, "fmt": "raw2"},
-        {"id": "copper", "label": "Copper", "value": copper_price, "fmt": "dollar2", "spark": "HG=F"},
-        {"id": "tnx_10y", "label": "10Y Yield", "value": tnx_10y_s, "fmt": "raw"},
-        {"id": "tnx_2y", "label": "2Y Yield", "value": tnx_2y_s, "fmt": "raw"},
-        {"id": "btc", "label": "BTC", "value": btc_price, "fmt": "dollar0", "spark": "BTC-USD"},
-        {"id": "spy", "label": "SPY", "value": spy_price, "fmt": "dollar2", "spark": "SPY"},
-    ]
-    # Custom pulse cards from config
-    custom_pulse = config.get("custom_pulse_cards", [])
-    for cp in custom_pulse:
-        ticker = cp.get("ticker", "").upper()
-        label = cp.get("label", ticker)
-        ptype = cp.get("type", "stock")
-        src = crypto_prices if ptype == "crypto" else stock_prices
-        price = src.get(ticker) or 0
-        default_pulse_cards.append({
-            "id": f"custom-{ticker}",
-            "label": label,
-            "value": price,
-            "fmt": "dollar2",
-            "spark": ticker,
-            "custom": True,
-            "ticker": ticker,
-            "ptype": ptype,
-        })
-
-    # Filter out hidden cards
-    hidden_cards = config.get("hidden_pulse_cards", [])
-    visible_cards = [c for c in default_pulse_cards if c["id"] not in hidden_cards]
-    hidden_count = len(default_pulse_cards) - len(visible_cards)
-
-    # Pulse card order from config
-    pulse_order = config.get("pulse_card_order", [])
-    if pulse_order:
-        ordered = []
-        for pid in pulse_order:
-            for card in visible_cards:
-                if card["id"] == pid:
-                    ordered.append(card)
-                    break
-        # Add any cards not in the saved order (new defaults)
-        for card in visible_cards:
-            if card not in ordered:
-                ordered.append(card)
-        pulse_cards = ordered
-    else:
-        pulse_cards = visible_cards
-
-    # Build pulse HTML
-    pulse_html = ""
-    for pc in pulse_cards:
-        pid = pc["id"]
-        label = pc["label"]
-        fmt = pc["fmt"]
-        val = pc["value"]
-        color_class = f' {pc["color"]}' if pc.get("color") else ""
-        spark_id = pc.get("spark", "")
-
-        if not isinstance(val, (int, float)) or val == 0:
-            val_s = "N/A"
-        elif fmt == "dollar0":
-            val_s = f"${val:,.0f}"
-        elif fmt == "dollar1":
-            val_s = f"${val:,.1f}"
-        elif fmt == "dollar2":
-            val_s = f"${val:,.2f}"
-        elif fmt == "dollar2_nodollar":
-            val_s = f"{val:,.2f}"
-        else:
-            val_s = str(val)
-
-        remove_btn = f'<button type="button" class="pulse-remove" onclick="removePulseCard(\'{pid}\')" title="Remove">&times;</button>'
-        spark_canvas = f'<canvas class="pulse-spark" id="spark-{spark_id.replace("=", "-")}"></canvas>' if spark_id else ""
-        data_type = f' data-pulse-type="{pc.get("ptype", "stock")}"' if pc.get("custom") else ""
-
-        pulse_html += f'''<div class="pulse-item" draggable="true" data-pulse-id="{pid}"{data_type}>
-      {remove_btn}
-      <span class="pulse-label">{label}</span>
-      <span class="pulse-price{color_class}" data-pulse-price="{pid}">{val_s}</span>
-      {spark_canvas}
-    </div>'''
-
-    pulse_cards_json = json.dumps([{"id": c["id"], "label": c.get("label"), "spark": c.get("spark", "")} for c in pulse_cards]).replace("</", "<\\/")
-    custom_pulse_json = json.dumps(custom_pulse).replace("</", "<\\/")
-
-    # Auto-refresh settings (pre-compute for template)
-    auto_refresh_cfg = config.get("auto_refresh", {})
-    auto_enabled = auto_refresh_cfg.get("enabled", True)
-    auto_interval = auto_refresh_cfg.get("interval_minutes", 15)
-    auto_dot_class = "on" if auto_enabled else "off"
-    auto_checked = "checked" if auto_enabled else ""
-    auto_sel_5 = "selected" if auto_interval == 5 else ""
-    auto_sel_10 = "selected" if auto_interval == 10 else ""
-    auto_sel_15 = "selected" if auto_interval == 15 else ""
-    auto_sel_30 = "selected" if auto_interval == 30 else ""
-    auto_sel_60 = "selected" if auto_interval == 60 else ""
-    auto_sel_120 = "selected" if auto_interval == 120 else ""
-    auto_sel_240 = "selected" if auto_interval == 240 else ""
-
-    # Widget order (pre-compute for template)
-    widget_order = config.get("widget_order", {})
-    widget_order_json = json.dumps(widget_order).replace("</", "<\\/")
-
-    # Phase 2: Rebalancing recommendations
-    # Only compare controllable buckets against targets. Exclude uncontrollable managed/retirement accounts.
-    rebal_rows_html = ""
-    if total > 0:
-        for bucket, value in buckets.items():
-            tgt_data = targets.get(bucket, {})
-            tgt = tgt_data.get("target", 0)
-            if tgt == 0:
-                continue  # skip buckets with no target
-            pct = 100 * value / total
-            drift = pct - tgt
-            tgt_min = tgt_data.get("min", tgt)
-            tgt_max = tgt_data.get("max", tgt)
-            # Only flag if outside the min/max range (not just > 2% drift)
-            if pct < tgt_min or pct > tgt_max:
-                target_value = total * tgt / 100
-                diff_val = target_value - value
-                action = "Buy" if diff_val > 0 else "Trim"
-                drift_class = "shortage" if diff_val > 0 else "surplus"
-                rebal_rows_html += f'<tr><td>{bucket}</td><td class="mono">{pct:.1f}%</td><td class="mono">{tgt}% ({tgt_min}-{tgt_max})</td><td class="mono {drift_class}">{drift:+.1f}%</td><td class="mono">${abs(diff_val):,.0f}</td><td class="{drift_class}">{action}</td></tr>'
-
-    # Phase 2: Transaction data for budget
-    transactions = config.get("transactions", [])
-    transactions_json = json.dumps(transactions).replace("</", "<\\/")
-
-    # Recurring transactions
-    recurring = config.get("recurring_transactions", [])
-    recurring_json = json.dumps(recurring).replace("</", "<\\/")
-    recurring_rows_html = ""
-    for i, rt in enumerate(recurring):
-        recurring_rows_html += f'<tr><td>{rt.get("name","")}</td><td class="mono">${rt.get("amount",0):,.2f}</td><td>{rt.get("category","Other")}</td><td>{rt.get("frequency","monthly")}</td><td><button type="button" class="secondary" style="padding:2px 8px;font-size:0.7rem;" onclick="deleteRecurring({i})">x</button></td></tr>'
-
-    # Dividend/fee tracking
-    dividends = config.get("dividends", [])
-    dividends_json = json.dumps(dividends[-100:]).replace("</", "<\\/")
-    div_rows_html = ""
-    for d in reversed(dividends[-30:]):
-        dtype = d.get("type", "dividend")
-        color = "var(--success)" if dtype == "dividend" else "var(--danger)"
-        sign = "+" if dtype == "dividend" else "-"
-        div_rows_html += f'<tr><td class="mono">{d.get("date","")}</td><td>{d.get("ticker","")}</td><td style="color:{color}" class="mono">{sign}${d.get("amount",0):,.2f}</td><td>{dtype.title()}</td><td class="hint">{d.get("note","")}</td></tr>'
-
-    # Phase 2: Monthly spending history (last 6 months)
-    spending_history = config.get("spending_history", {})
-    spending_json = json.dumps(spending_history).replace("</", "<\\/")
-
-    # Phase 3: Price alerts
-    price_alerts = config.get("price_alerts", [])
-    alerts_json = json.dumps(price_alerts).replace("</", "<\\/")
-
-    # Phase 3: Projected growth data
-    monthly_contribution = total_target  # from investment tracker
-    projection_data = {"current": total, "monthly_contrib": monthly_contribution}
-    projection_json = json.dumps(projection_data).replace("</", "<\\/")
-
-    # Phase 3: Tax-loss harvesting - find unrealized losses
-    tlh_rows_html = ""
-    for i, h in enumerate(cfg_holdings):
-        ticker = h.get("ticker", "")
-        qty = h.get("qty") or 0
-        vo = h.get("value_override") or 0
-        live_price = stock_prices.get(ticker) or crypto_prices.get(ticker)
-        if live_price and qty and vo:
-            cost_basis_per = vo / qty if qty else 0
-            unrealized = (live_price - cost_basis_per) * qty
-            if unrealized < -50:  # Only show losses > $50
-                tlh_rows_html += f'<tr><td>{ticker}</td><td class="mono">{qty:.3f}</td><td class="mono">${cost_basis_per:,.2f}</td><td class="mono">${live_price:,.2f}</td><td class="mono danger">${unrealized:,.0f}</td></tr>'
-
-    # Pre-build conditional HTML blocks (can't nest f-strings)
-    # Rebalancing card removed (redundant with Allocation vs Target table)
-
-    tlh_card_html = f"""<div class="card">
-    <div class="card-title">Tax-Loss Harvesting Opportunities</div>
-    <p class="hint" style="margin-bottom:10px;">Holdings with unrealized losses &gt; $50 (based on import value vs live price)</p>
-    <table>
-      <thead><tr><th>Ticker</th><th>Qty</th><th>Cost Basis</th><th>Current</th><th>Unrealized P&amp;L</th></tr></thead>
-      <tbody>{tlh_rows_html}</tbody>
-    </table>
-  </div>""" if tlh_rows_html else ""
-
-    txn_cat_options = "".join(f'<option value="{c.get("name","")}">{c.get("name","")}</option>' for c in categories)
-    txn_date_val = datetime.now().strftime("%Y-%m-%d")
-
-    # Pre-computed JS data
-    holdings_tickers_json = json.dumps([h.get("ticker","") for h in cfg_holdings]).replace("</","<\\/")
-    # Quick-access tickers for Technical Analysis (user's holdings + market staples)
-    _skip_ta = {"SPAXX", "FZROX", "FXNAX"}  # money-market / non-tradable
-    ta_tickers = list(dict.fromkeys([h.get("ticker","").upper() for h in cfg_holdings if h.get("ticker","") and h.get("ticker","").upper() not in _skip_ta]))
-    for _mkt in ["SPY", "QQQ", "DIA", "GLD", "SLV", "BTCUSD", "ETHUSD", "DXY", "TLT", "VIX"]:
-        if _mkt not in ta_tickers:
-            ta_tickers.append(_mkt)
-    ta_tickers_json = json.dumps(ta_tickers).replace("</","<\\/")
-    budget_cats_json = json.dumps([c.get("name","") for c in categories]).replace("</","<\\/")
-    budget_limits_json = json.dumps({c.get("name",""): float(c.get("limit",0) or 0) for c in categories}).replace("</","<\\/")
-    num_holdings = len(cfg_holdings)
-
-    # ── AI Insights: generate natural language summary ──
-    # ── Goal Tracking data ──
-    goals = config.get("financial_goals", [])
-    goals_json = json.dumps(goals).replace("</", "<\\/")
-    goals_html = ""
-    for gi, g in enumerate(goals):
-        g_name = g.get("name", "Goal")
-        g_target = g.get("target", 0)
-        g_current = g.get("current", 0)
-        g_pct = int(g_current / g_target * 100) if g_target > 0 else 0
-        g_color = "done" if g_pct >= 100 else ("mid" if g_pct >= 40 else "low")
-        g_remaining = max(g_target - g_current, 0)
-        goals_html += f'''<div class="goal-card">
-          <div style="display:flex;justify-content:space-between;align-items:center;margin-bottom:6px;">
-            <strong>{g_name}</strong>
-            <button type="button" class="secondary" style="padding:2px 8px;font-size:0.65rem;" onclick="deleteGoal({gi})">x</button>
-          </div>
-          <div style="display:flex;justify-content:space-between;font-size:0.82rem;margin-bottom:4px;">
-            <span class="mono">${g_current:,.0f}</span>
-            <span class="hint">of ${g_target:,.0f}</span>
-          </div>
-          <div class="mini-progress"><div class="mini-fill {g_color}" style="width:{min(g_pct, 100)}%"></div></div>
-          <div style="display:flex;justify-content:space-between;margin-top:4px;font-size:0.75rem;">
-            <span class="hint">{g_pct}%</span>
-            <span class="hint">${g_remaining:,.0f} to go</span>
-          </div>
-        </div>'''
-
-    # ── Performance Attribution data ──
-    perf_data = []
-    if len(price_history) >= 2:
-        first_snap = price_history[0]
-        last_snap = price_history[-1]
-        first_total = first_snap.get("total", 0)
-        if first_total > 0:
-            overall_return = ((total - first_total) / first_total) * 100
-        else:
-            overall_return = 0
-    else:
-        overall_return = 0
-    perf_json = json.dumps({"buckets": {b: round(v, 2) for b, v in buckets.items()}, "total": round(total, 2), "overall_return": round(overall_return, 2)}).replace("</", "<\\/")
-
-    saved_msg = f'<div class="toast" id="toast-msg">{saved}. Changes logged to Excel History.</div>' if saved else ""
-
-    change_sign = "+" if daily_change >= 0 else ""
-    change_color = "pos" if daily_change >= 0 else "neg"
-
-    demo_banner = ""
-    if demo_mode:
-        demo_banner = ('<div style="position:fixed;top:0;left:0;right:0;z-index:10000;background:linear-gradient(90deg,#d4a017,#f0c040);'
-                       'color:#09090b;text-align:center;padding:8px 16px;font-size:0.85rem;font-weight:600;letter-spacing:0.02em;">'
-                       'Live Demo: sample data shown. Write operations disabled. '
-                       '<a href="https://github.com/curtisboortz/nickel-and-dime" target="_blank" '
-                       'style="color:#09090b;text-decoration:underline;margin-left:8px;">View on GitHub</a>'
-                       '</div><style>.sidebar{top:36px !important;height:calc(100vh - 36px) !important;}'
-                       '.main-content{padding-top:36px !important;}</style>')
-
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>Nickel&amp;Dime</title>
-<link rel="icon" type="image/x-icon" href="/favicon.ico">
-<link rel="apple-touch-icon" sizes="180x180" href="/apple-touch-icon.png">
-<link rel="manifest" href="/manifest.json">
-<meta name="theme-color" content="#09090b">
-<script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
-<script src="https://cdn.jsdelivr.net/npm/luxon@3.4.4/build/global/luxon.min.js"></script>
-<script src="https://cdn.jsdelivr.net/npm/chartjs-adapter-luxon@1.3.1/dist/chartjs-adapter-luxon.umd.min.js"></script>
-<script src="https://cdn.jsdelivr.net/npm/chartjs-chart-financial@0.2.1/dist/chartjs-chart-financial.min.js"></script>
-<script src="https://cdn.jsdelivr.net/npm/hammerjs@2.0.8/hammer.min.js"></script>
-<script src="https://cdn.jsdelivr.net/npm/chartjs-plugin-zoom@2.0.1/dist/chartjs-plugin-zoom.min.js"></script>
-<link rel="preconnect" href="https://fonts.googleapis.com">
-<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-<link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500;600;700&display=swap" rel="stylesheet">
-<style>
-:root {{
+_INV_ROW_TMPLS = tuple(
+    (key, name, _INV_ROW_SHELL.format(key=key, name=name))
+    for key, name in _INV_CATEGORIES
+)
+
+# Static shape of the built-in Market Pulse cards: (id, label, fmt, color,
+# spark). Only each card's live value changes per render; None means the
+# card has no color class / sparkline.
+def _minify_css(css: str) -> str:
+    """Strip comments, indentation and blank lines from a stylesheet.
+
+    Deliberately conservative — it never touches whitespace inside a line, so
+    strings in content:"" and data URIs survive untouched.
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    return "\n".join(line.strip() for line in css.splitlines() if line.strip())
+
+
+# The dashboard stylesheet never changes between requests, so it lives at
+# module scope as a plain string instead of being re-built (and having its
+# doubled braces re-scanned) inside the page f-string on every render.
+# Both blocks are minified once at import (see the _minify_css calls below).
+_DASHBOARD_CSS = """<style>
+:root {
   --bg-primary: #09090b;
   --bg-secondary: #111114;
   --bg-card: #161619;
@@ -827,10 +360,10 @@ def render_dashboard(data: dict, saved: str = "", active_tab: str = "summary", d
   --sidebar-w: 72px;
   --radius: 12px;
   --mono: 'JetBrains Mono', monospace;
-}}
-*{{ box-sizing:border-box; margin:0; padding:0; }}
-html {{ scroll-behavior:smooth; }}
-body {{
+}
+*{ box-sizing:border-box; margin:0; padding:0; }
+html { scroll-behavior:smooth; }
+body {
   font-family:'Inter',-apple-system,BlinkMacSystemFont,sans-serif;
   background:var(--bg-primary);
   color:var(--text-primary);
@@ -838,9 +371,9 @@ body {{
   line-height:1.6;
   -webkit-font-smoothing:antialiased;
   display:flex;
-}}
+}
 /* ── Sidebar ── */
-.sidebar {{
+.sidebar {
   position:fixed; left:0; top:0; bottom:0;
   width:var(--sidebar-w);
   background:var(--bg-secondary);
@@ -848,114 +381,114 @@ body {{
   display:flex; flex-direction:column; align-items:center;
   padding:20px 0; z-index:100;
   transition:width 0.2s ease;
-}}
-.sidebar-logo {{
+}
+.sidebar-logo {
   width:40px; height:40px;
   border-radius:10px;
   margin-bottom:32px;
   flex-shrink:0;
   overflow:hidden;
-}}
-.sidebar-logo img {{
+}
+.sidebar-logo img {
   width:100%; height:100%; object-fit:cover;
   border-radius:10px;
-}}
-.sidebar-nav {{
+}
+.sidebar-nav {
   display:flex; flex-direction:column; gap:4px;
   flex:1; width:100%; padding:0 12px;
-}}
-.nav-item {{
+}
+.nav-item {
   display:flex; align-items:center; justify-content:center;
   width:48px; height:48px; margin:0 auto;
   border-radius:12px; border:none; background:none;
   color:var(--text-muted); cursor:pointer;
   transition:all 0.2s ease; text-decoration:none;
   position:relative;
-}}
-.nav-item svg {{ width:22px; height:22px; stroke:currentColor; fill:none; stroke-width:1.8; stroke-linecap:round; stroke-linejoin:round; }}
-.nav-item:hover {{ color:var(--text-secondary); background:rgba(255,255,255,0.04); }}
-.nav-item.active {{
+}
+.nav-item svg { width:22px; height:22px; stroke:currentColor; fill:none; stroke-width:1.8; stroke-linecap:round; stroke-linejoin:round; }
+.nav-item:hover { color:var(--text-secondary); background:rgba(255,255,255,0.04); }
+.nav-item.active {
   color:var(--accent-primary);
   background:var(--accent-glow);
-}}
-.nav-item.active::before {{
+}
+.nav-item.active::before {
   content:''; position:absolute; left:-12px; top:50%; transform:translateY(-50%);
   width:3px; height:24px; border-radius:0 3px 3px 0;
   background:var(--accent-primary);
-}}
-.nav-item .tooltip {{
+}
+.nav-item .tooltip {
   position:absolute; left:calc(100% + 12px); top:50%; transform:translateY(-50%);
   background:#1e1e24; color:var(--text-primary); font-size:0.8rem; font-weight:500;
   padding:6px 12px; border-radius:8px; white-space:nowrap;
   pointer-events:none; opacity:0; transition:opacity 0.15s ease;
   border:1px solid var(--border-subtle);
   box-shadow:0 4px 12px rgba(0,0,0,0.4);
-}}
-.nav-item:hover .tooltip {{ opacity:1; }}
-.sidebar-bottom {{
+}
+.nav-item:hover .tooltip { opacity:1; }
+.sidebar-bottom {
   padding:0 12px; width:100%;
   display:flex; flex-direction:column; align-items:center; gap:8px;
-}}
-.refresh-btn {{
+}
+.refresh-btn {
   width:48px; height:48px; border-radius:12px;
   background:linear-gradient(135deg, var(--accent-primary), var(--accent-secondary));
   border:none; cursor:pointer; color:#09090b;
   display:flex; align-items:center; justify-content:center;
   transition:all 0.2s ease;
   box-shadow:0 2px 8px var(--accent-glow);
-}}
-.refresh-btn svg {{ width:20px; height:20px; stroke:currentColor; fill:none; stroke-width:2; stroke-linecap:round; stroke-linejoin:round; }}
-.refresh-btn:hover {{ transform:translateY(-1px); box-shadow:0 4px 16px var(--accent-glow); }}
+}
+.refresh-btn svg { width:20px; height:20px; stroke:currentColor; fill:none; stroke-width:2; stroke-linecap:round; stroke-linejoin:round; }
+.refresh-btn:hover { transform:translateY(-1px); box-shadow:0 4px 16px var(--accent-glow); }
 /* ── Auto-refresh Indicator ── */
-.auto-refresh-indicator {{
+.auto-refresh-indicator {
   display:flex; align-items:center; gap:5px; cursor:pointer;
   padding:4px 8px; border-radius:6px;
   transition:background 0.15s;
   position:relative;
-}}
-.auto-refresh-indicator:hover {{ background:rgba(255,255,255,0.05); }}
-.auto-dot {{
+}
+.auto-refresh-indicator:hover { background:rgba(255,255,255,0.05); }
+.auto-dot {
   width:7px; height:7px; border-radius:50%;
   transition:background 0.3s;
-}}
-.auto-dot.on {{ background:#34d399; box-shadow:0 0 6px rgba(52,211,153,0.5); }}
-.auto-dot.off {{ background:#64748b; }}
-.auto-label {{ font-size:0.6rem; color:var(--text-muted); font-family:var(--mono); }}
-.auto-popover {{
+}
+.auto-dot.on { background:#34d399; box-shadow:0 0 6px rgba(52,211,153,0.5); }
+.auto-dot.off { background:#64748b; }
+.auto-label { font-size:0.6rem; color:var(--text-muted); font-family:var(--mono); }
+.auto-popover {
   position:absolute; left:calc(100% + 16px); bottom:-8px;
   background:var(--bg-card); border:1px solid var(--border-accent);
   border-radius:var(--radius); padding:14px; width:180px;
   box-shadow:0 8px 24px rgba(0,0,0,0.4); z-index:200;
   margin-bottom:8px;
-}}
-.auto-popover-title {{
+}
+.auto-popover-title {
   font-size:0.75rem; font-weight:600; color:var(--text-primary);
   margin-bottom:10px; text-transform:uppercase; letter-spacing:0.05em;
-}}
-.auto-toggle-row {{
+}
+.auto-toggle-row {
   display:flex; justify-content:space-between; align-items:center;
   margin-bottom:8px; font-size:0.75rem; color:var(--text-secondary);
-}}
-.auto-toggle-row select {{
+}
+.auto-toggle-row select {
   background:var(--bg-input); border:1px solid var(--border-subtle);
   color:var(--text-primary); border-radius:4px; padding:3px 6px;
   font-size:0.7rem; font-family:var(--mono);
-}}
-.auto-toggle-row input[type="checkbox"] {{
+}
+.auto-toggle-row input[type="checkbox"] {
   accent-color:var(--accent-primary); width:16px; height:16px;
-}}
+}
 /* ── Main Content ── */
-.main-content {{
+.main-content {
   margin-left:var(--sidebar-w);
   flex:1; padding:28px 36px;
   max-width:1400px;
   min-height:100vh;
-}}
-.tab {{ display:none; animation:fadeIn 0.25s ease; }}
-.tab.active {{ display:block; }}
-@keyframes fadeIn {{ from{{ opacity:0; transform:translateY(6px); }} to{{ opacity:1; transform:translateY(0); }} }}
+}
+.tab { display:none; animation:fadeIn 0.25s ease; }
+.tab.active { display:block; }
+@keyframes fadeIn { from{ opacity:0; transform:translateY(6px); } to{ opacity:1; transform:translateY(0); } }
 /* ── Toast ── */
-.toast {{
+.toast {
   position:fixed; top:20px; right:20px; z-index:200;
   background:var(--success-glow); color:var(--success);
   padding:14px 20px; border-radius:var(--radius);
@@ -963,141 +496,141 @@ body {{
   font-weight:500; font-size:0.9rem;
   animation:slideIn 0.3s ease, fadeOut 0.5s ease 3s forwards;
   box-shadow:0 4px 20px rgba(0,0,0,0.3);
-}}
-@keyframes slideIn {{ from{{ transform:translateX(100px); opacity:0; }} to{{ transform:translateX(0); opacity:1; }} }}
-@keyframes fadeOut {{ to{{ opacity:0; transform:translateY(-10px); }} }}
+}
+@keyframes slideIn { from{ transform:translateX(100px); opacity:0; } to{ transform:translateX(0); opacity:1; } }
+@keyframes fadeOut { to{ opacity:0; transform:translateY(-10px); } }
 /* ── Hero / Net Worth ── */
-.hero-row {{
+.hero-row {
   display:flex; gap:24px; align-items:stretch; margin-bottom:24px; flex-wrap:wrap;
-}}
-.hero-row .hero {{ flex:0 0 auto; min-width:220px; margin-bottom:0; }}
-.hero-chart-card {{ display:flex; flex-direction:column; }}
-.hero-chart-card .card-title {{ margin-bottom:8px; }}
-.hero {{
+}
+.hero-row .hero { flex:0 0 auto; min-width:220px; margin-bottom:0; }
+.hero-chart-card { display:flex; flex-direction:column; }
+.hero-chart-card .card-title { margin-bottom:8px; }
+.hero {
   margin-bottom:24px;
-}}
-.hero-label {{
+}
+.hero-label {
   font-size:0.7rem; font-weight:600; text-transform:uppercase;
   letter-spacing:0.12em; color:var(--text-muted); margin-bottom:6px;
-}}
-.hero-value {{
+}
+.hero-value {
   font-family:var(--mono);
   font-size:2.8rem; font-weight:700;
   background:linear-gradient(135deg, var(--accent-secondary), var(--accent-primary));
   -webkit-background-clip:text; -webkit-text-fill-color:transparent;
   background-clip:text; letter-spacing:-0.02em;
   line-height:1.1;
-}}
-.hero-change {{
+}
+.hero-change {
   display:inline-flex; align-items:center; gap:6px;
   margin-top:8px; padding:5px 12px;
   border-radius:20px; font-size:0.85rem; font-weight:600;
   font-family:var(--mono);
-}}
-.hero-change.pos {{ background:rgba(52,211,153,0.1); color:var(--success); }}
-.hero-change.neg {{ background:rgba(248,113,113,0.1); color:var(--danger); }}
-.hero-meta {{
+}
+.hero-change.pos { background:rgba(52,211,153,0.1); color:var(--success); }
+.hero-change.neg { background:rgba(248,113,113,0.1); color:var(--danger); }
+.hero-meta {
   margin-top:8px; font-size:0.8rem; color:var(--text-muted);
-}}
+}
 /* ── Market Pulse ── */
-.pulse-bar {{
+.pulse-bar {
   display:flex; gap:12px; margin-bottom:28px;
   overflow-x:auto; padding-bottom:4px;
   -webkit-overflow-scrolling:touch;
-}}
-.pulse-item {{
+}
+.pulse-item {
   flex:0 0 auto; min-width:130px; max-width:160px; height:110px; position:relative;
   background:var(--bg-card); border:1px solid var(--border-subtle);
   border-radius:var(--radius); padding:14px 16px;
   display:flex; flex-direction:column; gap:6px; justify-content:flex-start;
   transition:border-color 0.2s ease, opacity 0.2s ease, transform 0.15s ease;
   cursor:grab; box-sizing:border-box;
-}}
-.pulse-item:active {{ cursor:grabbing; }}
-.pulse-item:hover {{ border-color:var(--border-accent); }}
-.pulse-item.dragging {{ opacity:0.4; transform:scale(0.95); }}
-.pulse-item.drag-over {{ border-color:var(--accent-primary); box-shadow:0 0 0 1px var(--accent-primary); }}
-.pulse-item.pulse-add {{
+}
+.pulse-item:active { cursor:grabbing; }
+.pulse-item:hover { border-color:var(--border-accent); }
+.pulse-item.dragging { opacity:0.4; transform:scale(0.95); }
+.pulse-item.drag-over { border-color:var(--accent-primary); box-shadow:0 0 0 1px var(--accent-primary); }
+.pulse-item.pulse-add {
   cursor:pointer; align-items:center; justify-content:center;
   border-style:dashed; min-width:100px; opacity:0.5;
   transition:opacity 0.2s ease;
-}}
-.pulse-item.pulse-add:hover {{ opacity:1; border-color:var(--accent-primary); }}
-.pulse-remove {{
+}
+.pulse-item.pulse-add:hover { opacity:1; border-color:var(--accent-primary); }
+.pulse-remove {
   position:absolute; top:4px; right:6px;
   background:none; border:none; color:var(--text-muted); cursor:pointer;
   font-size:0.9rem; line-height:1; opacity:0; transition:opacity 0.15s;
   padding:2px 4px;
-}}
-.pulse-item:hover .pulse-remove {{ opacity:0.6; }}
-.pulse-remove:hover {{ opacity:1; color:var(--danger); }}
-.pulse-label {{ font-size:0.7rem; text-transform:uppercase; letter-spacing:0.08em; color:var(--text-muted); font-weight:600; }}
-.pulse-price {{ font-family:var(--mono); font-size:1.05rem; font-weight:600; color:var(--text-primary); }}
-.pulse-price.gold {{ color:var(--gold); }}
-.pulse-price.silver {{ color:var(--silver); }}
-.pulse-spark {{ height:40px; margin-top:auto; }}
+}
+.pulse-item:hover .pulse-remove { opacity:0.6; }
+.pulse-remove:hover { opacity:1; color:var(--danger); }
+.pulse-label { font-size:0.7rem; text-transform:uppercase; letter-spacing:0.08em; color:var(--text-muted); font-weight:600; }
+.pulse-price { font-family:var(--mono); font-size:1.05rem; font-weight:600; color:var(--text-primary); }
+.pulse-price.gold { color:var(--gold); }
+.pulse-price.silver { color:var(--silver); }
+.pulse-spark { height:40px; margin-top:auto; }
 /* ── Chart Toggle ── */
-.chart-toggle {{
+.chart-toggle {
   background:var(--bg-input); border:1px solid var(--border-subtle); color:var(--text-muted);
   width:28px; height:24px; border-radius:4px; cursor:pointer; font-size:0.85rem;
   display:flex; align-items:center; justify-content:center; padding:0;
   transition:all 0.15s ease;
-}}
-.chart-toggle:hover {{ border-color:var(--border-accent); color:var(--text-secondary); }}
-.chart-toggle.active {{ background:var(--accent-primary); border-color:var(--accent-primary); color:var(--bg-primary); }}
+}
+.chart-toggle:hover { border-color:var(--border-accent); color:var(--text-secondary); }
+.chart-toggle.active { background:var(--accent-primary); border-color:var(--accent-primary); color:var(--bg-primary); }
 /* ── Card ── */
-.card {{
+.card {
   background:var(--bg-card);
   border:1px solid var(--border-subtle);
   border-radius:var(--radius); padding:20px;
   margin-bottom:16px;
   transition:border-color 0.2s ease;
-}}
-.card:hover {{ border-color:var(--border-accent); }}
-.card-title {{
+}
+.card:hover { border-color:var(--border-accent); }
+.card-title {
   font-size:0.7rem; font-weight:600; text-transform:uppercase;
   letter-spacing:0.1em; color:var(--text-muted); margin-bottom:14px;
-}}
-.card-header {{
+}
+.card-header {
   display:flex; justify-content:space-between; align-items:center;
   margin-bottom:14px;
-}}
-.card-header .card-title {{ margin-bottom:0; }}
-.card-subtitle {{
+}
+.card-header .card-title { margin-bottom:0; }
+.card-subtitle {
   font-size:0.8rem; color:var(--text-muted); margin-top:3px;
-}}
+}
 /* ── Summary Grid ── */
-.summary-grid {{
+.summary-grid {
   display:grid;
   grid-template-columns:1fr 1fr;
   gap:16px;
-}}
+}
 /* ── Tables ── */
-table {{
+table {
   width:100%; border-collapse:separate; border-spacing:0;
-}}
-th {{
+}
+th {
   color:var(--text-muted); font-size:0.65rem; font-weight:600;
   text-transform:uppercase; letter-spacing:0.08em;
   padding:10px 14px; text-align:left;
   border-bottom:1px solid var(--border-subtle);
   position:sticky; top:0; background:var(--bg-card); z-index:1;
-}}
-td {{
+}
+td {
   padding:12px 14px;
   border-bottom:1px solid rgba(255,255,255,0.03);
   font-size:0.88rem;
-}}
-tbody tr {{ transition:background 0.15s ease; }}
-tbody tr:nth-child(even) {{ background:rgba(255,255,255,0.015); }}
-tbody tr:hover {{ background:rgba(212,160,23,0.04); }}
-tr:last-child td {{ border-bottom:none; }}
-.mono {{ font-family:var(--mono); font-size:0.85rem; }}
-.over {{ color:var(--danger); font-weight:500; }}
-.under {{ color:var(--success); font-weight:500; }}
-.ok {{ color:var(--text-muted); }}
+}
+tbody tr { transition:background 0.15s ease; }
+tbody tr:nth-child(even) { background:rgba(255,255,255,0.015); }
+tbody tr:hover { background:rgba(212,160,23,0.04); }
+tr:last-child td { border-bottom:none; }
+.mono { font-family:var(--mono); font-size:0.85rem; }
+.over { color:var(--danger); font-weight:500; }
+.under { color:var(--success); font-weight:500; }
+.ok { color:var(--text-muted); }
 /* ── Inputs ── */
-input, select {{
+input, select {
   padding:9px 12px;
   background:var(--bg-input);
   border:1px solid var(--border-subtle);
@@ -1105,20 +638,20 @@ input, select {{
   border-radius:8px; width:100%;
   font-family:inherit; font-size:0.88rem;
   transition:all 0.2s ease;
-}}
-select {{ cursor:pointer; }}
-select option {{ background:var(--bg-input); color:var(--text-primary); }}
-input:focus, select:focus {{
+}
+select { cursor:pointer; }
+select option { background:var(--bg-input); color:var(--text-primary); }
+input:focus, select:focus {
   outline:none;
   border-color:var(--accent-primary);
   box-shadow:0 0 0 3px var(--accent-glow);
-}}
-input.num {{
+}
+input.num {
   width:110px; text-align:right;
   font-family:var(--mono); font-variant-numeric:tabular-nums;
-}}
+}
 /* ── Buttons ── */
-button {{
+button {
   padding:10px 20px;
   background:var(--accent-primary);
   color:#09090b; border:none;
@@ -1126,359 +659,1312 @@ button {{
   font-family:inherit; font-size:0.88rem; font-weight:600;
   transition:all 0.2s ease;
   box-shadow:0 2px 8px var(--accent-glow);
-}}
-button:hover {{ transform:translateY(-1px); box-shadow:0 4px 16px var(--accent-glow); }}
-button:active {{ transform:translateY(0); }}
-button.secondary {{
+}
+button:hover { transform:translateY(-1px); box-shadow:0 4px 16px var(--accent-glow); }
+button:active { transform:translateY(0); }
+button.secondary {
   background:transparent; color:var(--text-secondary);
   border:1px solid var(--border-subtle); box-shadow:none;
-}}
-button.secondary:hover {{ background:rgba(255,255,255,0.05); color:var(--text-primary); transform:none; }}
-button.success {{
+}
+button.secondary:hover { background:rgba(255,255,255,0.05); color:var(--text-primary); transform:none; }
+button.success {
   background:linear-gradient(135deg,#059669,var(--success));
   color:#fff; box-shadow:0 2px 8px var(--success-glow);
-}}
+}
 /* ── Investment Tracker ── */
-.invest-table {{ width:100%; border-collapse:separate; border-spacing:0; }}
-.invest-table th {{ font-size:0.65rem; padding:8px 12px; }}
-.invest-table td {{ padding:10px 12px; vertical-align:middle; }}
-.invest-table tbody tr {{ transition:background 0.15s; }}
-.invest-table tbody tr:hover {{ background:rgba(212,160,23,0.04); }}
-.contrib-input {{
+.invest-table { width:100%; border-collapse:separate; border-spacing:0; }
+.invest-table th { font-size:0.65rem; padding:8px 12px; }
+.invest-table td { padding:10px 12px; vertical-align:middle; }
+.invest-table tbody tr { transition:background 0.15s; }
+.invest-table tbody tr:hover { background:rgba(212,160,23,0.04); }
+.contrib-input {
   width:90px !important; text-align:right;
   font-family:var(--mono); font-variant-numeric:tabular-nums;
   padding:7px 10px !important; font-size:0.85rem;
-}}
-.shortage {{ color:var(--warning); font-weight:500; font-family:var(--mono); font-size:0.85rem; }}
-.surplus {{ color:var(--success); font-weight:500; font-family:var(--mono); font-size:0.85rem; }}
-.complete {{ color:var(--success); font-weight:500; }}
-.mini-progress {{
+}
+.shortage { color:var(--warning); font-weight:500; font-family:var(--mono); font-size:0.85rem; }
+.surplus { color:var(--success); font-weight:500; font-family:var(--mono); font-size:0.85rem; }
+.complete { color:var(--success); font-weight:500; }
+.mini-progress {
   height:10px; background:rgba(255,255,255,0.04);
   border-radius:5px; overflow:hidden; min-width:100px;
-}}
-.mini-fill {{
+}
+.mini-fill {
   height:100%;
   background:linear-gradient(90deg,var(--accent-primary),var(--accent-secondary));
   border-radius:5px; transition:width 0.3s ease;
-}}
-.mini-fill.low {{ background:linear-gradient(90deg,#ef4444,#f87171); }}
-.mini-fill.mid {{ background:linear-gradient(90deg,#f59e0b,#fbbf24); }}
-.mini-fill.done {{ background:linear-gradient(90deg,#22c55e,#34d399); }}
-.progress-bar {{
+}
+.mini-fill.low { background:linear-gradient(90deg,#ef4444,#f87171); }
+.mini-fill.mid { background:linear-gradient(90deg,#f59e0b,#fbbf24); }
+.mini-fill.done { background:linear-gradient(90deg,#22c55e,#34d399); }
+.progress-bar {
   height:8px; background:rgba(255,255,255,0.04);
   border-radius:4px; overflow:hidden; margin-top:12px;
-}}
-.progress-fill {{
+}
+.progress-fill {
   height:100%;
   background:linear-gradient(90deg,var(--accent-primary),var(--accent-secondary));
   border-radius:4px; transition:width 0.3s ease;
-}}
+}
 /* ── AI Insights ── */
 /* ── Goals ── */
-.goals-grid {{ display:grid; grid-template-columns:repeat(auto-fill, minmax(220px, 1fr)); gap:14px; }}
-.goal-card {{
+.goals-grid { display:grid; grid-template-columns:repeat(auto-fill, minmax(220px, 1fr)); gap:14px; }
+.goal-card {
   padding:14px; background:var(--bg-input); border-radius:var(--radius);
   border:1px solid var(--border-subtle);
-}}
+}
 /* ── Currency Selector ── */
-.currency-select {{
+.currency-select {
   width:auto; padding:4px 8px; font-size:0.72rem; border-radius:6px;
   background:var(--bg-input); color:var(--text-muted); border:1px solid var(--border-subtle);
   cursor:pointer;
-}}
+}
 /* ── Investment Chat ── */
-.invest-chat {{ padding:14px; background:var(--bg-input); border-radius:var(--radius); }}
-.chat-msg {{ padding:4px 0; line-height:1.5; }}
-.chat-msg.ok {{ color:var(--success); }}
-.chat-msg.err {{ color:var(--danger); }}
-.chat-msg .chat-label {{ color:var(--text-muted); font-size:0.75rem; margin-right:6px; }}
+.invest-chat { padding:14px; background:var(--bg-input); border-radius:var(--radius); }
+.chat-msg { padding:4px 0; line-height:1.5; }
+.chat-msg.ok { color:var(--success); }
+.chat-msg.err { color:var(--danger); }
+.chat-msg .chat-label { color:var(--text-muted); font-size:0.75rem; margin-right:6px; }
 /* ── Drag-to-Reorder Widgets ── */
-.widget-card {{ cursor:grab; transition:transform 0.15s, box-shadow 0.15s, opacity 0.15s; }}
-.widget-card:active {{ cursor:grabbing; }}
-.widget-card.dragging {{ opacity:0.4; transform:scale(0.97); }}
-.widget-card.drag-over {{ box-shadow:0 0 0 2px var(--accent-primary); border-radius:var(--radius); }}
-.drag-handle {{ cursor:grab; color:var(--text-muted); margin-right:8px; font-size:0.9rem; opacity:0.4; transition:opacity 0.15s; }}
-.drag-handle:hover {{ opacity:1; }}
+.widget-card { cursor:grab; transition:transform 0.15s, box-shadow 0.15s, opacity 0.15s; }
+.widget-card:active { cursor:grabbing; }
+.widget-card.dragging { opacity:0.4; transform:scale(0.97); }
+.widget-card.drag-over { box-shadow:0 0 0 2px var(--accent-primary); border-radius:var(--radius); }
+.drag-handle { cursor:grab; color:var(--text-muted); margin-right:8px; font-size:0.9rem; opacity:0.4; transition:opacity 0.15s; }
+.drag-handle:hover { opacity:1; }
 /* ── Misc ── */
-.label {{ font-size:0.7rem; font-weight:600; text-transform:uppercase; letter-spacing:0.08em; color:var(--text-muted); margin-bottom:5px; display:block; }}
-.page-title {{ font-size:1.1rem; font-weight:600; color:var(--text-primary); margin-bottom:4px; }}
-.income-bar {{
+.label { font-size:0.7rem; font-weight:600; text-transform:uppercase; letter-spacing:0.08em; color:var(--text-muted); margin-bottom:5px; display:block; }
+.page-title { font-size:1.1rem; font-weight:600; color:var(--text-primary); margin-bottom:4px; }
+.income-bar {
   background:var(--bg-input); padding:16px; border-radius:var(--radius);
   margin-bottom:20px; display:flex; align-items:center; gap:16px; flex-wrap:wrap;
-}}
-.chart-controls {{
+}
+.chart-controls {
   display:flex; gap:10px; flex-wrap:wrap; align-items:end; margin-bottom:16px;
-}}
-.chart-controls .ctrl-group {{ display:flex; flex-direction:column; gap:4px; }}
-.chart-controls select {{ width:auto; min-width:120px; }}
-.hint {{ font-size:0.78rem; color:var(--text-muted); }}
+}
+.chart-controls .ctrl-group { display:flex; flex-direction:column; gap:4px; }
+.chart-controls select { width:auto; min-width:120px; }
+.hint { font-size:0.78rem; color:var(--text-muted); }
 /* ── Spending Breakdown expand/collapse ── */
-.spend-row {{ cursor:pointer; transition:background 0.15s; border-bottom:1px solid var(--border-subtle); }}
-.spend-row:hover {{ background:var(--bg-card-hover); }}
-.spend-header {{ display:flex; align-items:center; padding:10px 12px; gap:12px; }}
-.spend-chevron {{ font-size:0.65rem; color:var(--text-muted); transition:transform 0.2s; width:14px; text-align:center; flex-shrink:0; }}
-.spend-row.open .spend-chevron {{ transform:rotate(90deg); }}
-.spend-cat {{ flex:1; font-weight:500; font-size:0.88rem; color:var(--text-primary); }}
-.spend-amounts {{ display:flex; align-items:center; gap:10px; font-family:var(--mono); font-size:0.82rem; }}
-.spend-spent {{ color:var(--text-secondary); }}
-.spend-budget {{ color:var(--text-muted); font-size:0.75rem; }}
-.spend-bar-wrap {{ flex:0 0 120px; height:6px; background:var(--bg-input); border-radius:3px; overflow:hidden; }}
-.spend-bar {{ height:100%; border-radius:3px; transition:width 0.3s ease; }}
-.spend-bar.under {{ background:var(--success); }}
-.spend-bar.near {{ background:var(--warning); }}
-.spend-bar.over {{ background:var(--danger); }}
-.spend-details {{ display:none; padding:0 12px 10px 40px; }}
-.spend-row.open .spend-details {{ display:block; }}
-.spend-details table {{ width:100%; font-size:0.78rem; }}
-.spend-details th {{ color:var(--text-muted); font-weight:500; text-align:left; padding:4px 8px; font-size:0.7rem; text-transform:uppercase; letter-spacing:0.05em; }}
-.spend-details td {{ padding:4px 8px; color:var(--text-secondary); }}
-.spend-details td.mono {{ font-family:var(--mono); }}
-.spend-total {{ font-weight:600; padding:12px; display:flex; justify-content:space-between; border-top:2px solid var(--border-subtle); font-size:0.92rem; }}
-.spend-empty {{ text-align:center; padding:32px; color:var(--text-muted); font-size:0.85rem; }}
-.tip-box {{
+.spend-row { cursor:pointer; transition:background 0.15s; border-bottom:1px solid var(--border-subtle); }
+.spend-row:hover { background:var(--bg-card-hover); }
+.spend-header { display:flex; align-items:center; padding:10px 12px; gap:12px; }
+.spend-chevron { font-size:0.65rem; color:var(--text-muted); transition:transform 0.2s; width:14px; text-align:center; flex-shrink:0; }
+.spend-row.open .spend-chevron { transform:rotate(90deg); }
+.spend-cat { flex:1; font-weight:500; font-size:0.88rem; color:var(--text-primary); }
+.spend-amounts { display:flex; align-items:center; gap:10px; font-family:var(--mono); font-size:0.82rem; }
+.spend-spent { color:var(--text-secondary); }
+.spend-budget { color:var(--text-muted); font-size:0.75rem; }
+.spend-bar-wrap { flex:0 0 120px; height:6px; background:var(--bg-input); border-radius:3px; overflow:hidden; }
+.spend-bar { height:100%; border-radius:3px; transition:width 0.3s ease; }
+.spend-bar.under { background:var(--success); }
+.spend-bar.near { background:var(--warning); }
+.spend-bar.over { background:var(--danger); }
+.spend-details { display:none; padding:0 12px 10px 40px; }
+.spend-row.open .spend-details { display:block; }
+.spend-details table { width:100%; font-size:0.78rem; }
+.spend-details th { color:var(--text-muted); font-weight:500; text-align:left; padding:4px 8px; font-size:0.7rem; text-transform:uppercase; letter-spacing:0.05em; }
+.spend-details td { padding:4px 8px; color:var(--text-secondary); }
+.spend-details td.mono { font-family:var(--mono); }
+.spend-total { font-weight:600; padding:12px; display:flex; justify-content:space-between; border-top:2px solid var(--border-subtle); font-size:0.92rem; }
+.spend-empty { text-align:center; padding:32px; color:var(--text-muted); font-size:0.85rem; }
+.tip-box {
   font-size:0.8rem; color:var(--text-muted); margin-top:16px;
   padding:12px; background:var(--bg-input); border-radius:8px;
-}}
-::-webkit-scrollbar {{ width:6px; height:6px; }}
-::-webkit-scrollbar-track {{ background:transparent; }}
-::-webkit-scrollbar-thumb {{ background:rgba(255,255,255,0.08); border-radius:3px; }}
-::-webkit-scrollbar-thumb:hover {{ background:rgba(255,255,255,0.15); }}
+}
+::-webkit-scrollbar { width:6px; height:6px; }
+::-webkit-scrollbar-track { background:transparent; }
+::-webkit-scrollbar-thumb { background:rgba(255,255,255,0.08); border-radius:3px; }
+::-webkit-scrollbar-thumb:hover { background:rgba(255,255,255,0.15); }
 /* ── Light Theme ── */
-html.light {{
+html.light {
   --bg-primary:#f5f5f7; --bg-secondary:#eeeef0; --bg-card:#ffffff; --bg-card-hover:#fafafa;
   --bg-input:#f0f0f2; --border-subtle:rgba(0,0,0,0.08); --border-accent:rgba(212,160,23,0.3);
   --text-primary:#1a1a2e; --text-secondary:#4a4a5a; --text-muted:#7a7a8a;
-}}
-html.light .sidebar {{ background:var(--bg-secondary); border-color:var(--border-subtle); }}
-html.light .sidebar-logo {{ background:var(--bg-card); }}
-html.light input, html.light select {{ background:var(--bg-input); color:var(--text-primary); border-color:var(--border-subtle); }}
-html.light select option {{ background:var(--bg-input); color:var(--text-primary); }}
-html.light .hero-value {{ -webkit-text-fill-color:var(--accent-primary); }}
-html.light .mobile-nav {{ background:var(--bg-secondary); }}
-/* ── Loading Skeleton ── */
-.skeleton {{
-  background:linear-gradient(90deg, rgba(255,255,255,0.04) 25%, rgba(255,255,255,0.08) 50%, rgba(255,255,255,0.04) 75%);
-  background-size:200% 100%; animation:shimmer 1.5s infinite; border-radius:6px;
-}}
-html.light .skeleton {{ background:linear-gradient(90deg, rgba(0,0,0,0.04) 25%, rgba(0,0,0,0.08) 50%, rgba(0,0,0,0.04) 75%); background-size:200% 100%; }}
-@keyframes shimmer {{ 0%{{ background-position:200% 0; }} 100%{{ background-position:-200% 0; }} }}
-/* ── Command Palette ── */
-.cmd-overlay {{
-  display:none; position:fixed; inset:0; background:rgba(0,0,0,0.6);
-  z-index:300; align-items:flex-start; justify-content:center; padding-top:20vh;
-}}
-.cmd-overlay.open {{ display:flex; }}
-.cmd-box {{
-  width:90%; max-width:520px; background:var(--bg-card); border:1px solid var(--border-subtle);
-  border-radius:14px; overflow:hidden; box-shadow:0 20px 60px rgba(0,0,0,0.5);
-}}
-.cmd-input {{
-  width:100%; padding:16px 20px; background:transparent; border:none; border-bottom:1px solid var(--border-subtle);
-  color:var(--text-primary); font-size:1rem; font-family:inherit; outline:none;
-}}
-.cmd-results {{ max-height:300px; overflow-y:auto; padding:8px; }}
-.cmd-result {{
-  padding:10px 14px; border-radius:8px; cursor:pointer; display:flex; align-items:center; gap:10px;
-  color:var(--text-secondary); font-size:0.88rem;
-}}
-.cmd-result:hover, .cmd-result.active {{ background:var(--accent-glow); color:var(--text-primary); }}
-.cmd-result .cmd-key {{ color:var(--text-muted); font-size:0.75rem; margin-left:auto; font-family:var(--mono); }}
-.cmd-hint {{ padding:10px 14px; font-size:0.75rem; color:var(--text-muted); border-top:1px solid var(--border-subtle); text-align:center; }}
-/* ── Auth Screen ── */
-.auth-screen {{
-  display:flex; align-items:center; justify-content:center; min-height:100vh;
-  background:var(--bg-primary); flex-direction:column; gap:24px;
-}}
-.auth-box {{
-  background:var(--bg-card); border:1px solid var(--border-subtle); border-radius:16px;
-  padding:40px; text-align:center; max-width:360px; width:90%;
-}}
-.auth-box h1 {{ font-size:1.4rem; margin-bottom:8px; color:var(--accent-primary); }}
-.auth-box input {{ margin:16px 0; text-align:center; font-size:1.2rem; letter-spacing:0.3em; }}
-.auth-box .auth-error {{ color:var(--danger); font-size:0.85rem; margin-top:8px; }}
+}
+html.light .sidebar { background:var(--bg-secondary); border-color:var(--border-subtle); }
+html.light .sidebar-logo { background:var(--bg-card); }
+html.light input, html.light select { background:var(--bg-input); color:var(--text-primary); border-color:var(--border-subtle); }
+html.light select option { background:var(--bg-input); color:var(--text-primary); }
+html.light .hero-value { -webkit-text-fill-color:var(--accent-primary); }
+html.light .mobile-nav { background:var(--bg-secondary); }
 /* ── Projection Chart ── */
-.projection-note {{ font-size:0.78rem; color:var(--text-muted); margin-top:8px; }}
+.projection-note { font-size:0.78rem; color:var(--text-muted); margin-top:8px; }
 /* ── Danger text ── */
-.danger {{ color:var(--danger); font-weight:500; }}
+.danger { color:var(--danger); font-weight:500; }
 /* ── Theme Toggle ── */
-.theme-toggle {{
+.theme-toggle {
   width:48px; height:48px; border-radius:12px; border:none; background:none;
   color:var(--text-muted); cursor:pointer; display:flex; align-items:center; justify-content:center;
   transition:all 0.2s ease;
-}}
-.theme-toggle:hover {{ color:var(--text-secondary); background:rgba(255,255,255,0.04); }}
-.theme-toggle svg {{ width:20px; height:20px; stroke:currentColor; fill:none; stroke-width:1.8; }}
+}
+.theme-toggle:hover { color:var(--text-secondary); background:rgba(255,255,255,0.04); }
+.theme-toggle svg { width:20px; height:20px; stroke:currentColor; fill:none; stroke-width:1.8; }
 /* ── Mobile ── */
-.mobile-nav {{
+.mobile-nav {
   display:none;
   position:fixed; bottom:0; left:0; right:0;
   background:var(--bg-secondary);
   border-top:1px solid var(--border-subtle);
   padding:8px 0 env(safe-area-inset-bottom, 8px);
   z-index:100;
-}}
-.mobile-nav-inner {{
+}
+.mobile-nav-inner {
   display:flex; justify-content:space-around; align-items:center;
-}}
-.mob-item {{
+}
+.mob-item {
   display:flex; flex-direction:column; align-items:center; gap:3px;
   color:var(--text-muted); text-decoration:none; font-size:0.6rem;
   font-weight:500; padding:4px 0; cursor:pointer;
   border:none; background:none;
-}}
-.mob-item svg {{ width:22px; height:22px; stroke:currentColor; fill:none; stroke-width:1.8; }}
-.mob-item.active {{ color:var(--accent-primary); }}
-@media (max-width:768px) {{
-  .sidebar {{ display:none; }}
-  .main-content {{ margin-left:0; padding:16px 16px 80px; }}
-  .mobile-nav {{ display:block; }}
-  .hero-row {{ flex-direction:column; }}
-  .hero-value {{ font-size:2rem; }}
-  .pulse-bar {{ gap:8px; }}
-  .pulse-item {{ min-width:130px; max-width:160px; height:110px; padding:10px 12px; }}
-  .summary-grid {{ grid-template-columns:1fr; }}
-  .chart-controls {{ flex-direction:column; }}
-  .chart-controls select {{ width:100%; }}
-}}
-@media (min-width:769px) and (max-width:1024px) {{
-  .summary-grid {{ grid-template-columns:1fr; }}
-  .main-content {{ padding:24px 24px; }}
-}}
+}
+.mob-item svg { width:22px; height:22px; stroke:currentColor; fill:none; stroke-width:1.8; }
+.mob-item.active { color:var(--accent-primary); }
+
+/* ── Sentiment Gauges ── */
+.sentiment-row {
+  display:grid; grid-template-columns:repeat(5,1fr); gap:16px;
+  margin-bottom:4px;
+}
+.sentiment-gauge {
+  display:flex; flex-direction:column; align-items:center; gap:2px;
+}
+.sentiment-gauge canvas { width:140px; height:85px; }
+.gauge-title {
+  font-size:0.7rem; font-weight:600; color:var(--text-secondary);
+  text-transform:uppercase; letter-spacing:0.04em;
+}
+.gauge-value {
+  font-family:var(--mono); font-size:1.35rem; font-weight:700;
+  color:var(--text-primary); line-height:1;
+}
+.gauge-label {
+  font-size:0.72rem; font-weight:600; padding:2px 8px; border-radius:6px;
+  line-height:1.2;
+}
+.gauge-label.extreme-fear { background:rgba(239,68,68,0.15); color:#ef4444; }
+.gauge-label.fear         { background:rgba(249,115,22,0.15); color:#f97316; }
+.gauge-label.neutral      { background:rgba(234,179,8,0.15);  color:#eab308; }
+.gauge-label.greed        { background:rgba(34,197,94,0.15);  color:#22c55e; }
+.gauge-label.extreme-greed{ background:rgba(16,185,129,0.15); color:#10b981; }
+.gauge-sub {
+  font-size:0.65rem; color:var(--text-secondary); font-family:var(--mono);
+}
+.sentiment-gauge { cursor:pointer; border-radius:10px; padding:8px 4px; transition:background 0.2s, box-shadow 0.2s; }
+.sentiment-gauge:hover { background:rgba(255,255,255,0.04); }
+.sentiment-gauge.active { background:rgba(99,102,241,0.1); box-shadow:0 0 0 2px rgba(99,102,241,0.3); }
+#sentiment-detail {
+  max-height:0; overflow:hidden; transition:max-height 0.35s ease, margin-top 0.35s ease, opacity 0.3s ease;
+  opacity:0; margin-top:0;
+}
+#sentiment-detail.open {
+  max-height:400px; opacity:1; margin-top:16px;
+}
+#sentiment-detail-header {
+  display:flex; align-items:center; justify-content:space-between; margin-bottom:8px;
+}
+#sentiment-detail-title {
+  font-size:0.9rem; font-weight:600; color:var(--text-primary);
+}
+#sentiment-detail-close {
+  background:none; border:none; color:var(--text-secondary); cursor:pointer;
+  font-size:1.1rem; padding:2px 6px; border-radius:4px;
+}
+#sentiment-detail-close:hover { color:var(--text-primary); background:rgba(255,255,255,0.06); }
+.range-btn-group { display:flex; gap:2px; background:rgba(255,255,255,0.04); border-radius:6px; padding:2px; }
+.range-btn {
+  background:none; border:none; color:var(--text-secondary); cursor:pointer;
+  font-size:0.7rem; font-weight:600; padding:3px 8px; border-radius:4px;
+  transition:background 0.15s, color 0.15s;
+}
+.range-btn:hover { color:var(--text-primary); background:rgba(255,255,255,0.06); }
+.range-btn.active { color:var(--accent-primary); background:rgba(99,102,241,0.15); }
+@media (max-width:900px) {
+  .sentiment-row { grid-template-columns:repeat(3,1fr); }
+}
+@media (max-width:500px) {
+  .sentiment-row { grid-template-columns:repeat(2,1fr); }
+  .sentiment-gauge canvas { width:110px; height:68px; }
+}
+</style>"""
+
+# Below-the-fold styles (modals, command palette, auth screen, loading
+# skeletons) live in a separate stylesheet served at /static/dashboard.css so
+# the inline <style> above only carries what the first paint needs.  The
+# version hash goes in the query string so browsers can cache it forever and
+# still pick up edits immediately.
+DASHBOARD_CSS_DEFERRED = """/* ── Loading Skeleton ── */
+/* The shimmer slides a gradient pseudo-element with transform so it runs on
+   the compositor thread; animating background-position repaints every frame. */
+.skeleton {
+  position:relative; overflow:hidden; border-radius:6px;
+  background:rgba(255,255,255,0.04);
+}
+.skeleton::after {
+  content:""; position:absolute; inset:0;
+  background:linear-gradient(90deg, transparent, rgba(255,255,255,0.08), transparent);
+  transform:translateX(-100%); will-change:transform;
+  animation:shimmer 1.5s infinite;
+}
+html.light .skeleton { background:rgba(0,0,0,0.04); }
+html.light .skeleton::after { background:linear-gradient(90deg, transparent, rgba(0,0,0,0.08), transparent); }
+@keyframes shimmer { to { transform:translateX(100%); } }
+/* ── Command Palette ── */
+.cmd-overlay {
+  display:none; position:fixed; inset:0; background:rgba(0,0,0,0.6);
+  z-index:300; align-items:flex-start; justify-content:center; padding-top:20vh;
+}
+.cmd-overlay.open { display:flex; }
+.cmd-box {
+  width:90%; max-width:520px; background:var(--bg-card); border:1px solid var(--border-subtle);
+  border-radius:14px; overflow:hidden; box-shadow:0 20px 60px rgba(0,0,0,0.5);
+}
+.cmd-input {
+  width:100%; padding:16px 20px; background:transparent; border:none; border-bottom:1px solid var(--border-subtle);
+  color:var(--text-primary); font-size:1rem; font-family:inherit; outline:none;
+}
+.cmd-results { max-height:300px; overflow-y:auto; padding:8px; }
+.cmd-result {
+  padding:10px 14px; border-radius:8px; cursor:pointer; display:flex; align-items:center; gap:10px;
+  color:var(--text-secondary); font-size:0.88rem;
+}
+.cmd-result:hover, .cmd-result.active { background:var(--accent-glow); color:var(--text-primary); }
+.cmd-result .cmd-key { color:var(--text-muted); font-size:0.75rem; margin-left:auto; font-family:var(--mono); }
+.cmd-hint { padding:10px 14px; font-size:0.75rem; color:var(--text-muted); border-top:1px solid var(--border-subtle); text-align:center; }
+/* ── Auth Screen ── */
+.auth-screen {
+  display:flex; align-items:center; justify-content:center; min-height:100vh;
+  background:var(--bg-primary); flex-direction:column; gap:24px;
+}
+.auth-box {
+  background:var(--bg-card); border:1px solid var(--border-subtle); border-radius:16px;
+  padding:40px; text-align:center; max-width:360px; width:90%;
+}
+.auth-box h1 { font-size:1.4rem; margin-bottom:8px; color:var(--accent-primary); }
+.auth-box input { margin:16px 0; text-align:center; font-size:1.2rem; letter-spacing:0.3em; }
+.auth-box .auth-error { color:var(--danger); font-size:0.85rem; margin-top:8px; }
+/* ── Pulse Chart Modal ── */
+.pcm-overlay {
+  display:none; position:fixed; inset:0; background:rgba(0,0,0,0.72);
+  z-index:1100; align-items:center; justify-content:center;
+  animation:pcmFadeIn .18s ease;
+}
+@keyframes pcmFadeIn { from { opacity:0; } to { opacity:1; } }
+.pcm-overlay.active { display:flex; }
+.pcm-box {
+  background:var(--bg-card); border:1px solid var(--border-accent);
+  border-radius:var(--radius); width:94vw; max-width:920px;
+  max-height:92vh; display:flex; flex-direction:column;
+  box-shadow:0 20px 60px rgba(0,0,0,0.5);
+  animation:pcmSlideUp .22s ease;
+}
+@keyframes pcmSlideUp { from { opacity:0;transform:translateY(20px); } to { opacity:1;transform:translateY(0); } }
+/* Promoted to compositor layers only while the open animation runs (JS drops
+   .opening on animationend) so idle modals don't hold extra layer memory. */
+.pcm-overlay.opening, .pcm-overlay.opening .pcm-box { will-change:opacity, transform; }
+.pcm-header {
+  display:flex; align-items:center; justify-content:space-between;
+  padding:18px 22px 12px; border-bottom:1px solid var(--border-subtle);
+}
+.pcm-title { font-size:1.15rem; font-weight:700; color:var(--text-primary); }
+.pcm-price { font-family:var(--mono); font-size:1rem; color:var(--accent-primary); margin-left:12px; }
+.pcm-close {
+  background:none; border:none; color:var(--text-muted); font-size:1.5rem;
+  cursor:pointer; padding:4px 8px; line-height:1; border-radius:4px;
+}
+.pcm-close:hover { color:var(--text-primary); background:var(--bg-hover); }
+.pcm-controls {
+  display:flex; align-items:center; gap:6px; padding:10px 22px;
+  flex-wrap:wrap;
+}
+.pcm-pill {
+  padding:5px 13px; border-radius:20px; border:1px solid var(--border-subtle);
+  background:transparent; color:var(--text-muted); cursor:pointer;
+  font-size:0.78rem; font-weight:600; letter-spacing:0.03em;
+  transition:all .15s ease;
+}
+.pcm-pill:hover { border-color:var(--accent-primary); color:var(--text-primary); }
+.pcm-pill.active { background:var(--accent-primary); color:#fff; border-color:var(--accent-primary); }
+.pcm-type-toggle {
+  margin-left:auto; padding:4px 10px; border-radius:14px;
+  border:1px solid var(--border-subtle); background:transparent;
+  color:var(--text-muted); cursor:pointer; font-size:0.72rem; font-weight:600;
+}
+.pcm-type-toggle:hover { border-color:var(--accent-primary); color:var(--text-primary); }
+.pcm-body {
+  flex:1; padding:8px 22px 18px; position:relative; min-height:380px;
+}
+.pcm-body canvas { width:100%!important; height:100%!important; }
+.pcm-spinner {
+  display:none; position:absolute; inset:0; background:rgba(var(--bg-card-rgb,30,30,30),0.7);
+  align-items:center; justify-content:center; z-index:2; border-radius:0 0 var(--radius) var(--radius);
+}
+.pcm-spinner.show { display:flex; }
+.pcm-spinner::after {
+  content:""; width:32px; height:32px; border:3px solid var(--border-subtle);
+  border-top-color:var(--accent-primary); border-radius:50%;
+  animation:pcmSpin .7s linear infinite;
+}
+@keyframes pcmSpin { to { transform:rotate(360deg); } }
+@media (max-width:600px) {
+  .pcm-box { width:100vw; max-width:100vw; max-height:100vh; border-radius:0; }
+  .pcm-body { min-height:260px; }
+}
+"""
+_DASHBOARD_CSS = _minify_css(_DASHBOARD_CSS)
+DASHBOARD_CSS_DEFERRED = _minify_css(DASHBOARD_CSS_DEFERRED)
+DASHBOARD_CSS_VERSION = hashlib.sha1(DASHBOARD_CSS_DEFERRED.encode("utf-8")).hexdigest()[:10]
+
+# Pre-compressed copies of the deferred stylesheet, built once at import so
+# serving it never spends per-request CPU on compression. mtime=0 keeps the
+# gzip bytes identical across processes, so CDNs and proxies cache one copy.
+# brotli is optional (like orjson above); routes fall back to gzip, then to
+# the plain text.
+DASHBOARD_CSS_DEFERRED_GZ = gzip.compress(DASHBOARD_CSS_DEFERRED.encode("utf-8"), mtime=0)
+try:
+    import brotli
+
+    DASHBOARD_CSS_DEFERRED_BR = brotli.compress(DASHBOARD_CSS_DEFERRED.encode("utf-8"), quality=11)
+except ImportError:
+    DASHBOARD_CSS_DEFERRED_BR = None
+
+# Viewport-specific rules, served as separate sheets gated by the media
+# attribute on their <link> tags — desktops fetch them at low priority and
+# never evaluate them during style recalc. The rules are deliberately not
+# re-wrapped in @media here; the gate lives on the <link>.
+DASHBOARD_MEDIA_CSS = {
+    "dashboard.mobile.css": _minify_css("""\
+.sidebar { display:none; }
+.main-content { margin-left:0; padding:16px 16px 80px; }
+.mobile-nav { display:block; }
+.hero-row { flex-direction:column; }
+.hero-value { font-size:2rem; }
+.pulse-bar { gap:8px; }
+.pulse-item { min-width:130px; max-width:160px; height:110px; padding:10px 12px; }
+.summary-grid { grid-template-columns:1fr; }
+.chart-controls { flex-direction:column; }
+.chart-controls select { width:100%; }
+"""),
+    "dashboard.tablet.css": _minify_css("""\
+.summary-grid { grid-template-columns:1fr; }
+.main-content { padding:24px 24px; }
+"""),
+}
+DASHBOARD_MEDIA_CSS_VERSION = hashlib.sha1(
+    "".join(sorted(DASHBOARD_MEDIA_CSS.values())).encode("utf-8")).hexdigest()[:10]
+
+# Every nav/toolbar icon's path data is defined once in this hidden sprite;
+# the sidebar, mobile nav and theme/refresh buttons reference it with <use>,
+# so duplicated icons cost one small element instead of re-parsed paths.
+_ICON_SPRITE = """<svg xmlns="http://www.w3.org/2000/svg" style="display:none">
+<symbol id="i-summary" viewBox="0 0 24 24"><rect x="3" y="3" width="7" height="7" rx="1"/><rect x="14" y="3" width="7" height="7" rx="1"/><rect x="3" y="14" width="7" height="7" rx="1"/><rect x="14" y="14" width="7" height="7" rx="1"/></symbol>
+<symbol id="i-balances" viewBox="0 0 24 24"><rect x="2" y="5" width="20" height="14" rx="2"/><line x1="2" y1="10" x2="22" y2="10"/></symbol>
+<symbol id="i-holdings" viewBox="0 0 24 24"><rect x="2" y="7" width="20" height="14" rx="2"/><path d="M16 7V5a4 4 0 00-8 0v2"/></symbol>
+<symbol id="i-budget" viewBox="0 0 24 24"><line x1="12" y1="1" x2="12" y2="23"/><path d="M17 5H9.5a3.5 3.5 0 000 7h5a3.5 3.5 0 010 7H6"/></symbol>
+<symbol id="i-import" viewBox="0 0 24 24"><path d="M21 15v4a2 2 0 01-2 2H5a2 2 0 01-2-2v-4"/><polyline points="17 8 12 3 7 8"/><line x1="12" y1="3" x2="12" y2="15"/></symbol>
+<symbol id="i-history" viewBox="0 0 24 24"><polyline points="22 12 18 12 15 21 9 3 6 12 2 12"/></symbol>
+<symbol id="i-economics" viewBox="0 0 24 24"><path d="M3 3v18h18"/><path d="M18 17V9"/><path d="M13 17V5"/><path d="M8 17v-3"/></symbol>
+<symbol id="i-technical" viewBox="0 0 24 24"><line x1="7" y1="2" x2="7" y2="8"/><rect x="5" y="8" width="4" height="7"/><line x1="7" y1="15" x2="7" y2="22"/><line x1="17" y1="2" x2="17" y2="6"/><rect x="15" y="6" width="4" height="10"/><line x1="17" y1="16" x2="17" y2="22"/></symbol>
+<symbol id="i-sun" viewBox="0 0 24 24"><circle cx="12" cy="12" r="5"/><line x1="12" y1="1" x2="12" y2="3"/><line x1="12" y1="21" x2="12" y2="23"/><line x1="4.22" y1="4.22" x2="5.64" y2="5.64"/><line x1="18.36" y1="18.36" x2="19.78" y2="19.78"/><line x1="1" y1="12" x2="3" y2="12"/><line x1="21" y1="12" x2="23" y2="12"/><line x1="4.22" y1="19.78" x2="5.64" y2="18.36"/><line x1="18.36" y1="5.64" x2="19.78" y2="4.22"/></symbol>
+<symbol id="i-moon" viewBox="0 0 24 24"><path d="M21 12.79A9 9 0 1111.21 3a7 7 0 009.79 9.79z"/></symbol>
+<symbol id="i-refresh" viewBox="0 0 24 24"><polyline points="23 4 23 10 17 10"/><polyline points="1 20 1 14 7 14"/><path d="M3.51 9a9 9 0 0114.85-3.36L23 10M1 14l4.64 4.36A9 9 0 0020.49 15"/></symbol>
+</svg>"""
+
+# Everything in the <head> (and the inline critical CSS) is identical for
+# every request, so the whole chunk is assembled once here rather than
+# re-evaluated as an f-string per render.
+_PAGE_HEAD_HTML = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>Nickel&amp;Dime</title>
+<link rel="icon" type="image/x-icon" href="/favicon.ico">
+<link rel="apple-touch-icon" sizes="180x180" href="/apple-touch-icon.png">
+<link rel="manifest" href="/manifest.json">
+<meta name="theme-color" content="#09090b">
+<script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
+<script src="https://cdn.jsdelivr.net/npm/luxon@3.4.4/build/global/luxon.min.js"></script>
+<script src="https://cdn.jsdelivr.net/npm/chartjs-adapter-luxon@1.3.1/dist/chartjs-adapter-luxon.umd.min.js"></script>
+<script src="https://cdn.jsdelivr.net/npm/chartjs-chart-financial@0.2.1/dist/chartjs-chart-financial.min.js"></script>
+<script src="https://cdn.jsdelivr.net/npm/hammerjs@2.0.8/hammer.min.js"></script>
+<script src="https://cdn.jsdelivr.net/npm/chartjs-plugin-zoom@2.0.1/dist/chartjs-plugin-zoom.min.js"></script>
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500;600;700&display=swap" rel="stylesheet">
+{_DASHBOARD_CSS}
+<link rel="preload" href="/static/dashboard.css?v={DASHBOARD_CSS_VERSION}" as="style" onload="this.onload=null;this.rel='stylesheet'">
+<noscript><link rel="stylesheet" href="/static/dashboard.css?v={DASHBOARD_CSS_VERSION}"></noscript>
+<link rel="stylesheet" href="/static/dashboard.mobile.css?v={DASHBOARD_MEDIA_CSS_VERSION}" media="(max-width:768px)">
+<link rel="stylesheet" href="/static/dashboard.tablet.css?v={DASHBOARD_MEDIA_CSS_VERSION}" media="(min-width:769px) and (max-width:1024px)">
+</head>
+<body>
+"""
+
+# Spinner shown in place of a tab that was stripped from the initial page;
+# the client swaps in real content via /api/tab-content on first visit.
+_TAB_PLACEHOLDER = '<div class="tab-placeholder" data-lazy-tab="{t}"><div style="display:flex;flex-direction:column;align-items:center;justify-content:center;padding:80px 20px;color:var(--text-muted);"><div style="width:32px;height:32px;border:3px solid rgba(255,255,255,0.1);border-top-color:var(--accent-primary);border-radius:50%;animation:spin 0.8s linear infinite;"></div><p style="margin-top:16px;">Loading...</p></div></div>'
+
+_PULSE_SKELETON = (
+    ("gold", "Gold", "dollar0", "gold", "GC=F"),
+    ("silver", "Silver", "dollar2", "silver", "SI=F"),
+    ("au_ag", "Au/Ag Ratio", "raw", None, None),
+    ("dxy", "DXY", "dollar2_nodollar", None, "DX=F"),
+    ("vix", "VIX", "dollar2_nodollar", None, "^VIX"),
+    ("oil", "Oil", "dollar2", None, "CL=F"),
+    ("gold_oil", "Gold/Oil", "raw2", None, None),
+    ("copper", "Copper", "dollar2", None, "HG=F"),
+    ("tnx_10y", "10Y Yield", "raw", None, None),
+    ("tnx_2y", "2Y Yield", "raw", None, None),
+    ("btc", "BTC", "dollar0", None, "BTC-USD"),
+    ("spy", "SPY", "dollar2", None, "SPY"),
+)
+
+# Sparkline canvas ids can't contain "=" (futures tickers like GC=F), so the
+# sanitized form is computed once here rather than per card per render.
+_PULSE_SPARK_KEYS = {spark: spark.replace("=", "-") for _, _, _, _, spark in _PULSE_SKELETON if spark}
+
+# Inner HTML for the Economics tab. Fully static, so the literal is
+# materialized once at import time instead of on every lazy-load request.
+_ECONOMICS_FRAGMENT_HTML = """  <div class="card">
+    <div class="card-title">US Economics &amp; Fiscal Data</div>
+    <div id="fred-load-status" class="hint" style="margin-bottom:12px;"></div>
+
+    <!-- Economic Calendar -->
+    <div id="fred-section-econcal" class="card" style="margin-top:16px;padding:16px;">
+      <div style="display:flex;flex-wrap:wrap;align-items:center;gap:8px 12px;margin-bottom:10px;">
+        <div class="card-title" style="margin:0;">Economic Calendar</div>
+        <span id="econcal-week" style="font-size:0.85rem;color:#94a3b8;"></span>
+        <div style="margin-left:auto;display:flex;gap:6px;">
+          <button type="button" id="econcal-prev" style="padding:5px 10px;font-size:0.82rem;border:1px solid rgba(255,255,255,0.2);border-radius:6px;background:rgba(255,255,255,0.06);color:#e2e8f0;cursor:pointer;">&laquo; Prev</button>
+          <button type="button" id="econcal-this" style="padding:5px 10px;font-size:0.82rem;border:1px solid rgba(99,102,241,0.5);border-radius:6px;background:rgba(99,102,241,0.15);color:#a5b4fc;cursor:pointer;font-weight:600;">This week</button>
+          <button type="button" id="econcal-next" style="padding:5px 10px;font-size:0.82rem;border:1px solid rgba(255,255,255,0.2);border-radius:6px;background:rgba(255,255,255,0.06);color:#e2e8f0;cursor:pointer;">Next &raquo;</button>
+        </div>
+      </div>
+      <div id="econcal-body" style="max-height:440px;overflow-y:auto;">
+        <p class="hint">Loading economic events&hellip;</p>
+      </div>
+      <p class="hint" style="margin-top:8px;">US economic data releases. Actuals update as numbers are reported. <span style="display:inline-block;width:8px;height:8px;background:#ef4444;border-radius:50%;"></span> High &nbsp;<span style="display:inline-block;width:8px;height:8px;background:#f59e0b;border-radius:50%;"></span> Medium &nbsp;<span style="display:inline-block;width:8px;height:8px;background:#64748b;border-radius:50%;"></span> Low impact.</p>
+    </div>
+
+    <!-- FRED Charts Controls -->
+    <div style="display:flex;flex-wrap:wrap;align-items:center;gap:12px;margin-top:20px;margin-bottom:4px;">
+      <button type="button" class="secondary" id="fred-refresh-btn">Refresh FRED Data</button>
+      <span class="label" style="margin:0;">Range:</span>
+      <select id="fred-horizon" style="padding:6px 10px;font-size:0.85rem;">
+        <option value="1y">1 year (fast)</option>
+        <option value="5y">5 years</option>
+        <option value="max">Max (~50y)</option>
+      </select>
+    </div>
+
+    <!-- National Debt & Fiscal Policy -->
+    <div id="fred-section-debt" class="card" style="margin-top:16px;padding:16px;">
+      <div class="card-title" style="margin-bottom:12px;">National Debt &amp; Fiscal Policy</div>
+      <div id="fred-debt-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
+      <div style="display:grid;grid-template-columns:repeat(auto-fit, minmax(320px, 1fr));gap:16px;">
+        <div><div class="card-title" style="font-size:0.9rem;">Federal Debt (Total Public)</div><div style="position:relative;height:200px;"><canvas id="fred-chart-debt"></canvas></div></div>
+        <div><div class="card-title" style="font-size:0.9rem;">Debt to GDP Ratio</div><div style="position:relative;height:200px;"><canvas id="fred-chart-debt-gdp"></canvas></div></div>
+        <div><div class="card-title" style="font-size:0.9rem;">Federal Surplus or Deficit (Annual)</div><div style="position:relative;height:200px;"><canvas id="fred-chart-deficit"></canvas></div></div>
+        <div><div class="card-title" style="font-size:0.9rem;">Interest Payments</div><div style="position:relative;height:200px;"><canvas id="fred-chart-interest"></canvas></div></div>
+        <div><div class="card-title" style="font-size:0.9rem;">Revenue vs Expenditures</div><div style="position:relative;height:200px;"><canvas id="fred-chart-revenue-spending"></canvas></div></div>
+      </div>
+      <div class="card-title" style="font-size:0.9rem;margin-top:20px;margin-bottom:8px;">Fiscal Ratios (% of GDP)</div>
+      <div style="display:grid;grid-template-columns:repeat(auto-fit, minmax(300px, 1fr));gap:16px;">
+        <div><div class="card-title" style="font-size:0.85rem;">Deficit as % of GDP</div><div style="position:relative;height:200px;"><canvas id="fred-chart-deficit-pct"></canvas></div></div>
+        <div><div class="card-title" style="font-size:0.85rem;">Government Spending as % of GDP</div><div style="position:relative;height:200px;"><canvas id="fred-chart-spending-pct"></canvas></div></div>
+        <div><div class="card-title" style="font-size:0.85rem;">Interest Expense as % of GDP</div><div style="position:relative;height:200px;"><canvas id="fred-chart-interest-pct"></canvas></div></div>
+      </div>
+      <p class="hint" style="margin-top:12px;">Debt and deficit ratios show fiscal sustainability. Interest % of GDP reflects debt-service burden; rising fast means concern.</p>
+    </div>
+
+    <!-- Inflation -->
+    <div id="fred-section-inflation" class="card" style="margin-top:16px;padding:16px;">
+      <div class="card-title" style="margin-bottom:12px;">Inflation (CPI, Core CPI, PCE)</div>
+      <div id="fred-inflation-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
+      <div style="position:relative;height:220px;"><canvas id="fred-chart-inflation"></canvas></div>
+      <p class="hint" style="margin-top:8px;">CPI-U = headline inflation. Core CPI excludes food &amp; energy (less volatile). PCE is the Fed&#39;s preferred measure.</p>
+    </div>
+
+    <!-- Monetary Policy -->
+    <div id="fred-section-monetary" class="card" style="margin-top:16px;padding:16px;">
+      <div class="card-title" style="margin-bottom:12px;">Monetary Policy (Fed Funds Rate, M2, Yield Curve)</div>
+      <div id="fred-monetary-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
+      <div style="display:grid;grid-template-columns:repeat(auto-fit, minmax(300px, 1fr));gap:16px;">
+        <div><div style="position:relative;height:200px;"><canvas id="fred-chart-fedfunds"></canvas></div></div>
+        <div><div style="position:relative;height:200px;"><canvas id="fred-chart-m2"></canvas></div></div>
+      </div>
+      <div class="card-title" style="font-size:0.9rem;margin-top:16px;">Treasury Yield Curve (current vs 1Y ago)</div>
+      <div style="position:relative;height:220px;margin-top:8px;"><canvas id="fred-chart-yield-curve"></canvas></div>
+      <p class="hint" style="margin-top:8px;">Inverted curve (short rates &gt; long) often precedes recessions. Fed Funds drives short-term rates; M2 shows liquidity.</p>
+    </div>
+
+    <!-- FedWatch Rate Expectations -->
+    <div id="fred-section-fedwatch" class="card" style="margin-top:16px;padding:16px;">
+      <div class="card-title" style="margin-bottom:4px;">Fed Rate Expectations (FedWatch)</div>
+      <p class="hint" style="margin-bottom:12px;">Market-implied probabilities derived from 30-Day Fed Funds Futures.</p>
+      <div id="fw-tabs" style="display:flex;gap:2px;flex-wrap:wrap;margin-bottom:16px;"></div>
+      <div id="fw-info" style="margin-bottom:12px;"></div>
+      <div id="fw-title" style="font-size:0.85rem;font-weight:600;color:var(--text-primary);margin-bottom:4px;"></div>
+      <div id="fw-subtitle" style="font-size:0.78rem;color:var(--accent-primary);margin-bottom:12px;text-align:center;"></div>
+      <div style="position:relative;height:260px;"><canvas id="fw-bar-chart"></canvas></div>
+    </div>
+
+    <!-- Credit Stress -->
+    <div id="fred-section-credit" class="card" style="margin-top:16px;padding:16px;">
+      <div style="display:flex;flex-wrap:wrap;align-items:center;justify-content:space-between;gap:8px;margin-bottom:12px;">
+        <div class="card-title" style="margin:0;">Credit Stress (High Yield Spreads)</div>
+        <select class="fred-period-select" data-section="credit" style="padding:4px 8px;font-size:0.8rem;">
+          <option value="1y">1 year</option>
+          <option value="5y">5 years</option>
+          <option value="max">Max (~15y)</option>
+        </select>
+      </div>
+      <div id="fred-credit-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
+      <div style="position:relative;height:220px;"><canvas id="fred-chart-hy-spread"></canvas></div>
+      <p class="hint" style="margin-top:8px;">Spread between high-yield corporate bonds and Treasuries. Widening = financial stress. Above 5% = recession risk.</p>
+    </div>
+
+    <!-- Real Yields & Inflation Expectations -->
+    <div id="fred-section-realyields" class="card" style="margin-top:16px;padding:16px;">
+      <div style="display:flex;flex-wrap:wrap;align-items:center;justify-content:space-between;gap:8px;margin-bottom:12px;">
+        <div class="card-title" style="margin:0;">Real Yields &amp; Inflation Expectations</div>
+        <select class="fred-period-select" data-section="realyields" style="padding:4px 8px;font-size:0.8rem;">
+          <option value="1y">1 year</option>
+          <option value="5y">5 years</option>
+          <option value="max">Max (~15y)</option>
+        </select>
+      </div>
+      <div id="fred-realyield-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
+      <div style="display:grid;grid-template-columns:repeat(auto-fit, minmax(300px, 1fr));gap:16px;">
+        <div><div class="card-title" style="font-size:0.9rem;">10Y Real Yield (TIPS)</div><div style="position:relative;height:200px;"><canvas id="fred-chart-real-yield"></canvas></div></div>
+        <div><div class="card-title" style="font-size:0.9rem;">Breakeven Inflation (5Y &amp; 10Y)</div><div style="position:relative;height:200px;"><canvas id="fred-chart-breakeven"></canvas></div></div>
+      </div>
+      <p class="hint" style="margin-top:8px;">Negative real yields are bullish for gold/crypto. Breakevens show what the bond market expects for inflation.</p>
+    </div>
+
+    <!-- Fed Balance Sheet & Liquidity -->
+    <div id="fred-section-fedbs" class="card" style="margin-top:16px;padding:16px;">
+      <div style="display:flex;flex-wrap:wrap;align-items:center;justify-content:space-between;gap:8px;margin-bottom:12px;">
+        <div class="card-title" style="margin:0;">Fed Balance Sheet</div>
+        <select class="fred-period-select" data-section="fedbs" style="padding:4px 8px;font-size:0.8rem;">
+          <option value="1y">1 year</option>
+          <option value="5y">5 years</option>
+          <option value="max">Max (~15y)</option>
+        </select>
+      </div>
+      <div id="fred-fedbs-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
+      <div style="position:relative;height:220px;"><canvas id="fred-chart-fedbs"></canvas></div>
+      <p class="hint" style="margin-top:8px;">Total Fed assets. Expanding = QE (liquidity injection, bullish). Contracting = QT (liquidity drain, headwind).</p>
+    </div>
+
+    <!-- Sahm Rule Recession Indicator -->
+    <div id="fred-section-sahm" class="card" style="margin-top:16px;padding:16px;">
+      <div class="card-title" style="margin-bottom:12px;">Sahm Rule Recession Indicator</div>
+      <div id="fred-sahm-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
+      <div style="position:relative;height:220px;"><canvas id="fred-chart-sahm"></canvas></div>
+      <p class="hint" style="margin-top:8px;">Crosses 0.50 = recession signal. Based on 3-month moving average of unemployment rate vs 12-month low.</p>
+    </div>
+
+    <!-- Labor Market -->
+    <div id="fred-section-labor" class="card" style="margin-top:16px;padding:16px;">
+      <div class="card-title" style="margin-bottom:12px;">Labor Market (Unemployment, Jobless Claims)</div>
+      <div id="fred-labor-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
+      <div style="display:grid;grid-template-columns:repeat(auto-fit, minmax(300px, 1fr));gap:16px;">
+        <div><div style="position:relative;height:200px;"><canvas id="fred-chart-unemployment"></canvas></div></div>
+        <div><div style="position:relative;height:200px;"><canvas id="fred-chart-claims"></canvas></div></div>
+      </div>
+      <p class="hint" style="margin-top:8px;">Unemployment rate (U-3) and weekly jobless claims. Rising claims can lead unemployment by weeks, an early warning of slowdown.</p>
+    </div>
+
+    <!-- Growth & Sentiment -->
+    <div id="fred-section-growth" class="card" style="margin-top:16px;padding:16px;">
+      <div style="display:flex;align-items:center;gap:12px;margin-bottom:12px;">
+        <div class="card-title" style="margin:0;">Growth &amp; Sentiment (Real GDP Growth, Consumer Sentiment)</div>
+        <select class="fred-period-select" data-section="growth" style="padding:4px 8px;font-size:0.8rem;">
+          <option value="1y">1 year</option>
+          <option value="5y">5 years</option>
+          <option value="max">Max</option>
+        </select>
+      </div>
+      <div id="fred-growth-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
+      <div style="display:grid;grid-template-columns:repeat(auto-fit, minmax(300px, 1fr));gap:16px;">
+        <div><div style="position:relative;height:200px;"><canvas id="fred-chart-gdp-growth"></canvas></div></div>
+        <div><div style="position:relative;height:200px;"><canvas id="fred-chart-sentiment"></canvas></div></div>
+      </div>
+      <p class="hint" style="margin-top:8px;">Quarterly GDP growth (real, annualized) and U. of Michigan consumer sentiment. Sentiment can lead or confirm economic turns.</p>
+    </div>
+
+    <!-- Market Valuation (CAPE) -->
+    <div id="fred-section-cape" class="card" style="margin-top:16px;padding:16px;">
+      <div class="card-title" style="margin-bottom:12px;">Market Valuation (Shiller CAPE Ratio)</div>
+      <div id="cape-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
+      <div style="position:relative;height:240px;"><canvas id="cape-chart"></canvas></div>
+      <p class="hint" style="margin-top:8px;">Cyclically-adjusted P/E (CAPE) smooths earnings over 10 years. Long-term median ~16.8. Above 25 = historically expensive. Below 15 = historically cheap.</p>
+    </div>
+
+    <!-- Buffett Indicator -->
+    <div id="fred-section-buffett" class="card" style="margin-top:16px;padding:16px;">
+      <div class="card-title" style="margin-bottom:12px;">Buffett Indicator (Total Market Cap / GDP)</div>
+      <div id="buffett-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
+      <div style="position:relative;height:240px;"><canvas id="buffett-chart"></canvas></div>
+      <p class="hint" style="margin-top:8px;">Warren Buffett&#39;s &ldquo;best single measure of valuations.&rdquo; Compares total US market cap to GDP. Long-term average ~120%. Above 140% = overvalued territory.</p>
+    </div>
+
+    <!-- World Uncertainty Index -->
+    <div id="fred-section-wui" class="card" style="margin-top:16px;padding:16px;">
+      <div class="card-title" style="margin-bottom:12px;">World Uncertainty Index (GDP-Weighted)</div>
+      <div id="fred-wui-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
+      <div style="position:relative;height:220px;"><canvas id="fred-chart-wui"></canvas></div>
+      <p class="hint" style="margin-top:8px;">Measures global uncertainty by counting &ldquo;uncertainty&rdquo; mentions in Economist Intelligence Unit country reports, GDP-weighted across 143 countries. Higher = more uncertainty. Spikes around major geopolitical and economic events.</p>
+    </div>
+
+    <!-- Housing -->
+    <div id="fred-section-housing" class="card" style="margin-top:16px;padding:16px;">
+      <div class="card-title" style="margin-bottom:12px;">Housing (Case-Shiller Home Price Index, 30Y Mortgage Rate)</div>
+      <div id="fred-housing-stats" class="pulse-bar" style="flex-wrap:wrap;gap:12px;margin-bottom:16px;"></div>
+      <div style="display:grid;grid-template-columns:repeat(auto-fit, minmax(300px, 1fr));gap:16px;">
+        <div><div style="position:relative;height:200px;"><canvas id="fred-chart-housing"></canvas></div></div>
+        <div><div style="position:relative;height:200px;"><canvas id="fred-chart-mortgage"></canvas></div></div>
+      </div>
+      <p class="hint" style="margin-top:8px;">Case-Shiller tracks home prices nationally. Mortgage rates drive affordability; spiking rates often cool housing and the broader economy.</p>
+    </div>
+  </div>"""
+
+
+def render_economics_fragment_html() -> str:
+    """Return the inner HTML for the Economics tab (lazily loaded on first visit)."""
+    return _ECONOMICS_FRAGMENT_HTML
+
+
+def render_dashboard(data: dict, saved: str = "", active_tab: str = "summary", demo_mode: bool = False) -> str:
+    """Build single-page dashboard with Summary, Balances, Budget, Holdings."""
+    return "".join(render_dashboard_iter(data, saved, active_tab, demo_mode))
+
+
+# WSGI issues one socket write per chunk a streaming response yields, so
+# re-batch the tab-boundary pieces into buffers of at least this size. Kept
+# below the head+CSS+active-tab size (~57 KB) so the first flush ships the
+# visible page before the script tail is assembled.
+_STREAM_CHUNK_MIN = 32 * 1024
+
+
+def render_dashboard_stream(data: dict, saved: str = "", active_tab: str = "summary", demo_mode: bool = False):
+    """Yield the rendered page in ~64 KB batches for a streaming response.
+
+    Coalesces render_dashboard_iter's per-tab pieces so small fragments don't
+    each cost a write() syscall; joined output is byte-identical to
+    render_dashboard."""
+    buf = []
+    size = 0
+    for piece in render_dashboard_iter(data, saved, active_tab, demo_mode):
+        buf.append(piece)
+        size += len(piece)
+        if size >= _STREAM_CHUNK_MIN:
+            yield "".join(buf)
+            buf = []
+            size = 0
+    if buf:
+        yield "".join(buf)
+
+
+def render_dashboard_iter(data: dict, saved: str = "", active_tab: str = "summary", demo_mode: bool = False):
+    """Generator form of render_dashboard: yields the page in chunks at tab
+    boundaries so a streaming response can flush progressively instead of
+    buffering one multi-hundred-KB string. Joined output is byte-identical
+    to render_dashboard."""
+    holdings = data.get("holdings", [])
+    buckets = data.get("buckets", {})
+    total = data.get("total", 0)
+    metals_prices = data.get("metals_prices", {})
+    config = data.get("config", {})
+    targets = config.get("targets", {}).get("tactical", {})
+    gold_price = metals_prices.get("GOLD") or 0
+    silver_price = metals_prices.get("SILVER") or 0
+    treasury_yields = data.get("treasury_yields", {})
+    gold_silver_ratio = data.get("gold_silver_ratio")
+    price_history = data.get("price_history", [])
+    tnx_10y = treasury_yields.get("tnx_10y")
+    tnx_2y = treasury_yields.get("tnx_2y")
+    tnx_10y_s = f"{tnx_10y:.2f}%" if tnx_10y is not None else "N/A"
+    tnx_2y_s = f"{tnx_2y:.2f}%" if tnx_2y is not None else "N/A"
+    gs_ratio_s = f"{gold_silver_ratio:.2f}" if gold_silver_ratio is not None else "N/A"
+
+    # Non-active tabs get stripped to lazy placeholders before the page goes
+    # out (marker pass at the bottom; /api/tab-content serves them on click),
+    # so only build row HTML for the tab actually being served. Empty-string
+    # defaults keep the template interpolation valid for stripped regions.
+    alloc_rows = ""
+    if active_tab == "summary":
+        # Single pass with the lookups hoisted; vectorizing the pct/drift
+        # math only pays off with hundreds of buckets and there are a handful.
+        targets_get = targets.get
+        no_target = {}
+        alloc_parts = []
+        for bucket, value in buckets.items():
+            pct = 100 * value / total if total > 0 else 0
+            tgt = targets_get(bucket, no_target).get("target", 0)
+            drift = pct - tgt
+            dc = "over" if drift > 5 else ("under" if drift < -5 else "ok")
+            alloc_parts.append(f'<tr><td>{bucket}</td><td>${value:,.0f}</td><td>{pct:.1f}%</td><td>{tgt}%</td><td class="{dc}">{drift:+.1f}%</td></tr>')
+        alloc_rows = "".join(alloc_parts)
+
+    # Balances section (blended_accounts)
+    blended = config.get("blended_accounts", [])
+    balance_rows = ""
+    if active_tab == "balances":
+        balance_rows = "".join(
+            f'<tr><td>{_esc(b.get("name", ""))}</td><td style="text-align:right"><input type="text" name="bal_{_esc(b.get("name", "").replace(" ", "_"))}" value="{b.get("value", 0):,.2f}" class="num"></td></tr>'
+            for b in blended
+        )
+
+    # Budget section
+    budget = config.get("budget", {})
+    monthly_income = budget.get("monthly_income", 0)
+    categories = budget.get("categories", [])
+    budget_rows = budget_totals_row = ""
+    if active_tab == "budget":
+        total_expenses = sum(float(c.get("limit", 0) or 0) for c in categories)
+        remaining = float(monthly_income or 0) - total_expenses
+        budget_rows = "".join(
+            f'<tr><td>{_esc(c.get("name", ""))}</td><td><input type="text" name="cat_{i}" value="{c.get("limit", 0)}" class="num"></td></tr>'
+            for i, c in enumerate(categories)
+        )
+        budget_totals_row = (
+            '<tr style="font-weight:600;border-top:1px solid #30363d">'
+            f'<td>Total expenses</td><td style="text-align:right">${total_expenses:,.2f}</td></tr>'
+            f'<tr style="font-weight:700;border-top:2px solid #30363d">'
+            f'<td>Remaining (income − expenses)</td><td style="text-align:right;color:{"#3fb950" if remaining >= 0 else "#f85149"}">${remaining:,.2f}</td></tr>'
+        )
+
+    # Debt section
+    debts = config.get("debts", [])
+    total_debt = sum(float(d.get("balance", 0) or 0) for d in debts)
+    total_debt_payments = sum(float(d.get("monthly_payment", 0) or 0) for d in debts)
+    net_worth = total - total_debt
+
+    debt_rows_html = ""
+    if active_tab == "budget":
+        debt_row_parts = []
+        for di, d in enumerate(debts):
+            d_name = d.get("name", "")
+            d_balance = float(d.get("balance", 0) or 0)
+            d_payment = float(d.get("monthly_payment", 0) or 0)
+            d_months = int(d_balance / d_payment) if d_payment > 0 else 0
+            d_months_label = f"{d_months} mo" if d_months > 0 else "N/A"
+            debt_row_parts.append(_DEBT_ROW_TMPL.format_map({
+                "di": di, "name": _esc(d_name), "balance": d_balance,
+                "payment": d_payment, "months_label": d_months_label,
+            }))
+        debt_rows_html = "".join(debt_row_parts)
+
+    # Holdings section: config holdings with live Price and Total from computed data
+    cfg_holdings = config.get("holdings", [])
+    stock_prices = data.get("stock_prices") or {}
+    crypto_prices = data.get("crypto_prices") or {}
+    # Bound method refs for the row loops below; skips an attribute lookup
+    # plus a dict truthiness check per holding.
+    sp_get = stock_prices.get
+    cp_get = crypto_prices.get
+    # Computed holdings match config order (first len(cfg_holdings) entries)
+    on_holdings_tab = active_tab == "holdings"
+    holding_rows = totals_row = ""
+    if on_holdings_tab:
+        holding_row_parts = []
+        holdings_total = 0.0
+        for i, h in enumerate(cfg_holdings):
+            ticker = h.get("ticker", "")
+            qty = h.get("qty")
+            vo = h.get("value_override")
+            qty_s = f'{qty}' if qty is not None else ''
+            vo_s = f'{vo}' if vo is not None else ''
+            val = holdings[i]["value"] if i < len(holdings) else 0
+            holdings_total += val
+            price = sp_get(ticker) or cp_get(ticker)
+            if price is None and qty and val:
+                price = val / float(qty)
+            price_s = f"${price:,.2f}" if price is not None else "N/A"
+            val_s = f"${val:,.2f}" if val else "N/A"
+            holding_row_parts.append(_HOLDING_ROW_TMPL.format_map({
+                "account": _esc(h.get("account", "")), "ticker": _esc(ticker),
+                "asset_class": _esc(h.get("asset_class", "")), "qty_s": qty_s,
+                "price_s": price_s, "val_s": val_s, "vo_s": vo_s,
+                "notes": _esc(h.get("notes", "")),
+            }))
+        # One blank row for add
+        holding_row_parts.append('<tr><td><input type="text" name="h_account" placeholder="Account"></td><td><input type="text" name="h_ticker" placeholder="Ticker"></td><td><input type="text" name="h_asset_class" placeholder="Asset class"></td><td><input type="text" name="h_qty" class="num" placeholder="Qty"></td><td></td><td></td><td><input type="text" name="h_value_override" class="num" placeholder="Value override"></td><td><input type="text" name="h_notes" placeholder="Notes"></td></tr>')
+        holding_rows = "".join(holding_row_parts)
+        totals_row = f'<tr style="font-weight:600;border-top:2px solid #30363d"><td colspan="4">Holdings total (should match CSV)</td><td></td><td style="text-align:right;color:#58a6ff">${holdings_total:,.2f}</td><td colspan="2"></td></tr>'
+
+    # Crypto holdings (Coinbase) table rows
+    crypto_holdings_list = config.get("crypto_holdings", [])
+    crypto_rows_html = crypto_totals_row = ""
+    crypto_total_value = 0.0
+    crypto_entries = []
+    if on_holdings_tab:
+        crypto_row_parts = []
+        for ch in crypto_holdings_list:
+            sym = ch.get("symbol", "")
+            qty = float(ch.get("qty", 0))
+            price = cp_get(sym, 0)
+            val = qty * price
+            if val < 0.01 and qty < 0.001:
+                continue
+            crypto_entries.append((sym, qty, price, val))
+            crypto_total_value += val
+        crypto_entries.sort(key=lambda x: -x[3])
+        for sym, qty, price, val in crypto_entries:
+            qty_fmt = f"{qty:.6f}" if qty < 1 else (f"{qty:.4f}" if qty < 100 else f"{qty:,.2f}")
+            price_s = f"${price:,.2f}" if price else "N/A"
+            val_s = f"${val:,.2f}" if val >= 0.01 else "<$0.01"
+            pct = (val / crypto_total_value * 100) if crypto_total_value > 0 else 0
+            bar_w = min(100, pct)
+            crypto_row_parts.append(
+                f'<tr class="crypto-row" data-crypto-sym="{_esc(sym)}" data-crypto-qty="{qty}">'
+                f'<td style="font-weight:600">{_esc(sym)}</td>'
+                f'<td class="mono" style="text-align:right">{qty_fmt}</td>'
+                f'<td class="mono crypto-price-cell" style="text-align:right;color:#8b949e">{price_s}</td>'
+                f'<td class="mono crypto-val-cell" style="text-align:right;color:#e6edf3">{val_s}</td>'
+                f'<td class="crypto-pct-cell" style="text-align:right;color:#8b949e;font-size:0.8rem">{pct:.1f}%</td>'
+                f'<td style="width:80px"><div style="background:rgba(88,166,255,0.15);border-radius:3px;height:6px;width:100%"><div class="crypto-bar-fill" style="background:#58a6ff;border-radius:3px;height:6px;width:{bar_w:.1f}%"></div></div></td>'
+                f'</tr>'
+            )
+        crypto_rows_html = "".join(crypto_row_parts)
+        crypto_totals_row = f'<tr style="font-weight:600;border-top:2px solid #30363d"><td>Total</td><td colspan="2"></td><td id="crypto-total-val" class="mono" style="text-align:right;color:#58a6ff">${crypto_total_value:,.2f}</td><td colspan="2"></td></tr>'
+
+    # Physical metals table rows
+    phys_metals = config.get("physical_metals", [])
+    metals_rows_html = metals_totals_row = ""
+    metals_gold_oz = 0.0
+    metals_silver_oz = 0.0
+    metals_total_cost = 0.0
+    metals_total_value = 0.0
+    metals_total_gl = 0.0
+    metals_gl_cls = "color:var(--success)"
+    if on_holdings_tab:
+        metals_row_parts = []
+        for mi, m in enumerate(phys_metals):
+            m_metal = m.get("metal", "Gold")
+            m_form = m.get("form", "")
+            m_qty = float(m.get("qty_oz", 0))
+            m_cost = float(m.get("cost_per_oz", 0))
+            m_date = m.get("date", "")
+            m_note = m.get("note", "")
+            m_metal_lc = m_metal.lower()
+            m_spot = gold_price if m_metal_lc == "gold" else silver_price
+            m_cur_val = m_qty * m_spot
+            m_cost_basis = m_qty * m_cost if m_cost > 0 else 0
+            m_gl = m_cur_val - m_cost_basis if m_cost > 0 else 0
+            m_gl_cls = "color:var(--success)" if m_gl >= 0 else "color:var(--danger)"
+            m_gl_s = f"${m_gl:+,.2f}" if m_cost > 0 else "N/A"
+            if m_metal_lc == "gold":
+                metals_gold_oz += m_qty
+            else:
+                metals_silver_oz += m_qty
+            metals_total_cost += m_cost_basis
+            metals_total_value += m_cur_val
+            cost_td = f'<td class="mono" style="text-align:right">${m_cost:,.2f}</td>' if m_cost > 0 else '<td class="hint" style="text-align:right">N/A</td>'
+            metals_row_parts.append(_METAL_ROW_TMPL.format_map({
+                "metal": _esc(m_metal), "form": _esc(m_form), "qty": m_qty,
+                "cost_td": cost_td, "metal_lc": _esc(m_metal_lc), "cost": m_cost,
+                "spot": m_spot, "cur_val": m_cur_val, "gl_cls": m_gl_cls,
+                "gl_s": m_gl_s, "date": _esc(m_date), "mi": mi,
+            }))
+        metals_rows_html = "".join(metals_row_parts)
+        metals_total_gl = metals_total_value - metals_total_cost
+        metals_gl_cls = "color:var(--success)" if metals_total_gl >= 0 else "color:var(--danger)"
+        metals_totals_row = (
+            f'<tr style="font-weight:600;border-top:2px solid #30363d">'
+            f'<td colspan="2">Totals</td>'
+            f'<td class="mono" style="text-align:right">Au {metals_gold_oz:.4g} / Ag {metals_silver_oz:.4g}</td>'
+            f'<td class="mono" style="text-align:right">${metals_total_cost:,.2f}</td>'
+            f'<td></td>'
+            f'<td class="mono" style="text-align:right;color:#58a6ff">${metals_total_value:,.2f}</td>'
+            f'<td class="mono" style="text-align:right;{metals_gl_cls}">${metals_total_gl:+,.2f}</td>'
+            f'<td colspan="2"></td>'
+            f'</tr>'
+        )
+
+    # Price history rows (newest first)
+    history_rows = ""
+    if active_tab == "history":
+        history_row_parts = []
+        for e in reversed(price_history[-100:]):  # show last 100
+            d = e.get("date", "")
+            t = e.get("total")
+            g = e.get("gold")
+            s = e.get("silver")
+            r = e.get("gold_silver_ratio")
+            y10 = e.get("tnx_10y")
+            y2 = e.get("tnx_2y")
+            t_s = f"${t:,.0f}" if t is not None else "N/A"
+            g_s = f"${g:,.0f}" if g is not None else "N/A"
+            s_s = f"${s:,.1f}" if s is not None else "N/A"
+            r_s = f"{r:.2f}" if r is not None else "N/A"
+            y10_s = f"{y10:.2f}%" if y10 is not None else "N/A"
+            y2_s = f"{y2:.2f}%" if y2 is not None else "N/A"
+            history_row_parts.append(_HISTORY_ROW_TMPL.format_map({
+                "d": d, "t_s": t_s, "g_s": g_s, "s_s": s_s,
+                "r_s": r_s, "y10_s": y10_s, "y2_s": y2_s,
+            }))
+        history_rows = "".join(history_row_parts)
+        if not history_rows:
+            history_rows = '<tr><td colspan="7" style="color:#8b949e">No history yet. Click Refresh prices to log a snapshot.</td></tr>'
+
+    # JSON for chart (escape for script tag). Serializing the full history is
+    # the priciest dumps call in this function, so it is built incrementally
+    # in _history_chart_json; the fingerprint key still serves the dates cache.
+    history_key = (
+        len(price_history),
+        tuple(sorted(price_history[-1].items())) if price_history else None,
+    )
+    history_json = _history_chart_json(price_history)
+
+    # Monthly investment tracker - calculate targets from percentages.
+    # One clock read serves every date default in this render.
+    now = datetime.now()
+    current_ym, txn_date_val = _day_strings(now)
+    monthly_inv = config.get("monthly_investments", {})
+    current_month = monthly_inv.get("month", current_ym)
+    budget_month = budget.get("month", current_ym)
+    # Human-readable labels, built once here rather than inline in the
+    # template — each strftime re-reads its format string and locale tables.
+    now_label = now.strftime("%B %d, %Y at %I:%M %p")
+    current_month_label = datetime.strptime(current_month, "%Y-%m").strftime("%B %Y")
+    budget_month_label = datetime.strptime(budget_month, "%Y-%m").strftime("%B %Y")
+    allocation_pcts = monthly_inv.get("allocation_percentages", {})
+    contributions = monthly_inv.get("contributions", {})
+    
+    # Get savings budget to calculate investment targets
+    savings_budget = next((c.get("limit", 0) for c in budget.get("categories", []) 
+                          if "Savings" in c.get("name", "") or "Investment" in c.get("name", "")), 0)
+    
+    # Monthly investment targets from percentages: one pass over the fixed
+    # categories resolves the lookups, accumulates the totals (needed on every
+    # tab for the projection payload) and renders row HTML on the summary tab.
+    alloc_get = allocation_pcts.get
+    contrib_get = contributions.get
+    build_inv_rows = active_tab == "summary"
+    investment_row_parts = []
+    total_target = 0
+    total_contributed = 0
+    for key, _name, tmpl in _INV_ROW_TMPLS:
+        alloc_pct = alloc_get(key, 0)
+        target = int(savings_budget * alloc_pct / 100)
+        contributed = contrib_get(key, 0)
+        total_target += target
+        total_contributed += contributed
+        if not build_inv_rows:
+            continue
+        remaining = target - contributed
+        fill_pct = int(contributed / target * 100) if target > 0 else 0
 
-/* ── Pulse Chart Modal ── */
-.pcm-overlay {{
-  display:none; position:fixed; inset:0; background:rgba(0,0,0,0.72);
-  z-index:1100; align-items:center; justify-content:center;
-  animation:pcmFadeIn .18s ease;
-}}
-@keyframes pcmFadeIn {{ from {{ opacity:0; }} to {{ opacity:1; }} }}
-.pcm-overlay.active {{ display:flex; }}
-.pcm-box {{
-  background:var(--bg-card); border:1px solid var(--border-accent);
-  border-radius:var(--radius); width:94vw; max-width:920px;
-  max-height:92vh; display:flex; flex-direction:column;
-  box-shadow:0 20px 60px rgba(0,0,0,0.5);
-  animation:pcmSlideUp .22s ease;
-}}
-@keyframes pcmSlideUp {{ from {{ opacity:0;transform:translateY(20px); }} to {{ opacity:1;transform:translateY(0); }} }}
-.pcm-header {{
-  display:flex; align-items:center; justify-content:space-between;
-  padding:18px 22px 12px; border-bottom:1px solid var(--border-subtle);
-}}
-.pcm-title {{ font-size:1.15rem; font-weight:700; color:var(--text-primary); }}
-.pcm-price {{ font-family:var(--mono); font-size:1rem; color:var(--accent-primary); margin-left:12px; }}
-.pcm-close {{
-  background:none; border:none; color:var(--text-muted); font-size:1.5rem;
-  cursor:pointer; padding:4px 8px; line-height:1; border-radius:4px;
-}}
-.pcm-close:hover {{ color:var(--text-primary); background:var(--bg-hover); }}
-.pcm-controls {{
-  display:flex; align-items:center; gap:6px; padding:10px 22px;
-  flex-wrap:wrap;
-}}
-.pcm-pill {{
-  padding:5px 13px; border-radius:20px; border:1px solid var(--border-subtle);
-  background:transparent; color:var(--text-muted); cursor:pointer;
-  font-size:0.78rem; font-weight:600; letter-spacing:0.03em;
-  transition:all .15s ease;
-}}
-.pcm-pill:hover {{ border-color:var(--accent-primary); color:var(--text-primary); }}
-.pcm-pill.active {{ background:var(--accent-primary); color:#fff; border-color:var(--accent-primary); }}
-.pcm-type-toggle {{
-  margin-left:auto; padding:4px 10px; border-radius:14px;
-  border:1px solid var(--border-subtle); background:transparent;
-  color:var(--text-muted); cursor:pointer; font-size:0.72rem; font-weight:600;
-}}
-.pcm-type-toggle:hover {{ border-color:var(--accent-primary); color:var(--text-primary); }}
-.pcm-body {{
-  flex:1; padding:8px 22px 18px; position:relative; min-height:380px;
-}}
-.pcm-body canvas {{ width:100%!important; height:100%!important; }}
-.pcm-spinner {{
-  display:none; position:absolute; inset:0; background:rgba(var(--bg-card-rgb,30,30,30),0.7);
-  align-items:center; justify-content:center; z-index:2; border-radius:0 0 var(--radius) var(--radius);
-}}
-.pcm-spinner.show {{ display:flex; }}
-.pcm-spinner::after {{
-  content:""; width:32px; height:32px; border:3px solid var(--border-subtle);
-  border-top-color:var(--accent-primary); border-radius:50%;
-  animation:pcmSpin .7s linear infinite;
-}}
-@keyframes pcmSpin {{ to {{ transform:rotate(360deg); }} }}
-@media (max-width:600px) {{
-  .pcm-box {{ width:100vw; max-width:100vw; max-height:100vh; border-radius:0; }}
-  .pcm-body {{ min-height:260px; }}
-}}
+        if remaining > 0:
+            status_class = "shortage"
+            status_text = f"-${remaining:,}"
+        elif remaining < 0:
+            status_class = "surplus"
+            status_text = f"+${abs(remaining):,}"
+        else:
+            status_class = "complete"
+            status_text = "Complete"
 
-/* ── Sentiment Gauges ── */
-.sentiment-row {{
-  display:grid; grid-template-columns:repeat(5,1fr); gap:16px;
-  margin-bottom:4px;
-}}
-.sentiment-gauge {{
-  display:flex; flex-direction:column; align-items:center; gap:2px;
-}}
-.sentiment-gauge canvas {{ width:140px; height:85px; }}
-.gauge-title {{
-  font-size:0.7rem; font-weight:600; color:var(--text-secondary);
-  text-transform:uppercase; letter-spacing:0.04em;
-}}
-.gauge-value {{
-  font-family:var(--mono); font-size:1.35rem; font-weight:700;
-  color:var(--text-primary); line-height:1;
-}}
-.gauge-label {{
-  font-size:0.72rem; font-weight:600; padding:2px 8px; border-radius:6px;
-  line-height:1.2;
-}}
-.gauge-label.extreme-fear {{ background:rgba(239,68,68,0.15); color:#ef4444; }}
-.gauge-label.fear         {{ background:rgba(249,115,22,0.15); color:#f97316; }}
-.gauge-label.neutral      {{ background:rgba(234,179,8,0.15);  color:#eab308; }}
-.gauge-label.greed        {{ background:rgba(34,197,94,0.15);  color:#22c55e; }}
-.gauge-label.extreme-greed{{ background:rgba(16,185,129,0.15); color:#10b981; }}
-.gauge-sub {{
-  font-size:0.65rem; color:var(--text-secondary); font-family:var(--mono);
-}}
-.sentiment-gauge {{ cursor:pointer; border-radius:10px; padding:8px 4px; transition:background 0.2s, box-shadow 0.2s; }}
-.sentiment-gauge:hover {{ background:rgba(255,255,255,0.04); }}
-.sentiment-gauge.active {{ background:rgba(99,102,241,0.1); box-shadow:0 0 0 2px rgba(99,102,241,0.3); }}
-#sentiment-detail {{
-  max-height:0; overflow:hidden; transition:max-height 0.35s ease, margin-top 0.35s ease, opacity 0.3s ease;
-  opacity:0; margin-top:0;
-}}
-#sentiment-detail.open {{
-  max-height:400px; opacity:1; margin-top:16px;
-}}
-#sentiment-detail-header {{
-  display:flex; align-items:center; justify-content:space-between; margin-bottom:8px;
-}}
-#sentiment-detail-title {{
-  font-size:0.9rem; font-weight:600; color:var(--text-primary);
-}}
-#sentiment-detail-close {{
-  background:none; border:none; color:var(--text-secondary); cursor:pointer;
-  font-size:1.1rem; padding:2px 6px; border-radius:4px;
-}}
-#sentiment-detail-close:hover {{ color:var(--text-primary); background:rgba(255,255,255,0.06); }}
-.range-btn-group {{ display:flex; gap:2px; background:rgba(255,255,255,0.04); border-radius:6px; padding:2px; }}
-.range-btn {{
-  background:none; border:none; color:var(--text-secondary); cursor:pointer;
-  font-size:0.7rem; font-weight:600; padding:3px 8px; border-radius:4px;
-  transition:background 0.15s, color 0.15s;
-}}
-.range-btn:hover {{ color:var(--text-primary); background:rgba(255,255,255,0.06); }}
-.range-btn.active {{ color:var(--accent-primary); background:rgba(99,102,241,0.15); }}
-@media (max-width:900px) {{
-  .sentiment-row {{ grid-template-columns:repeat(3,1fr); }}
-}}
-@media (max-width:500px) {{
-  .sentiment-row {{ grid-template-columns:repeat(2,1fr); }}
-  .sentiment-gauge canvas {{ width:110px; height:68px; }}
-}}
-</style>
-</head>
-<body>
+        investment_row_parts.append(tmpl.format_map({
+            "alloc_pct": alloc_pct, "target": target,
+            "contributed": contributed, "status_class": status_class,
+            "status_text": status_text,
+            "fill_cls": "low" if fill_pct < 40 else "mid" if fill_pct < 90 else "done",
+            "fill_pct": min(fill_pct, 100),
+        }))
+    investment_rows_html = "".join(investment_row_parts)
+
+    total_remaining = total_target - total_contributed
+    progress_pct = int(total_contributed / total_target * 100) if total_target > 0 else 0
+
+    # Data for donut chart (allocation)
+    buckets_key = tuple(buckets.items())
+    buckets_json = _cached(
+        _buckets_json_cache, buckets_key,
+        lambda: _safe_json(buckets),
+    )
+    targets_key = tuple((b, targets.get(b, {}).get("target", 0)) for b in buckets)
+    targets_json = _cached(
+        _targets_json_cache, targets_key,
+        lambda: _safe_json(dict(targets_key)),
+    )
+
+    # Daily change calculation - compare to 24 hours ago (yesterday's date), not last entry
+    yesterday_str = (now - timedelta(days=1)).strftime("%Y-%m-%d")
+    prev_total = None
+    # Find the most recent snapshot from yesterday (or earlier if none from
+    # yesterday). History is date-sorted, so binary-search a cached date list
+    # instead of walking the whole thing backwards.
+    history_dates = _cached(
+        _history_dates_cache, history_key,
+        lambda: [e.get("date", "")[:10] for e in price_history],
+    )
+    idx = bisect_right(history_dates, yesterday_str) - 1
+    if idx >= 0:
+        prev_total = price_history[idx].get("total")
+    if prev_total is None and len(price_history) >= 2:
+        prev_total = price_history[0]["total"]  # fallback to oldest entry
+    if prev_total is None:
+        prev_total = total
+    daily_change = total - prev_total if prev_total else 0
+    daily_change_pct = (daily_change / prev_total * 100) if prev_total else 0
+
+    # Crypto prices for market pulse
+    btc_price = cp_get("BTC", 0)
+    eth_price = cp_get("ETH", 0)
+    spy_price = sp_get("SPY", 0)
+    dxy_price = sp_get("DX=F", 0)
+    vix_price = sp_get("^VIX", 0)
+    oil_price = sp_get("CL=F", 0)
+    copper_price = sp_get("HG=F", 0)
+    gold_oil_ratio = gold_price / oil_price if gold_price and oil_price else None
+    gold_oil_s = f"{gold_oil_ratio:.1f}" if gold_oil_ratio is not None else "N/A"
+
+    # ── Market Pulse Cards (built-in + custom) ──
+    # Static card shape lives in _PULSE_SKELETON; bind only the live values here
+    pulse_values = {
+        "gold": gold_price, "silver": silver_price, "au_ag": gs_ratio_s,
+        "dxy": dxy_price, "vix": vix_price, "oil": oil_price,
+        "gold_oil": round(gold_oil_ratio, 2) if gold_oil_ratio else 0,
+        "copper": copper_price, "tnx_10y": tnx_10y_s, "tnx_2y": tnx_2y_s,
+        "btc": btc_price, "spy": spy_price,
+    }
+    default_pulse_cards = []
+    for pid, label, fmt, color, spark in _PULSE_SKELETON:
+        card = {"id": pid, "label": label, "value": pulse_values[pid], "fmt": fmt}
+        if color:
+            card["color"] = color
+        if spark:
+            card["spark"] = spark
+            card["spark_key"] = _PULSE_SPARK_KEYS[spark]
+        default_pulse_cards.append(card)
+    # Custom pulse cards from config
+    custom_pulse = config.get("custom_pulse_cards", [])
+    for cp in custom_pulse:
+        ticker = cp.get("ticker", "").upper()
+        label = cp.get("label", ticker)
+        ptype = cp.get("type", "stock")
+        src = crypto_prices if ptype == "crypto" else stock_prices
+        price = src.get(ticker) or 0
+        default_pulse_cards.append({
+            "id": f"custom-{ticker}",
+            "label": label,
+            "value": price,
+            "fmt": "dollar2",
+            "spark": ticker,
+            "spark_key": ticker.replace("=", "-"),
+            "custom": True,
+            "ticker": ticker,
+            "ptype": ptype,
+        })
+
+    # Filter out hidden cards
+    hidden_cards = config.get("hidden_pulse_cards", [])
+    visible_cards = [c for c in default_pulse_cards if c["id"] not in hidden_cards]
+    hidden_count = len(default_pulse_cards) - len(visible_cards)
+
+    # Pulse card order from config
+    pulse_order = config.get("pulse_card_order", [])
+    if pulse_order:
+        # Single pass keyed by card id instead of a nested scan per saved id
+        by_id = {c["id"]: c for c in visible_cards}
+        ordered = [by_id.pop(pid) for pid in pulse_order if pid in by_id]
+        # Add any cards not in the saved order (new defaults)
+        ordered.extend(by_id.values())
+        pulse_cards = ordered
+    else:
+        pulse_cards = visible_cards
+
+    # Build pulse HTML
+    pulse_parts = []
+    for pc in pulse_cards if active_tab == "summary" else []:
+        pid = pc["id"]
+        label = pc["label"]
+        fmt = pc["fmt"]
+        val = pc["value"]
+        color_class = f' {pc["color"]}' if pc.get("color") else ""
+        spark_id = pc.get("spark", "")
+
+        if not isinstance(val, (int, float)) or val == 0:
+            val_s = "N/A"
+        else:
+            fmt_f = _PULSE_FMTS.get(fmt)
+            val_s = fmt_f(val) if fmt_f else str(val)
+
+        pulse_parts.append(_pulse_item_shape(bool(spark_id), bool(pc.get("custom"))).format_map({
+            "pid": _esc(pid), "label": _esc(label), "color_class": color_class,
+            "val_s": val_s, "spark_id": _esc(pc.get("spark_key", "")),
+            "ptype": _esc(pc.get("ptype", "stock")),
+        }))
+    pulse_html = "".join(pulse_parts)
+
+    # Auto-refresh settings (pre-compute for template)
+    auto_refresh_cfg = config.get("auto_refresh", {})
+    auto_enabled = auto_refresh_cfg.get("enabled", True)
+    auto_interval = auto_refresh_cfg.get("interval_minutes", 15)
+    auto_dot_class = "on" if auto_enabled else "off"
+    auto_checked = "checked" if auto_enabled else ""
+    auto_sel_5 = "selected" if auto_interval == 5 else ""
+    auto_sel_10 = "selected" if auto_interval == 10 else ""
+    auto_sel_15 = "selected" if auto_interval == 15 else ""
+    auto_sel_30 = "selected" if auto_interval == 30 else ""
+    auto_sel_60 = "selected" if auto_interval == 60 else ""
+    auto_sel_120 = "selected" if auto_interval == 120 else ""
+    auto_sel_240 = "selected" if auto_interval == 240 else ""
+
+    # Widget order (pre-compute for template)
+    widget_order = config.get("widget_order", {})
+    widget_order_json = _safe_json(widget_order) if widget_order else "{}"
+
+    # Recurring transactions
+    recurring = config.get("recurring_transactions", [])
+    if active_tab == "budget" and recurring:
+        recurring_rows_html = _cached(
+            _recurring_rows_cache,
+            tuple(tuple(sorted(rt.items())) for rt in recurring),
+            lambda: _recurring_rows(recurring),
+        )
+    else:
+        recurring_rows_html = ""
+
+    # Dividend/fee tracking
+    dividends = config.get("dividends", [])
+    if dividends:
+        dividends_json = _cached(
+            _dividends_json_cache,
+            (len(dividends), tuple(sorted(dividends[-1].items()))),
+            lambda: _safe_json(dividends if len(dividends) <= 100 else dividends[-100:]),
+        )
+    else:
+        dividends_json = "[]"
+    if on_holdings_tab and dividends:
+        div_rows_html = _cached(
+            _div_rows_cache,
+            (len(dividends), tuple(sorted(dividends[-1].items()))),
+            lambda: _dividend_rows(dividends),
+        )
+    else:
+        div_rows_html = ""
+
+    # Phase 3: Price alerts
+    price_alerts = config.get("price_alerts", [])
+    if price_alerts:
+        alerts_json = _cached(
+            _alerts_json_cache,
+            tuple(tuple(sorted(a.items())) for a in price_alerts),
+            lambda: _safe_json(price_alerts),
+        )
+    else:
+        alerts_json = "[]"
+
+    monthly_contribution = total_target  # from investment tracker
+
+    # Phase 3: Tax-loss harvesting - find unrealized losses
+    # Vectorized over the holdings arrays: the per-row arithmetic runs in C
+    # and only loss rows ever touch Python-level formatting.
+    tlh_parts = []
+    if active_tab == "history" and cfg_holdings:
+        n = len(cfg_holdings)
+        tlh_tickers = [h.get("ticker", "") for h in cfg_holdings]
+        tlh_qty = np.fromiter((h.get("qty") or 0 for h in cfg_holdings), dtype=np.float64, count=n)
+        tlh_vo = np.fromiter((h.get("value_override") or 0 for h in cfg_holdings), dtype=np.float64, count=n)
+        tlh_price = np.fromiter((sp_get(t) or cp_get(t) or 0.0 for t in tlh_tickers), dtype=np.float64, count=n)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tlh_cb = np.where(tlh_qty != 0, tlh_vo / tlh_qty, 0.0)
+        tlh_unreal = (tlh_price - tlh_cb) * tlh_qty
+        tlh_mask = (tlh_price != 0) & (tlh_qty != 0) & (tlh_vo != 0) & (tlh_unreal < -50)  # Only show losses > $50
+        for i in np.flatnonzero(tlh_mask):
+            tlh_parts.append(_TLH_ROW_TMPL.format_map({
+                "ticker": tlh_tickers[i], "qty": tlh_qty[i], "cost_basis": tlh_cb[i],
+                "live": tlh_price[i], "unrealized": tlh_unreal[i],
+            }))
+    tlh_rows_html = "".join(tlh_parts)
+
+    # Pre-build conditional HTML blocks (can't nest f-strings)
+    # Rebalancing card removed (redundant with Allocation vs Target table)
+
+    tlh_card_html = f"""<div class="card">
+    <div class="card-title">Tax-Loss Harvesting Opportunities</div>
+    <p class="hint" style="margin-bottom:10px;">Holdings with unrealized losses &gt; $50 (based on import value vs live price)</p>
+    <table>
+      <thead><tr><th>Ticker</th><th>Qty</th><th>Cost Basis</th><th>Current</th><th>Unrealized P&amp;L</th></tr></thead>
+      <tbody>{tlh_rows_html}</tbody>
+    </table>
+  </div>""" if tlh_rows_html else ""
+
+    if categories:
+        cat_names = tuple(c.get("name", "") for c in categories)
+        txn_cat_options = _cached(
+            _cat_options_cache, cat_names,
+            lambda: "".join(f'<option value="{_esc(n)}">{_esc(n)}</option>' for n in cat_names),
+        )
+    else:
+        txn_cat_options = ""
+
+    # Pre-computed JS data
+    holdings_tickers_json = _safe_json([h.get("ticker","") for h in cfg_holdings]) if cfg_holdings else "[]"
+    # Quick-access tickers for Technical Analysis (user's holdings + market staples)
+    _skip_ta = {"SPAXX", "FZROX", "FXNAX"}  # money-market / non-tradable
+    ta_tickers = list(dict.fromkeys([h.get("ticker","").upper() for h in cfg_holdings if h.get("ticker","") and h.get("ticker","").upper() not in _skip_ta]))
+    for _mkt in ["SPY", "QQQ", "DIA", "GLD", "SLV", "BTCUSD", "ETHUSD", "DXY", "TLT", "VIX"]:
+        if _mkt not in ta_tickers:
+            ta_tickers.append(_mkt)
+    ta_tickers_json = _safe_json(ta_tickers)
+    num_holdings = len(cfg_holdings)
+
+    # ── AI Insights: generate natural language summary ──
+    # ── Goal Tracking data ──
+    goals = config.get("financial_goals", [])
+    if goals:
+        goals_key = tuple(tuple(sorted(g.items())) for g in goals)
+        goals_json = _cached(_goals_json_cache, goals_key, lambda: _safe_json(goals))
+        if active_tab == "summary":
+            goals_html = _cached(_goal_cards_cache, goals_key, lambda: _goal_cards(goals))
+        else:
+            goals_html = ""
+    else:
+        goals_json = "[]"
+        goals_html = ""
+
+    # ── Performance Attribution data ──
+    if len(price_history) >= 2:
+        first_total = price_history[0].get("total", 0)
+        if first_total > 0:
+            overall_return = ((total - first_total) / first_total) * 100
+        else:
+            overall_return = 0
+    else:
+        overall_return = 0
+    perf_json = _safe_json({"buckets": {b: round(v, 2) for b, v in buckets.items()}, "total": round(total, 2), "overall_return": round(overall_return, 2)})
+
+    saved_msg = f'<div class="toast" id="toast-msg">{saved}. Changes logged to Excel History.</div>' if saved else ""
+
+    change_sign = "+" if daily_change >= 0 else ""
+    change_color = "pos" if daily_change >= 0 else "neg"
+
+    demo_banner = ""
+    if demo_mode:
+        demo_banner = ('<div style="position:fixed;top:0;left:0;right:0;z-index:10000;background:linear-gradient(90deg,#d4a017,#f0c040);'
+                       'color:#09090b;text-align:center;padding:8px 16px;font-size:0.85rem;font-weight:600;letter-spacing:0.02em;">'
+                       'Live Demo: sample data shown. Write operations disabled. '
+                       '<a href="https://github.com/curtisboortz/nickel-and-dime" target="_blank" '
+                       'style="color:#09090b;text-decoration:underline;margin-left:8px;">View on GitHub</a>'
+                       '</div><style>.sidebar{top:36px !important;height:calc(100vh - 36px) !important;}'
+                       '.main-content{padding-top:36px !important;}</style>')
 
+    # The page template is split at the tab markers into (tab, text) segments
+    # so inactive tabs can be swapped out without rescanning one giant string.
+    # Inactive tab bodies are never even evaluated: the conditional on each
+    # entry short-circuits before the f-string runs, so per-request template
+    # work is limited to the shared frame plus the one active tab.
+    segments = [
+        (None, _PAGE_HEAD_HTML),
+        (None, f"""
+{_ICON_SPRITE}
 {demo_banner}
 
 <!-- Sidebar Navigation -->
@@ -1486,45 +1972,45 @@ html.light .skeleton {{ background:linear-gradient(90deg, rgba(0,0,0,0.04) 25%,
   <div class="sidebar-logo"><img src="/icon-192.png" alt="Nickel&amp;Dime"></div>
   <div class="sidebar-nav">
     <a class="nav-item active" data-tab="summary" href="#">
-      <svg viewBox="0 0 24 24"><rect x="3" y="3" width="7" height="7" rx="1"/><rect x="14" y="3" width="7" height="7" rx="1"/><rect x="3" y="14" width="7" height="7" rx="1"/><rect x="14" y="14" width="7" height="7" rx="1"/></svg>
+      <svg viewBox="0 0 24 24"><use href="#i-summary"/></svg>
       <span class="tooltip">Summary</span>
     </a>
     <a class="nav-item" data-tab="balances" href="#">
-      <svg viewBox="0 0 24 24"><rect x="2" y="5" width="20" height="14" rx="2"/><line x1="2" y1="10" x2="22" y2="10"/></svg>
+      <svg viewBox="0 0 24 24"><use href="#i-balances"/></svg>
       <span class="tooltip">Balances</span>
     </a>
     <a class="nav-item" data-tab="holdings" href="#">
-      <svg viewBox="0 0 24 24"><rect x="2" y="7" width="20" height="14" rx="2"/><path d="M16 7V5a4 4 0 00-8 0v2"/></svg>
+      <svg viewBox="0 0 24 24"><use href="#i-holdings"/></svg>
       <span class="tooltip">Holdings</span>
     </a>
     <a class="nav-item" data-tab="budget" href="#">
-      <svg viewBox="0 0 24 24"><line x1="12" y1="1" x2="12" y2="23"/><path d="M17 5H9.5a3.5 3.5 0 000 7h5a3.5 3.5 0 010 7H6"/></svg>
+      <svg viewBox="0 0 24 24"><use href="#i-budget"/></svg>
       <span class="tooltip">Budget</span>
     </a>
     <a class="nav-item" data-tab="import" href="#">
-      <svg viewBox="0 0 24 24"><path d="M21 15v4a2 2 0 01-2 2H5a2 2 0 01-2-2v-4"/><polyline points="17 8 12 3 7 8"/><line x1="12" y1="3" x2="12" y2="15"/></svg>
+      <svg viewBox="0 0 24 24"><use href="#i-import"/></svg>
       <span class="tooltip">Import</span>
     </a>
     <a class="nav-item" data-tab="history" href="#">
-      <svg viewBox="0 0 24 24"><polyline points="22 12 18 12 15 21 9 3 6 12 2 12"/></svg>
+      <svg viewBox="0 0 24 24"><use href="#i-history"/></svg>
       <span class="tooltip">Portfolio</span>
     </a>
     <a class="nav-item" data-tab="economics" href="#">
-      <svg viewBox="0 0 24 24"><path d="M3 3v18h18"/><path d="M18 17V9"/><path d="M13 17V5"/><path d="M8 17v-3"/></svg>
+      <svg viewBox="0 0 24 24"><use href="#i-economics"/></svg>
       <span class="tooltip">Economics</span>
     </a>
     <a class="nav-item" data-tab="technical" href="#">
-      <svg viewBox="0 0 24 24"><line x1="7" y1="2" x2="7" y2="8"/><rect x="5" y="8" width="4" height="7"/><line x1="7" y1="15" x2="7" y2="22"/><line x1="17" y1="2" x2="17" y2="6"/><rect x="15" y="6" width="4" height="10"/><line x1="17" y1="16" x2="17" y2="22"/></svg>
+      <svg viewBox="0 0 24 24"><use href="#i-technical"/></svg>
       <span class="tooltip">Technical</span>
     </a>
   </div>
   <div class="sidebar-bottom">
     <button type="button" class="theme-toggle" onclick="toggleTheme()" title="Toggle light/dark">
-      <svg viewBox="0 0 24 24" id="theme-icon"><circle cx="12" cy="12" r="5"/><line x1="12" y1="1" x2="12" y2="3"/><line x1="12" y1="21" x2="12" y2="23"/><line x1="4.22" y1="4.22" x2="5.64" y2="5.64"/><line x1="18.36" y1="18.36" x2="19.78" y2="19.78"/><line x1="1" y1="12" x2="3" y2="12"/><line x1="21" y1="12" x2="23" y2="12"/><line x1="4.22" y1="19.78" x2="5.64" y2="18.36"/><line x1="18.36" y1="5.64" x2="19.78" y2="4.22"/></svg>
+      <svg viewBox="0 0 24 24" id="theme-icon"><use href="#i-sun"/></svg>
     </button>
     <form method="post" action="/refresh" style="margin:0;">
       <button type="submit" class="refresh-btn" title="Refresh Prices">
-        <svg viewBox="0 0 24 24"><polyline points="23 4 23 10 17 10"/><polyline points="1 20 1 14 7 14"/><path d="M3.51 9a9 9 0 0114.85-3.36L23 10M1 14l4.64 4.36A9 9 0 0020.49 15"/></svg>
+        <svg viewBox="0 0 24 24"><use href="#i-refresh"/></svg>
       </button>
   </form>
     <div class="auto-refresh-indicator" id="auto-refresh-indicator" onclick="toggleAutoRefreshSettings()" title="Auto-refresh settings">
@@ -1559,12 +2045,12 @@ html.light .skeleton {{ background:linear-gradient(90deg, rgba(0,0,0,0.04) 25%,
 <!-- Mobile Bottom Nav -->
 <nav class="mobile-nav">
   <div class="mobile-nav-inner">
-    <button class="mob-item active" data-tab="summary"><svg viewBox="0 0 24 24"><rect x="3" y="3" width="7" height="7" rx="1"/><rect x="14" y="3" width="7" height="7" rx="1"/><rect x="3" y="14" width="7" height="7" rx="1"/><rect x="14" y="14" width="7" height="7" rx="1"/></svg>Home</button>
-    <button class="mob-item" data-tab="holdings"><svg viewBox="0 0 24 24"><rect x="2" y="7" width="20" height="14" rx="2"/><path d="M16 7V5a4 4 0 00-8 0v2"/></svg>Holdings</button>
-    <button class="mob-item" data-tab="budget"><svg viewBox="0 0 24 24"><line x1="12" y1="1" x2="12" y2="23"/><path d="M17 5H9.5a3.5 3.5 0 000 7h5a3.5 3.5 0 010 7H6"/></svg>Budget</button>
-    <button class="mob-item" data-tab="history"><svg viewBox="0 0 24 24"><polyline points="22 12 18 12 15 21 9 3 6 12 2 12"/></svg>Portfolio</button>
-    <button class="mob-item" data-tab="economics"><svg viewBox="0 0 24 24"><path d="M3 3v18h18"/><path d="M18 17V9"/><path d="M13 17V5"/><path d="M8 17v-3"/></svg>Econ</button>
-    <button class="mob-item" data-tab="technical"><svg viewBox="0 0 24 24"><line x1="7" y1="2" x2="7" y2="8"/><rect x="5" y="8" width="4" height="7"/><line x1="7" y1="15" x2="7" y2="22"/><line x1="17" y1="2" x2="17" y2="6"/><rect x="15" y="6" width="4" height="10"/><line x1="17" y1="16" x2="17" y2="22"/></svg>TA</button>
+    <button class="mob-item active" data-tab="summary"><svg viewBox="0 0 24 24"><use href="#i-summary"/></svg>Home</button>
+    <button class="mob-item" data-tab="holdings"><svg viewBox="0 0 24 24"><use href="#i-holdings"/></svg>Holdings</button>
+    <button class="mob-item" data-tab="budget"><svg viewBox="0 0 24 24"><use href="#i-budget"/></svg>Budget</button>
+    <button class="mob-item" data-tab="history"><svg viewBox="0 0 24 24"><use href="#i-history"/></svg>Portfolio</button>
+    <button class="mob-item" data-tab="economics"><svg viewBox="0 0 24 24"><use href="#i-economics"/></svg>Econ</button>
+    <button class="mob-item" data-tab="technical"><svg viewBox="0 0 24 24"><use href="#i-technical"/></svg>TA</button>
   </div>
 </nav>
 
@@ -1575,7 +2061,8 @@ html.light .skeleton {{ background:linear-gradient(90deg, rgba(0,0,0,0.04) 25%,
 
 <!-- ═══ SUMMARY TAB ═══ -->
 <div id="tab-summary" class="tab active">
-<!-- TAB:summary -->
+<!-- TAB:summary -->"""),
+        ("summary", f"""
 
   <!-- Net Worth Hero + Portfolio History -->
   <div class="hero-row">
@@ -1586,7 +2073,7 @@ html.light .skeleton {{ background:linear-gradient(90deg, rgba(0,0,0,0.04) 25%,
         {change_sign}${abs(daily_change):,.0f} ({change_sign}{daily_change_pct:.1f}%)
       </div>
       <div class="hero-meta" style="display:flex;align-items:center;gap:12px;flex-wrap:wrap;">
-      <span id="last-refresh-time">{datetime.now().strftime("%B %d, %Y at %I:%M %p")}</span>
+      <span id="last-refresh-time">{now_label}</span>
       {"" if total_debt == 0 else f'<span style="font-size:0.72rem;color:var(--text-muted);">Assets: ${total:,.0f} &middot; Debts: ${total_debt:,.0f}</span>'}
       <select id="currency-selector" class="currency-select" onchange="changeCurrency(this.value)" title="Display currency">
         <option value="USD">$ USD</option>
@@ -1694,13 +2181,7 @@ html.light .skeleton {{ background:linear-gradient(90deg, rgba(0,0,0,0.04) 25%,
         <div class="card-title"><span class="drag-handle" title="Drag to reorder">&#x2630;</span> Debt Overview</div>
         <table>
           <thead><tr><th>Account</th><th style="text-align:right">Balance</th><th style="text-align:right">Payment</th><th style="text-align:center">Payoff</th></tr></thead>
-          <tbody>''' + "".join(
-            f'<tr><td>{d.get("name","")}</td>'
-            f'<td style="text-align:right" class="mono">${float(d.get("balance",0)):,.0f}</td>'
-            f'<td style="text-align:right" class="mono">${float(d.get("monthly_payment",0)):,.0f}</td>'
-            f'<td style="text-align:center" class="mono hint">{int(float(d.get("balance",0))/float(d.get("monthly_payment",0))) if float(d.get("monthly_payment",0) or 0) > 0 else 0} mo</td></tr>'
-            for d in debts
-          ) + f'''</tbody>
+          <tbody>''' + _debt_overview_rows(debts) + f'''</tbody>
           <tfoot><tr style="font-weight:600;border-top:2px solid var(--border-subtle);">
             <td>Total Debt</td>
             <td style="text-align:right" class="mono" colspan="3">${total_debt:,.0f}</td>
@@ -1718,7 +2199,7 @@ html.light .skeleton {{ background:linear-gradient(90deg, rgba(0,0,0,0.04) 25%,
         <div class="card-header">
           <div>
             <div class="card-title"><span class="drag-handle" title="Drag to reorder">&#x2630;</span> Monthly Investments</div>
-            <div class="card-subtitle">{datetime.strptime(current_month, "%Y-%m").strftime("%B %Y")} &middot; Budget: ${savings_budget:,.0f} &rarr; ${total_target:,}</div>
+            <div class="card-subtitle">{current_month_label} &middot; Budget: ${savings_budget:,.0f} &rarr; ${total_target:,}</div>
           </div>
           <button type="button" class="secondary" style="padding:5px 10px;font-size:0.75rem;" onclick="newMonth()">New Month</button>
         </div>
@@ -1772,12 +2253,15 @@ html.light .skeleton {{ background:linear-gradient(90deg, rgba(0,0,0,0.04) 25%,
     </div>
     <div class="goals-grid" id="goals-container">{goals_html if goals_html else '<p class="hint">No goals set. Click + Add Goal to start tracking.</p>'}</div>
   </div>
-<!-- /TAB:summary -->
+""" if active_tab == "summary" else ""),
+        (None, "<!-- /TAB:summary -->"),
+        (None, f"""
 </div>
 
 <!-- ═══ BALANCES TAB ═══ -->
 <div id="tab-balances" class="tab">
-<!-- TAB:balances -->
+<!-- TAB:balances -->"""),
+        ("balances", f"""
   <div class="card">
     <div class="card-title">Account Balances</div>
     <p class="hint" style="margin-bottom:14px;">Managed accounts: Stash, Acorns, 401ks, Fundrise, Masterworks</p>
@@ -1786,17 +2270,20 @@ html.light .skeleton {{ background:linear-gradient(90deg, rgba(0,0,0,0.04) 25%,
       <button type="submit" class="success" style="margin-top:16px;">Save Balances</button>
     </form>
   </div>
-<!-- /TAB:balances -->
+""" if active_tab == "balances" else ""),
+        (None, "<!-- /TAB:balances -->"),
+        (None, f"""
 </div>
 
 <!-- ═══ BUDGET TAB ═══ -->
 <div id="tab-budget" class="tab">
-<!-- TAB:budget -->
+<!-- TAB:budget -->"""),
+        ("budget", f"""
   <div class="card">
     <div class="card-header">
       <div>
         <div class="card-title">Monthly Budget</div>
-        <div class="card-subtitle">{datetime.strptime(budget_month, "%Y-%m").strftime("%B %Y")} &middot; Savings &rarr; Investments: ${savings_budget:,.0f}</div>
+        <div class="card-subtitle">{budget_month_label} &middot; Savings &rarr; Investments: ${savings_budget:,.0f}</div>
       </div>
       <button type="button" class="secondary" style="padding:5px 10px;font-size:0.75rem;" onclick="newBudgetMonth()">New Month</button>
     </div>
@@ -1944,12 +2431,15 @@ html.light .skeleton {{ background:linear-gradient(90deg, rgba(0,0,0,0.04) 25%,
       </div>
     </div>
   </div>
-<!-- /TAB:budget -->
+""" if active_tab == "budget" else ""),
+        (None, "<!-- /TAB:budget -->"),
+        (None, f"""
 </div>
 
 <!-- ═══ HOLDINGS TAB ═══ -->
 <div id="tab-holdings" class="tab">
-<!-- TAB:holdings -->
+<!-- TAB:holdings -->"""),
+        ("holdings", f"""
   <div class="card">
     <div class="card-title">Holdings</div>
     <p class="hint" style="margin-bottom:14px;">Stocks &amp; ETFs with live prices. Use value override to lock values.</p>
@@ -2086,12 +2576,15 @@ html.light .skeleton {{ background:linear-gradient(90deg, rgba(0,0,0,0.04) 25%,
       </table>
     </div>
   </div>
-<!-- /TAB:holdings -->
+""" if active_tab == "holdings" else ""),
+        (None, "<!-- /TAB:holdings -->"),
+        (None, f"""
 </div>
 
 <!-- ═══ IMPORT TAB ═══ -->
 <div id="tab-import" class="tab">
-<!-- TAB:import -->
+<!-- TAB:import -->"""),
+        ("import", f"""
   <div class="card">
     <div class="card-title">Import Data</div>
     <p class="hint" style="margin-bottom:16px;">Upload a positions CSV from your brokerage to sync holdings.</p>
@@ -2160,12 +2653,15 @@ html.light .skeleton {{ background:linear-gradient(90deg, rgba(0,0,0,0.04) 25%,
     </div>
   </div>
 
-<!-- /TAB:import -->
+""" if active_tab == "import" else ""),
+        (None, "<!-- /TAB:import -->"),
+        (None, f"""
 </div>
 
 <!-- ═══ CHARTS TAB ═══ -->
 <div id="tab-history" class="tab">
-<!-- TAB:history -->
+<!-- TAB:history -->"""),
+        ("history", f"""
   <!-- Market Sentiment -->
   <div class="card" id="sentiment-card">
     <div class="card-title">Market Sentiment</div>
@@ -2314,17 +2810,22 @@ html.light .skeleton {{ background:linear-gradient(90deg, rgba(0,0,0,0.04) 25%,
   <!-- Tax-Loss Harvesting -->
   {tlh_card_html}
 
-<!-- /TAB:history -->
+""" if active_tab == "history" else ""),
+        (None, "<!-- /TAB:history -->"),
+        (None, f"""
 </div>
 
 <!-- ═══ ECONOMICS TAB (lazy-loaded) ═══ -->
 <div id="tab-economics" class="tab">
-<!-- TAB:economics -->
+<!-- TAB:economics -->"""),
+        ("economics", f"""
   <div data-lazy-tab="economics" style="display:flex;flex-direction:column;align-items:center;justify-content:center;padding:80px 20px;color:var(--text-muted);">
     <div style="width:32px;height:32px;border:3px solid rgba(255,255,255,0.1);border-top-color:var(--accent-primary);border-radius:50%;animation:spin 0.8s linear infinite;"></div>
     <p style="margin-top:16px;">Loading economics data&hellip;</p>
   </div>
-<!-- /TAB:economics -->
+""" if active_tab == "economics" else ""),
+        (None, "<!-- /TAB:economics -->"),
+        (None, f"""
 </div>
 
 <!-- ═══ TECHNICAL ANALYSIS TAB ═══ -->
@@ -3023,7 +3524,14 @@ function restoreAllPulseCards() {{
     var pills = document.querySelectorAll(".pcm-pill");
     pills.forEach(function(p) {{ p.classList.remove("active"); }});
     if (pills.length > 0) pills[0].classList.add("active");
-    document.getElementById("pcm-overlay").classList.add("active");
+    var pcmOv = document.getElementById("pcm-overlay");
+    pcmOv.classList.add("active", "opening");
+    if (!pcmOv._willChangeHooked) {{
+      pcmOv._willChangeHooked = true;
+      pcmOv.addEventListener("animationend", function(e) {{
+        if (e.animationName === "pcmSlideUp") pcmOv.classList.remove("opening");
+      }});
+    }}
     document.body.style.overflow = "hidden";
     loadPulseChart();
     startPcmPoll();
@@ -3031,7 +3539,7 @@ function restoreAllPulseCards() {{
   window.openPulseChart = openPulseChart;
 
   function closePulseChart() {{
-    document.getElementById("pcm-overlay").classList.remove("active");
+    document.getElementById("pcm-overlay").classList.remove("active", "opening");
     document.body.style.overflow = "";
     stopPcmPoll();
     if (pcmChart) {{ pcmChart.destroy(); pcmChart = null; }}
@@ -3437,9 +3945,7 @@ function toggleTheme() {{
   var isLight = document.documentElement.classList.contains("light");
   localStorage.setItem("wos-theme", isLight ? "light" : "dark");
   var icon = document.getElementById("theme-icon");
-  if (icon) icon.innerHTML = isLight
-    ? '<path d="M21 12.79A9 9 0 1111.21 3a7 7 0 009.79 9.79z"/>'
-    : '<circle cx="12" cy="12" r="5"/><line x1="12" y1="1" x2="12" y2="3"/><line x1="12" y1="21" x2="12" y2="23"/><line x1="4.22" y1="4.22" x2="5.64" y2="5.64"/><line x1="18.36" y1="18.36" x2="19.78" y2="19.78"/><line x1="1" y1="12" x2="3" y2="12"/><line x1="21" y1="12" x2="23" y2="12"/><line x1="4.22" y1="19.78" x2="5.64" y2="18.36"/><line x1="18.36" y1="5.64" x2="19.78" y2="4.22"/>';
+  if (icon) icon.innerHTML = isLight ? '<use href="#i-moon"/>' : '<use href="#i-sun"/>';
   // Rebuild charts for theme
   if (window.historyChart) buildHistoryChart("total");
 }}
@@ -5841,20 +6347,18 @@ document.addEventListener("click", function(e) {{
 
 </script>
 </body>
-</html>"""
+</html>"""),
+    ]
 
-    # ── Lazy-load: strip non-active tab content to reduce page size ──
-    import re as _re
-    _placeholder = '<div class="tab-placeholder" data-lazy-tab="{t}"><div style="display:flex;flex-direction:column;align-items:center;justify-content:center;padding:80px 20px;color:var(--text-muted);"><div style="width:32px;height:32px;border:3px solid rgba(255,255,255,0.1);border-top-color:var(--accent-primary);border-radius:50%;animation:spin 0.8s linear infinite;"></div><p style="margin-top:16px;">Loading...</p></div></div>'
-    for _tab in ["summary", "balances", "budget", "holdings", "import", "history", "economics"]:
-        if _tab == active_tab:
-            continue
-        _start_m = f"<!-- TAB:{_tab} -->"
-        _end_m = f"<!-- /TAB:{_tab} -->"
-        _si = html.find(_start_m)
-        _ei = html.find(_end_m)
-        if _si != -1 and _ei != -1:
-            html = html[:_si + len(_start_m)] + "\n" + _placeholder.format(t=_tab) + "\n" + html[_ei:]
-
-    return html
+    # Swap each inactive tab's segment for a lazy placeholder, then flush at
+    # tab boundaries so streaming callers get the page in sensible chunks.
+    buf = []
+    for tab, text in segments:
+        if tab is not None and tab != active_tab:
+            text = "\n" + _TAB_PLACEHOLDER.format(t=tab) + "\n"
+        buf.append(text)
+        if tab is None and text.startswith("<!-- /TAB:"):
+            yield "".join(buf)
+            buf = []
+    yield "".join(buf)
 
@@ -42,6 +42,9 @@ def save_config(path, cfg):
 def render_dashboard(data, saved="", active_tab="summary"):
     return _deps["render_dashboard"](data, saved=saved, active_tab=active_tab, demo_mode=DEMO_MODE)
 
+def render_dashboard_stream(data, saved="", active_tab="summary"):
+    return _deps["render_dashboard_stream"](data, saved=saved, active_tab=active_tab, demo_mode=DEMO_MODE)
+
 def append_history_log(action, details=""):
     return _deps["append_history_log"](action, details)
 
@@ -195,7 +198,10 @@ def index():
     path_tab = request.path.strip("/")
     tab_map = {"balances": "balances", "budget": "budget", "holdings": "holdings", "import": "import", "history": "history", "charts": "history", "economics": "economics", "technical": "technical"}
     active = tab_map.get(path_tab, request.args.get("tab", "summary"))
-    return render_dashboard(data, saved=saved, active_tab=active)
+    # Stream at tab boundaries so the head/CSS ship before the data loops run
+    from flask import Response, stream_with_context
+    return Response(stream_with_context(render_dashboard_stream(data, saved=saved, active_tab=active)),
+                    mimetype="text/html")
 
 @bp.route("/refresh", methods=["POST"])
 def refresh():
@@ -689,6 +695,39 @@ def serve_icon():
     filename = request.path.lstrip("/")
     return send_from_directory(PROJECT_ROOT, filename)
 
+@bp.route("/static/dashboard.css")
+def dashboard_css():
+    """Deferred dashboard styles (modals, palette, skeletons).
+
+    Versioned via the ?v= hash in the page head, so it can be cached forever.
+    The body is compressed once at import, not per request.
+    """
+    from flask import Response
+    from dashboard import (DASHBOARD_CSS_DEFERRED, DASHBOARD_CSS_DEFERRED_BR,
+                           DASHBOARD_CSS_DEFERRED_GZ)
+    headers = {"Cache-Control": "public, max-age=31536000, immutable",
+               "Vary": "Accept-Encoding"}
+    accept = request.headers.get("Accept-Encoding", "")
+    if DASHBOARD_CSS_DEFERRED_BR is not None and "br" in accept:
+        body = DASHBOARD_CSS_DEFERRED_BR
+        headers["Content-Encoding"] = "br"
+    elif "gzip" in accept:
+        body = DASHBOARD_CSS_DEFERRED_GZ
+        headers["Content-Encoding"] = "gzip"
+    else:
+        body = DASHBOARD_CSS_DEFERRED
+    return Response(body, mimetype="text/css", headers=headers)
+
+@bp.route("/static/dashboard.mobile.css")
+@bp.route("/static/dashboard.tablet.css")
+def dashboard_media_css():
+    """Viewport-specific dashboard styles, gated by media= on their <link>."""
+    from flask import Response
+    from dashboard import DASHBOARD_MEDIA_CSS
+    body = DASHBOARD_MEDIA_CSS[request.path.rsplit("/", 1)[-1]]
+    return Response(body, mimetype="text/css",
+                    headers={"Cache-Control": "public, max-age=31536000, immutable"})
+
 @bp.route("/sw.js")
 def service_worker():
     """Basic service worker for PWA."""
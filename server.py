@@ -68,7 +68,7 @@ def main():
         get_dashboard_data_cached,
     )
     from csv_import import import_csv, parse_statement_csv, parse_statement, import_statement, detect_recurring_transactions
-    from dashboard import render_dashboard
+    from dashboard import render_dashboard, render_dashboard_stream
     from routes import bp, init_routes
 
     def save_config(path, cfg):
@@ -168,6 +168,7 @@ def main():
         "import_statement": import_statement,
         "detect_recurring_transactions": detect_recurring_transactions,
         "render_dashboard": render_dashboard,
+        "render_dashboard_stream": render_dashboard_stream,
         "append_history_log": append_history_log,
         "save_config": save_config,
         "run_price_update": run_price_update,